@@ -1,36 +1,182 @@
-from typing import Dict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import boto3
-from core.exceptions.cloud_exception import CloudWatchConnectionError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+from apps.core.exceptions.cloud_exception import CloudWatchConnectionError
+from apps.core.utils.rate_limiter import TokenBucketRateLimiter
+
+# GetMetricData 한 번의 호출에 담을 수 있는 최대 쿼리 수
+MAX_METRIC_QUERIES = 500
+
+# 결과 키 -> (Namespace, MetricName)
+# memory는 CloudWatch Agent(CWAgent)가 설치된 인스턴스에서만 수집됨
+INSTANCE_METRICS: Dict[str, Tuple[str, str]] = {
+    "cpu_avg": ("AWS/EC2", "CPUUtilization"),
+    "memory_avg": ("CWAgent", "mem_used_percent"),
+    "network_in_avg": ("AWS/EC2", "NetworkIn"),
+    "network_out_avg": ("AWS/EC2", "NetworkOut"),
+    "disk_read_avg": ("AWS/EC2", "EBSReadBytes"),
+    "disk_write_avg": ("AWS/EC2", "EBSWriteBytes"),
+}
 
 
 class AWSAdapter:
-    def __init__(self, access_key: str, secret_key: str, region: str = "us-east-1"):
-        self.cludwatch = boto3.client(
-            "cloudwatch",
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        region: str = "us-east-1",
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    ):
+        # boto3 Session은 스레드 안전하지 않으므로 어댑터(스레드)마다 하나씩 생성해 재사용
+        self.session = boto3.session.Session(
             aws_access_key_id=access_key,
-            aws_secret_aceess_key=secret_key,
+            aws_secret_access_key=secret_key,
             region_name=region,
         )
+        self.cloudwatch = self.session.client(
+            "cloudwatch",
+            config=Config(retries={"mode": "adaptive", "max_attempts": 5}),
+        )
+        self.rate_limiter = rate_limiter
 
-    def get_instance_metrics(self, instance_id: str) -> Dict[str, float]:
+    def get_instance_metrics(self, instance_id: str) -> Dict[str, Optional[float]]:
         """
         인스턴스 CPU/Memory 사용률 조회
         """
-        try:
-            # CloudWatch GetMetricStatistics 호출
-            cpu_metric = self.cloudwatch.get_metric_statistics(
-                Namespace="AWS/EC2",
-                MetricName="CPUUtilization",
-                Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                StartTime=...,
-                EndTime=...,
-                Period=3600,
-                Statistics=["Average"],
-            )
-            return {
-                "cpu_avg": cpu_metric["Datapoints"][0]["Average"],
-                "memory_avg": 0.0,  # memory 는 CloudWatch Agent 설치 필요
+        return self.get_metrics_batch([instance_id])[instance_id]
+
+    def get_metrics_batch(
+        self,
+        instance_ids: Iterable[str],
+        days: int = 7,
+        period: int = 3600,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        여러 인스턴스의 CPU/Memory/Network/Disk 평균을 GetMetricData로 한 번에 조회
+
+        인스턴스별 GetMetricStatistics 호출 대신, 호출당 최대 500개 쿼리를 묶어 보내므로
+        API 호출 수가 (인스턴스 수 x 지표 수) / 500 으로 줄어듭니다.
+
+        Args:
+            instance_ids: EC2 인스턴스 ID 목록
+            days: 조회 기간 (일)
+            period: 데이터 포인트 집계 단위 (초)
+            end_time: 조회 종료 시각 (기본값: 현재)
+
+        Returns:
+            {"i-0abc": {"cpu_avg": 12.3, "memory_avg": None, ...}, ...}
+            데이터가 없는 지표는 None
+        """
+        end_time = end_time or datetime.now(timezone.utc)
+        start_time = end_time - timedelta(days=days)
+
+        series = self.get_metric_series_batch(instance_ids, start_time, end_time, period)
+        return {
+            instance_id: {
+                key: (sum(value for _, value in points) / len(points) if points else None)
+                for key, points in metrics.items()
             }
-        except Exception as e:
+            for instance_id, metrics in series.items()
+        }
+
+    def get_metric_series_batch(
+        self,
+        instance_ids: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        period: int = 300,
+        metric_keys: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, List[Tuple[datetime, float]]]]:
+        """
+        여러 인스턴스의 지표 원본 데이터 포인트를 GetMetricData로 조회 (증분 동기화용)
+
+        Args:
+            instance_ids: EC2 인스턴스 ID 목록
+            start_time: 조회 시작 시각 (watermark)
+            end_time: 조회 종료 시각
+            period: 데이터 포인트 집계 단위 (초)
+            metric_keys: 조회할 INSTANCE_METRICS 키 (기본값: 전체)
+
+        Returns:
+            {"i-0abc": {"cpu_avg": [(timestamp, value), ...], ...}, ...} (시간 오름차순)
+        """
+        instance_ids = list(dict.fromkeys(instance_ids))
+        metric_keys = list(metric_keys or INSTANCE_METRICS)
+
+        queries, query_map = self._build_queries(instance_ids, period, metric_keys)
+        series = self._get_metric_data(queries, start_time, end_time)
+
+        result = {instance_id: {key: [] for key in metric_keys} for instance_id in instance_ids}
+        for query_id, points in series.items():
+            instance_id, key = query_map[query_id]
+            result[instance_id][key] = points
+        return result
+
+    @staticmethod
+    def _build_queries(
+        instance_ids: List[str], period: int, metric_keys: List[str]
+    ) -> Tuple[List[dict], Dict[str, Tuple[str, str]]]:
+        """인스턴스 x 지표 조합으로 MetricDataQueries 생성"""
+        queries = []
+        query_map: Dict[str, Tuple[str, str]] = {}
+        for index, instance_id in enumerate(instance_ids):
+            for key in metric_keys:
+                namespace, metric_name = INSTANCE_METRICS[key]
+                # Id는 소문자로 시작하고 영숫자/언더스코어만 허용
+                query_id = f"m{index}_{key}"
+                query_map[query_id] = (instance_id, key)
+                queries.append(
+                    {
+                        "Id": query_id,
+                        "MetricStat": {
+                            "Metric": {
+                                "Namespace": namespace,
+                                "MetricName": metric_name,
+                                "Dimensions": [{"Name": "InstanceId", "Value": instance_id}],
+                            },
+                            "Period": period,
+                            "Stat": "Average",
+                        },
+                        "ReturnData": True,
+                    }
+                )
+        return queries, query_map
+
+    def _get_metric_data(
+        self, queries: List[dict], start_time: datetime, end_time: datetime
+    ) -> Dict[str, List[Tuple[datetime, float]]]:
+        """
+        GetMetricData 호출 (500개 단위 분할 + NextToken 페이지네이션)
+
+        Returns:
+            {query_id: [(timestamp, value), ...]} (시간 오름차순)
+        """
+        series: Dict[str, List[Tuple[datetime, float]]] = {}
+        try:
+            for offset in range(0, len(queries), MAX_METRIC_QUERIES):
+                params = {
+                    "MetricDataQueries": queries[offset : offset + MAX_METRIC_QUERIES],
+                    "StartTime": start_time,
+                    "EndTime": end_time,
+                    "ScanBy": "TimestampAscending",
+                }
+                while True:
+                    if self.rate_limiter:
+                        self.rate_limiter.acquire()
+                    response = self.cloudwatch.get_metric_data(**params)
+                    for metric in response.get("MetricDataResults", []):
+                        series.setdefault(metric["Id"], []).extend(
+                            zip(metric.get("Timestamps", []), metric.get("Values", []))
+                        )
+                    next_token = response.get("NextToken")
+                    if not next_token:
+                        break
+                    params["NextToken"] = next_token
+        except (BotoCoreError, ClientError) as e:
             raise CloudWatchConnectionError(f"CLoudWatch 접근실패: {str(e)}")
+        return series
@@ -0,0 +1,188 @@
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from django.utils.dateparse import parse_datetime
+
+import ijson
+import requests
+
+from apps.core.choices import Provider
+from apps.core.dto.cloud_service_dto import CloudServiceDTO
+from apps.core.exceptions.cloud_exception import PriceCatalogFetchError
+from apps.costs.choices import PricingModel, PricingSource
+
+logger = logging.getLogger(__name__)
+
+
+class AWSPriceAdapter:
+    """
+    AWS Price List(Bulk API) EC2 offer file 어댑터
+
+    수 GB 크기의 offer file을 ijson으로 스트리밍 파싱합니다.
+    products를 한 번 훑으며 조건에 맞는 SKU만 남기고, terms.OnDemand를 다시 훑으며
+    남은 SKU의 시간당 가격을 붙이므로 문서 전체를 메모리에 올리지 않습니다.
+    """
+
+    OFFER_URL = (
+        "https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/current/index.json"
+    )
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    REQUEST_TIMEOUT = 60
+    MAX_MEMORY_GB = Decimal("10000")
+
+    def __init__(self, source: Optional[str] = None):
+        """
+        Args:
+            source: offer file 경로 또는 URL (기본값: AWS 공식 EC2 offer file)
+        """
+        self.source = source or self.OFFER_URL
+
+    def read_version(self) -> Tuple[str, Optional[datetime]]:
+        """
+        offer file 머리말의 version / publicationDate만 읽고 즉시 중단
+
+        products보다 앞에 있는 최상위 키만 파싱하므로 URL이어도 몇 KB만 내려받습니다.
+
+        Returns:
+            (version, publication_date)
+        """
+        if self._is_url():
+            try:
+                with requests.get(self.source, stream=True, timeout=self.REQUEST_TIMEOUT) as r:
+                    r.raise_for_status()
+                    r.raw.decode_content = True
+                    return self._parse_header(r.raw)
+            except requests.RequestException as e:
+                raise PriceCatalogFetchError(f"AWS offer file 버전 조회 실패: {str(e)}")
+
+        with open(self.source, "rb") as f:
+            return self._parse_header(f)
+
+    @staticmethod
+    def _parse_header(f) -> Tuple[str, Optional[datetime]]:
+        header = {}
+        for prefix, event, value in ijson.parse(f):
+            if prefix in ("version", "publicationDate") and event == "string":
+                header[prefix] = value
+            # 최상위 products/terms가 시작되면 머리말은 끝난 것
+            elif prefix in ("products", "terms") and event == "start_map":
+                break
+            if len(header) == 2:
+                break
+
+        if "version" not in header:
+            raise PriceCatalogFetchError("AWS offer file에서 version을 찾을 수 없습니다.")
+        publication_date = header.get("publicationDate")
+        return header["version"], parse_datetime(publication_date) if publication_date else None
+
+    def iter_services(
+        self, regions: Iterable[str], operating_system: str = "Linux"
+    ) -> Iterator[CloudServiceDTO]:
+        """
+        지정한 리전/OS의 On-Demand 인스턴스 가격을 하나씩 반환
+
+        Args:
+            regions: AWS 리전 코드 목록 (예: ["ap-northeast-2", "us-east-1"])
+            operating_system: offer file의 operatingSystem 값 (Linux, Windows, RHEL ...)
+        """
+        regions = set(regions)
+        with self._open_source() as path:
+            with open(path, "rb") as f:
+                products = self._filter_products(f, regions, operating_system)
+            logger.info(f"AWS offer file 필터링 완료: {len(products)} SKU")
+
+            with open(path, "rb") as f:
+                for sku, offers in ijson.kvitems(f, "terms.OnDemand"):
+                    product = products.get(sku)
+                    if product is None:
+                        continue
+                    price = self._hourly_price(offers)
+                    if price is None:
+                        continue
+                    yield CloudServiceDTO(
+                        provider=Provider.AWS,
+                        pricing_model=PricingModel.ON_DEMAND,
+                        pricing_source=PricingSource.AWS_API,
+                        price_per_hour=price,
+                        **product,
+                    )
+
+    def _filter_products(self, f, regions: set, operating_system: str) -> Dict[str, dict]:
+        """products를 스트리밍하며 조건에 맞는 SKU의 스펙만 보관"""
+        products: Dict[str, dict] = {}
+        for sku, product in ijson.kvitems(f, "products"):
+            if product.get("productFamily") != "Compute Instance":
+                continue
+            attributes = product.get("attributes", {})
+            if (
+                attributes.get("regionCode") not in regions
+                or attributes.get("operatingSystem") != operating_system
+                or attributes.get("tenancy") != "Shared"
+                or attributes.get("preInstalledSw") != "NA"
+                or attributes.get("capacitystatus") != "Used"
+                or attributes.get("licenseModel") == "Bring your own license"
+            ):
+                continue
+            try:
+                memory_gb = self._parse_memory(attributes["memory"])
+                vcpu = int(attributes["vcpu"])
+            except (KeyError, ValueError, ArithmeticError):
+                logger.debug(f"스펙 파싱 실패 SKU 스킵: {sku}")
+                continue
+            # CloudService.memory_gb(max_digits=6) 범위를 넘는 초대형 인스턴스는 제외
+            if memory_gb >= self.MAX_MEMORY_GB:
+                continue
+            products[sku] = {
+                "instance_type": attributes["instanceType"],
+                "region": attributes["regionCode"],
+                "vcpu": vcpu,
+                "memory_gb": memory_gb,
+            }
+        return products
+
+    @staticmethod
+    def _parse_memory(memory: str) -> Decimal:
+        """'16 GiB', '1,952 GiB' 형식을 Decimal(GB)로 변환"""
+        value = memory.replace(",", "").split()[0]
+        return Decimal(value)
+
+    @staticmethod
+    def _hourly_price(offers: dict) -> Optional[Decimal]:
+        """OnDemand term에서 시간당 USD 가격 추출"""
+        for offer in offers.values():
+            for dimension in offer.get("priceDimensions", {}).values():
+                if dimension.get("unit") != "Hrs":
+                    continue
+                usd = dimension.get("pricePerUnit", {}).get("USD")
+                if usd is not None and Decimal(usd) > 0:
+                    return Decimal(usd)
+        return None
+
+    def _is_url(self) -> bool:
+        return self.source.startswith(("http://", "https://"))
+
+    @contextmanager
+    def _open_source(self) -> Iterator[str]:
+        """로컬 경로면 그대로, URL이면 임시 파일로 스트리밍 다운로드 후 경로 반환"""
+        if not self._is_url():
+            yield self.source
+            return
+
+        fd, path = tempfile.mkstemp(suffix=".json")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                with requests.get(self.source, stream=True, timeout=self.REQUEST_TIMEOUT) as r:
+                    r.raise_for_status()
+                    r.raw.decode_content = True
+                    shutil.copyfileobj(r.raw, f, self.DOWNLOAD_CHUNK_SIZE)
+            yield path
+        except requests.RequestException as e:
+            raise PriceCatalogFetchError(f"AWS offer file 다운로드 실패: {str(e)}")
+        finally:
+            os.remove(path)
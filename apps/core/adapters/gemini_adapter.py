@@ -1,26 +1,289 @@
-from typing import Any, Dict
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import google.generativeai as genai
-from core.exceptions.ai_exceptions import GeminiAPIError
+
+from apps.core.dto.recommendation_dto import AIBatchResultDTO, AIDiagnosisItemDTO
+from apps.core.exceptions.ai_exceptions import (
+    GeminiAPIError,
+    GeminiUnavailable,
+    InvalidAIResponse,
+)
+from apps.core.utils.circuit_breaker import CircuitBreaker
+from apps.core.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# 표 형식 프롬프트 컬럼: (리소스 dict 키, 표 헤더)
+# 캐시 키에 들어가는 값만 포함 (리소스 ID, 원본 리전, 비용 등 테넌트별 값은 제외)
+RESOURCE_COLUMNS = [
+    ("provider", "provider"),
+    ("instance_type", "type"),
+    ("region_normalized", "region"),
+    ("vcpu", "vcpu"),
+    ("memory_gb", "mem_gb"),
+    ("cpu_usage_avg", "cpu%"),
+    ("memory_usage_avg", "mem%"),
+]
+UTILIZATION_COLUMNS = {"cpu_usage_avg", "memory_usage_avg"}
+
+# 프롬프트 형식이 바뀌면 올려서 기존 캐시를 무효화
+PROMPT_VERSION = "v1"
+
+RECOMMENDATION_TYPES = (
+    "DOWNSIZE",
+    "SWITCH_PROVIDER",
+    "SWITCH_PRICING",
+    "RIGHTSIZING",
+    "NO_ACTION",
+)
 
 
 class GeminiAdapter:
     """Gemini API 통신 어댑터"""
 
-    def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("models/gemini-2.5-flash")
+    MODEL_NAME = "models/gemini-2.5-flash"
+
+    # 청크당 입력 토큰 예산 (프롬프트 지시문 포함)
+    MAX_INPUT_TOKENS = 6000
+    # 청크당 출력 토큰 예산 / 리소스당 예상 출력 토큰
+    MAX_OUTPUT_TOKENS = 8192
+    OUTPUT_TOKENS_PER_RESOURCE = 80
+    # 토큰 수 추정용 (한글 포함 보수적으로)
+    CHARS_PER_TOKEN = 3
+    MAX_WORKERS = 4
+    # 사용률 구간 폭 (%)
+    UTILIZATION_BUCKET = 5
+
+    # 프로세스 공용 응답 캐시 (프로필 해시 -> 응답)
+    response_cache = TTLCache(maxsize=10_000, ttl=24 * 60 * 60)
+    # 프로세스 공용 circuit breaker (동기/비동기 어댑터가 함께 사용)
+    default_circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
 
-    def generate_diagnosis(self, inventory_data: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model=None,
+        cache: Optional[TTLCache] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         """
-        사용자 인벤토리 기반 진단 생성
+        Args:
+            api_key: Gemini API 키
+            model: generate_content(prompt)를 제공하는 모델 객체 (테스트용 주입)
+            cache: 응답 캐시 (기본값: 프로세스 공용 response_cache)
+            circuit_breaker: 장애 차단기 (기본값: 프로세스 공용 default_circuit_breaker)
         """
+        self.cache = cache if cache is not None else self.response_cache
+        self.circuit_breaker = circuit_breaker or self.default_circuit_breaker
+        if model is None:
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel(
+                self.MODEL_NAME,
+                generation_config={
+                    "response_mime_type": "application/json",
+                    "max_output_tokens": self.MAX_OUTPUT_TOKENS,
+                },
+            )
+        self.model = model
+
+    def generate_diagnosis(
+        self, inventory_data: Dict[str, Any], catalog_version: str = ""
+    ) -> Dict[str, Any]:
+        """
+        사용자 인벤토리 기반 진단 생성 (같은 프롬프트는 캐시 응답 사용)
+        """
+        prompt = self._build_diagnosis_prompt(inventory_data)
+        key = self._cache_key(catalog_version, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        output = self._generate(prompt)
+        self.cache.set(key, output)
+        return output
+
+    def generate_batch_diagnosis(
+        self,
+        resources: List[Dict[str, Any]],
+        catalog_version: str = "",
+        max_workers: int = MAX_WORKERS,
+    ) -> AIBatchResultDTO:
+        """
+        리소스 목록을 토큰 예산에 맞춰 청크로 나누고 병렬로 진단
+
+        리소스는 정규화한 프로필(사용률 구간, 정규화 리전 등)을 표 형식
+        (헤더 1줄 + 프로필당 1줄)으로 인코딩합니다. 프로필 행과 가격표 버전의 해시를
+        캐시 키로 쓰므로, 캐시에 있는 프로필과 요청 안에서 중복된 프로필은 보내지 않습니다.
+        응답의 행 번호로 프로필을 찾아 같은 프로필의 모든 리소스에 병합하고,
+        실패한 청크의 리소스는 failed_resource_ids에 남깁니다.
+
+        Args:
+            resources: resource_id와 RESOURCE_COLUMNS 키를 가진 dict 목록
+            catalog_version: 가격표 버전 (바뀌면 캐시 키도 바뀜)
+            max_workers: 동시에 보낼 요청 수
+
+        Returns:
+            AIBatchResultDTO
+        """
+        result, misses = self._plan(resources, catalog_version)
+        chunks = list(self._pack(misses))
+        result.chunks = len(chunks)
+        if chunks:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._diagnose_chunk, chunk): chunk for chunk in chunks}
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        answers, summary = future.result()
+                    except (GeminiAPIError, InvalidAIResponse) as e:
+                        self._record_failure(result, chunk, e)
+                        continue
+                    self._record_answers(result, answers, summary)
+
+        self._log_batch(result, len(resources))
+        return result
+
+    def _plan(
+        self, resources: List[Dict[str, Any]], catalog_version: str
+    ) -> Tuple[AIBatchResultDTO, List[Dict[str, Any]]]:
+        """리소스를 프로필로 묶고 캐시 적중분은 결과에 바로 반영, 나머지 프로필 반환"""
+        result = AIBatchResultDTO()
+
+        # 캐시 키 -> 프로필 행 (같은 프로필의 리소스를 묶음)
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for resource in resources:
+            values = self._encode_values(resource)
+            key = self._cache_key(catalog_version, values)
+            profile = profiles.setdefault(key, {"key": key, "values": values, "resource_ids": []})
+            profile["resource_ids"].append(resource["resource_id"])
+
+        misses = []
+        for key, profile in profiles.items():
+            cached = self.cache.get(key)
+            if cached is None:
+                misses.append(profile)
+                continue
+            result.cached += len(profile["resource_ids"])
+            result.items.extend(self._expand(profile, cached))
+        return result, misses
+
+    def _record_answers(
+        self,
+        result: AIBatchResultDTO,
+        answers: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        summary: str,
+    ):
+        for profile, answer in answers:
+            self.cache.set(profile["key"], answer)
+            result.items.extend(self._expand(profile, answer))
+        if summary:
+            result.summaries.append(summary)
+
+    @staticmethod
+    def _record_failure(result: AIBatchResultDTO, chunk: List[Dict[str, Any]], error):
+        for profile in chunk:
+            result.failed_resource_ids.extend(profile["resource_ids"])
+        result.errors.append(str(error.detail))
+        logger.warning(f"Gemini 청크 진단 실패 ({len(chunk)}개 프로필): {error.detail}")
+
+    @staticmethod
+    def _log_batch(result: AIBatchResultDTO, resource_count: int):
+        logger.info(
+            f"Gemini 배치 진단 완료 resources={resource_count} cached={result.cached} "
+            f"chunks={result.chunks} failed={len(result.failed_resource_ids)}"
+        )
+
+    def _pack(self, profiles: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """입력/출력 토큰 예산을 넘지 않도록 프로필 행을 순서대로 채워 넣음"""
+        base_tokens = self._estimate_tokens(self._build_batch_prompt(self._encode_table([])))
+        max_rows = max(1, self.MAX_OUTPUT_TOKENS // self.OUTPUT_TOKENS_PER_RESOURCE)
+
+        chunk: List[Dict[str, Any]] = []
+        tokens = base_tokens
+        for profile in profiles:
+            row_tokens = self._estimate_tokens(f"{len(chunk)}|{profile['values']}") + 1
+            if chunk and (tokens + row_tokens > self.MAX_INPUT_TOKENS or len(chunk) >= max_rows):
+                yield chunk
+                chunk, tokens = [], base_tokens
+                row_tokens = self._estimate_tokens(f"0|{profile['values']}") + 1
+            chunk.append(profile)
+            tokens += row_tokens
+        if chunk:
+            yield chunk
+
+    def _diagnose_chunk(self, chunk: List[Dict[str, Any]]):
+        """청크 하나 진단 (워커 스레드에서 실행)"""
+        output = self._generate(self._build_batch_prompt(self._encode_table(chunk)))
+        return self._parse_batch_output(output, chunk), output.get("diagnosis", "")
+
+    def _generate(self, prompt: str) -> Dict[str, Any]:
+        if not self.circuit_breaker.allow_request():
+            raise GeminiUnavailable()
         try:
-            prompt = self.build_diagnosis_prompt(inventory_data)
             response = self.model.generate_content(prompt)
-            return self.parse_structured_output(response.text)
         except Exception as e:
+            self.circuit_breaker.record_failure()
             raise GeminiAPIError(f" Gemini API 호출 실패 {str(e)}")
+        self.circuit_breaker.record_success()
+        return self._parse_structured_output(response.text)
+
+    @staticmethod
+    def _expand(profile: Dict[str, Any], answer: Dict[str, Any]) -> List[AIDiagnosisItemDTO]:
+        """프로필 하나의 답을 같은 프로필의 리소스마다 복제"""
+        return [
+            AIDiagnosisItemDTO(resource_id=resource_id, **answer)
+            for resource_id in profile["resource_ids"]
+        ]
+
+    @staticmethod
+    def _cache_key(catalog_version: str, text: str) -> str:
+        payload = f"{PROMPT_VERSION}\n{catalog_version}\n{text}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def _estimate_tokens(cls, text: str) -> int:
+        return len(text) // cls.CHARS_PER_TOKEN + 1
+
+    @staticmethod
+    def _format_value(value) -> str:
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return f"{value:g}"
+        return str(value)
+
+    @classmethod
+    def _bucket(cls, value: Optional[float]) -> Optional[int]:
+        """사용률을 UTILIZATION_BUCKET 단위 구간 하한값으로"""
+        if value is None:
+            return None
+        return int(float(value) // cls.UTILIZATION_BUCKET * cls.UTILIZATION_BUCKET)
+
+    @classmethod
+    def _encode_values(cls, resource: Dict[str, Any]) -> str:
+        """리소스를 정규화한 프로필 행 (행 번호 제외)"""
+        values = []
+        for key, _ in RESOURCE_COLUMNS:
+            value = resource.get(key)
+            if key in UTILIZATION_COLUMNS:
+                value = cls._bucket(value)
+            elif key == "memory_gb" and value is not None:
+                value = float(value)
+            values.append(cls._format_value(value))
+        return "|".join(values)
+
+    @staticmethod
+    def _encode_table(chunk: List[Dict[str, Any]]) -> str:
+        """프로필 목록을 '|' 구분 표로 인코딩 (dict repr 대비 토큰 절약)"""
+        lines = ["|".join(["id"] + [header for _, header in RESOURCE_COLUMNS])]
+        lines.extend(f"{i}|{profile['values']}" for i, profile in enumerate(chunk))
+        return "\n".join(lines)
 
     def _build_diagnosis_prompt(self, data: Dict) -> str:
         """Structured Output을 위한 프롬프트 엔지니어링"""
@@ -38,3 +301,163 @@ class GeminiAdapter:
             "total_savings": 123.45
         }}
 """
+
+    @staticmethod
+    def _build_batch_prompt(table: str) -> str:
+        """표 형식 리소스 목록에 대한 리소스별 진단 프롬프트"""
+        types = ", ".join(RECOMMENDATION_TYPES)
+        return f"""다음은 클라우드 리소스 사용 현황입니다. 값이 없으면 '-' 입니다.
+cpu%, mem%는 7일 평균 사용률의 5% 구간 하한값입니다.
+각 행(id)마다 비용 절감 방안을 판단해 JSON으로만 답하세요.
+
+{table}
+
+recommendation_type: {types} 중 하나
+응답 형식:
+{{"diagnosis": "전체 요약 한 문장",
+ "items": [{{"id": 0, "recommendation_type": "DOWNSIZE", "recommended_instance": "t3.small",
+ "recommended_monthly_cost": 15.2, "reason": "근거 한 문장"}}]}}
+"""
+
+    @staticmethod
+    def _parse_batch_output(
+        output: Dict[str, Any], chunk: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """응답 items를 행 번호로 프로필과 매칭 (범위 밖/형식 오류 항목은 무시)"""
+        answers = []
+        for item in output.get("items") or []:
+            try:
+                row_id = int(item["id"])
+                recommendation_type = str(item["recommendation_type"]).upper()
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 0 <= row_id < len(chunk) or recommendation_type not in RECOMMENDATION_TYPES:
+                continue
+            cost = item.get("recommended_monthly_cost")
+            try:
+                cost = float(cost) if cost is not None else None
+            except (TypeError, ValueError):
+                cost = None
+            answers.append(
+                (
+                    chunk[row_id],
+                    {
+                        "recommendation_type": recommendation_type,
+                        "reason": str(item.get("reason") or ""),
+                        "recommended_instance": item.get("recommended_instance") or None,
+                        "recommended_monthly_cost": cost,
+                    },
+                )
+            )
+        return answers
+
+    @staticmethod
+    def _parse_structured_output(text: str) -> Dict[str, Any]:
+        """JSON 응답 파싱 (```json 코드 블록으로 감싸진 경우 포함)"""
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
+        try:
+            output = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise InvalidAIResponse(f"Gemini 응답 파싱 실패: {str(e)}")
+        if not isinstance(output, dict):
+            raise InvalidAIResponse("Gemini 응답이 JSON 객체가 아닙니다.")
+        return output
+
+
+class AsyncGeminiAdapter(GeminiAdapter):
+    """
+    asyncio용 Gemini 어댑터 (SDK generate_content_async 사용)
+
+    - 이벤트 루프별 공용 세마포어로 동시 호출 수 제한
+    - 429/5xx/타임아웃은 지수 백오프 + full jitter로 재시도
+    - 호출마다 타임아웃 적용
+    - circuit breaker가 열려 있으면 호출 없이 GeminiUnavailable
+      (배치 진단에서는 실패 리소스로 남아 호출자가 규칙 기반 결과로 대체)
+    """
+
+    MAX_CONCURRENCY = 8
+    CALL_TIMEOUT = 30
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 8.0
+    RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    _semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    async def agenerate_diagnosis(
+        self, inventory_data: Dict[str, Any], catalog_version: str = ""
+    ) -> Dict[str, Any]:
+        """generate_diagnosis의 비동기 버전"""
+        prompt = self._build_diagnosis_prompt(inventory_data)
+        key = self._cache_key(catalog_version, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        output = await self._agenerate(prompt)
+        self.cache.set(key, output)
+        return output
+
+    async def agenerate_batch_diagnosis(
+        self, resources: List[Dict[str, Any]], catalog_version: str = ""
+    ) -> AIBatchResultDTO:
+        """generate_batch_diagnosis의 비동기 버전 (청크를 동시에 보내고 세마포어로 제한)"""
+        result, misses = self._plan(resources, catalog_version)
+        chunks = list(self._pack(misses))
+        result.chunks = len(chunks)
+
+        outcomes = await asyncio.gather(
+            *(self._adiagnose_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, (GeminiAPIError, InvalidAIResponse)):
+                self._record_failure(result, chunk, outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                self._record_answers(result, *outcome)
+
+        self._log_batch(result, len(resources))
+        return result
+
+    async def _adiagnose_chunk(self, chunk: List[Dict[str, Any]]):
+        output = await self._agenerate(self._build_batch_prompt(self._encode_table(chunk)))
+        return self._parse_batch_output(output, chunk), output.get("diagnosis", "")
+
+    async def _agenerate(self, prompt: str) -> Dict[str, Any]:
+        """세마포어 + 타임아웃 + 재시도 + circuit breaker를 적용한 단일 호출"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            if not self.circuit_breaker.allow_request():
+                raise GeminiUnavailable()
+            try:
+                async with self._semaphore():
+                    response = await asyncio.wait_for(
+                        self.model.generate_content_async(prompt), timeout=self.CALL_TIMEOUT
+                    )
+            except Exception as e:
+                self.circuit_breaker.record_failure()
+                if not self._is_retryable(e) or attempt == self.MAX_RETRIES:
+                    raise GeminiAPIError(f" Gemini API 호출 실패 {str(e) or type(e).__name__}")
+                delay = random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2**attempt))
+                logger.info(f"Gemini 재시도 {attempt + 1}/{self.MAX_RETRIES} ({delay:.2f}s 후)")
+                await asyncio.sleep(delay)
+                continue
+            self.circuit_breaker.record_success()
+            return self._parse_structured_output(response.text)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """이벤트 루프별 공용 세마포어 (asyncio 객체는 루프를 넘나들 수 없음)"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        return semaphore
+
+    @classmethod
+    def _is_retryable(cls, error: Exception) -> bool:
+        if isinstance(error, asyncio.TimeoutError):
+            return True
+        return getattr(error, "code", None) in cls.RETRYABLE_STATUS_CODES
@@ -0,0 +1,124 @@
+# core/dto/cloud_service_dto.py
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional, Set, Tuple
+
+
+@dataclass
+class CloudServiceDTO:
+    """공식 가격표에서 파싱한 클라우드 상품 정보"""
+
+    provider: str
+    instance_type: str
+    region: str
+    vcpu: int
+    memory_gb: Decimal
+    price_per_hour: Decimal
+    pricing_model: str
+    pricing_source: str
+    storage_gb: Optional[int] = None
+    currency: str = "USD"
+
+
+@dataclass
+class PriceCrawlResultDTO:
+    """가격 크롤링 결과 요약"""
+
+    provider: str
+    matched: int = 0
+    saved: int = 0
+
+
+# (instance_type, region, pricing_model)
+CatalogKey = Tuple[str, str, str]
+
+
+@dataclass
+class CatalogChangesetDTO:
+    """가격표 델타 반영 결과 (하위 캐시의 선택적 무효화에 사용)"""
+
+    provider: str
+    offer_version: str
+    skipped: bool = False
+    created: List[CatalogKey] = field(default_factory=list)
+    updated: List[CatalogKey] = field(default_factory=list)
+    deactivated: List[CatalogKey] = field(default_factory=list)
+    unchanged_count: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.created or self.updated or self.deactivated)
+
+    @property
+    def changed_keys(self) -> List[CatalogKey]:
+        return self.created + self.updated + self.deactivated
+
+    @property
+    def affected_regions(self) -> Set[str]:
+        """변경이 발생한 provider 원본 리전"""
+        return {region for _, region, _ in self.changed_keys}
+
+
+@dataclass(frozen=True)
+class ServiceCandidateDTO:
+    """스펙 조건을 만족하는 대안 CloudService (인메모리 인덱스 항목)"""
+
+    service_id: int
+    provider: str
+    instance_type: str
+    region: str
+    region_normalized: str
+    pricing_model: str
+    vcpu: int
+    memory_gb: Decimal
+    price_per_hour: Decimal
+
+    @property
+    def monthly_cost(self) -> Decimal:
+        """월 730시간 기준 예상 비용"""
+        return self.price_per_hour * 730
+
+
+@dataclass(frozen=True)
+class PriceOfferDTO:
+    """가격 비교 결과의 provider별 최저가 상품"""
+
+    service_id: int
+    provider: str
+    instance_type: str
+    region: str
+    memory_gb: Decimal
+    currency: str
+    price_per_hour: Decimal
+
+    @property
+    def monthly_cost(self) -> Decimal:
+        """월 730시간 기준 예상 비용"""
+        return self.price_per_hour * 730
+
+
+@dataclass
+class PriceComparisonDTO:
+    """(리전, vCPU, 메모리 구간, 가격 모델) 조합의 provider 간 가격 비교"""
+
+    region_normalized: str
+    vcpu: int
+    memory_bucket_gb: Decimal
+    pricing_model: str
+    offers: List[PriceOfferDTO] = field(default_factory=list)
+
+    @property
+    def cheapest(self) -> Optional[PriceOfferDTO]:
+        return self.offers[0] if self.offers else None
+
+    def to_dict(self):
+        return {
+            "region_normalized": self.region_normalized,
+            "vcpu": self.vcpu,
+            "memory_bucket_gb": self.memory_bucket_gb,
+            "pricing_model": self.pricing_model,
+            "cheapest_provider": self.cheapest.provider if self.cheapest else None,
+            "offers": [
+                {**vars(offer), "monthly_cost": offer.monthly_cost} for offer in self.offers
+            ],
+        }
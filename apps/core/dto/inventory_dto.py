@@ -1,6 +1,6 @@
 # core/dto/inventory_dto.py
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
 @dataclass
@@ -14,3 +14,45 @@ class CSVInventoryDTO:
     memory_gb: float
     monthly_cost: float
     region: Optional[str] = "us-east-1"
+
+
+@dataclass
+class InventoryUpsertResultDTO:
+    """UserInventory 벌크 upsert 결과"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    def merge(self, other: "InventoryUpsertResultDTO") -> "InventoryUpsertResultDTO":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        return self
+
+
+@dataclass
+class CSVIngestionResultDTO:
+    """CSV 적재 결과 요약"""
+
+    total_rows: int = 0
+    saved_rows: int = 0
+    skipped_rows: int = 0
+    upsert: InventoryUpsertResultDTO = field(default_factory=InventoryUpsertResultDTO)
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CloudWatchSyncResultDTO:
+    """CloudWatch 지표 동기화 결과"""
+
+    pairs_total: int = 0
+    pairs_failed: int = 0
+    instances_requested: int = 0
+    instances_synced: int = 0
+    upsert: InventoryUpsertResultDTO = field(default_factory=InventoryUpsertResultDTO)
+    errors: List[str] = field(default_factory=list)
@@ -1,6 +1,6 @@
 # core/dto/recommendation_dto.py
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -13,6 +13,9 @@ class RecommendationItemDTO:
     recommended_cost: float
     savings: float
     reason: str
+    recommendation_type: Optional[str] = None
+    inventory_id: Optional[int] = None
+    recommended_service_id: Optional[int] = None
 
 
 @dataclass
@@ -25,10 +28,107 @@ class DiagnosisResultDTO:
     total_savings: float
     diagnosis_summary: str
     items: List[RecommendationItemDTO]
+    rule_decided: int = 0
+    ai_reviewed: int = 0
+    # AI 판단이 필요했지만 결과를 받지 못한 리소스 (다음 진단에서 다시 진단)
+    unsettled_inventory_ids: List[int] = field(default_factory=list)
 
     def to_dict(self):
         return {
             "total_savings": self.total_savings,
             "diagnosis_summary": self.diagnosis_summary,
             "items": [vars(item) for item in self.items],
+            "rule_decided": self.rule_decided,
+            "ai_reviewed": self.ai_reviewed,
         }
+
+
+@dataclass
+class RightsizingItemDTO:
+    """리소스별 적정 사이징 결과"""
+
+    inventory_id: int
+    resource_id: str
+    provider: str
+    instance_type: str
+    current_monthly_cost: float
+    cpu_usage_avg: Optional[float]
+    memory_usage_avg: Optional[float]
+    required_vcpu: int
+    required_memory_gb: float
+    is_over_provisioned: Optional[bool]
+    is_under_utilized: Optional[bool]
+    recommended_service_id: Optional[int] = None
+    recommended_provider: Optional[str] = None
+    recommended_instance_type: Optional[str] = None
+    recommended_monthly_cost: Optional[float] = None
+    monthly_savings: float = 0.0
+
+
+@dataclass
+class RightsizingReportDTO:
+    """사용자 인벤토리 전체 적정 사이징 결과"""
+
+    user_id: int
+    total_current_cost: float
+    total_optimized_cost: float
+    total_savings: float
+    items: List[RightsizingItemDTO]
+
+    @property
+    def recommended_items(self) -> List[RightsizingItemDTO]:
+        return [item for item in self.items if item.recommended_service_id is not None]
+
+
+@dataclass
+class AuditDecisionDTO:
+    """규칙 기반 사전 진단 결과 (decision이 None이면 AI 판단 필요)"""
+
+    inventory_id: int
+    resource_id: str
+    instance_type: str
+    current_monthly_cost: float
+    decision: Optional[str]
+    reason: str
+    recommended_service_id: Optional[int] = None
+    recommended_instance_type: Optional[str] = None
+    recommended_monthly_cost: Optional[float] = None
+    monthly_savings: float = 0.0
+
+    @property
+    def needs_ai(self) -> bool:
+        return self.decision is None
+
+
+@dataclass
+class AIDiagnosisItemDTO:
+    """AI가 판단한 리소스별 진단"""
+
+    resource_id: str
+    recommendation_type: str
+    reason: str
+    recommended_instance: Optional[str] = None
+    recommended_monthly_cost: Optional[float] = None
+
+
+@dataclass
+class AIBatchResultDTO:
+    """배치 AI 진단 결과 (청크 결과 병합)"""
+
+    items: List[AIDiagnosisItemDTO] = field(default_factory=list)
+    summaries: List[str] = field(default_factory=list)
+    chunks: int = 0
+    cached: int = 0
+    failed_resource_ids: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class AuditPlanDTO:
+    """입력 지문 비교 결과 (다시 진단할 리소스 / 이전 결과를 이어받을 리소스)"""
+
+    fingerprints: Dict[int, str] = field(default_factory=dict)
+    changed_ids: List[int] = field(default_factory=list)
+    # inventory_id -> 이전에 같은 입력으로 진단한 Recommendation id
+    carried: Dict[int, int] = field(default_factory=dict)
+    carried_cost: float = 0.0
@@ -1,17 +1,17 @@
-# core/exceptions/cloud_exceptions.py
-from core.exceptions.base import BaseAPIException
+# core/exceptions/ai_exceptions.py
+from apps.core.exceptions.base import BaseAPIException
 
 
-class CloudServiceNotFound(BaseAPIException):
-    status_code = 404
-    default_detail = "해당 스펙의 클라우드 서비스를 찾을 수 없습니다."
+class GeminiAPIError(BaseAPIException):
+    status_code = 503
+    default_detail = "Gemini API 호출에 실패했습니다."
 
 
-class CloudWatchConnectionError(BaseAPIException):
-    status_code = 503
-    default_detail = "AWS CloudWatch 연결에 실패했습니다."
+class InvalidAIResponse(BaseAPIException):
+    status_code = 502
+    default_detail = "AI 응답 형식이 올바르지 않습니다."
 
 
-class InvalidCSVFormat(BaseAPIException):
-    status_code = 400
-    default_detail = "CSV 파일 형식이 올바르지 않습니다."
+class GeminiUnavailable(GeminiAPIError):
+    status_code = 503
+    default_detail = "Gemini API 장애로 AI 진단을 일시적으로 사용할 수 없습니다."
@@ -1,5 +1,5 @@
 # core/exceptions/cloud_exceptions.py
-from core.exceptions.base import BaseAPIException
+from apps.core.exceptions.base import BaseAPIException
 
 
 class CloudServiceNotFound(BaseAPIException):
@@ -15,3 +15,8 @@ class CloudWatchConnectionError(BaseAPIException):
 class InvalidCSVFormat(BaseAPIException):
     status_code = 400
     default_detail = "CSV 파일 형식이 올바르지 않습니다."
+
+
+class PriceCatalogFetchError(BaseAPIException):
+    status_code = 503
+    default_detail = "공식 가격표를 가져오지 못했습니다."
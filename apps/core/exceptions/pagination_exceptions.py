@@ -0,0 +1,7 @@
+# core/exceptions/pagination_exceptions.py
+from apps.core.exceptions.base import BaseAPIException
+
+
+class InvalidCursor(BaseAPIException):
+    status_code = 400
+    default_detail = "페이지 커서가 올바르지 않습니다."
@@ -0,0 +1,7 @@
+# core/exceptions/recommendation_exceptions.py
+from apps.core.exceptions.base import BaseAPIException
+
+
+class RecommendationNotFound(BaseAPIException):
+    status_code = 404
+    default_detail = "해당 진단 결과를 찾을 수 없습니다."
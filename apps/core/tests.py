@@ -1,3 +1,528 @@
-from django.test import TestCase
+import asyncio
+import json
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache, caches
+from django.test import SimpleTestCase, override_settings
+
+import fakeredis
+import numpy as np
+from botocore.stub import Stubber
+
+from apps.core.adapters.aws_adapter import AWSAdapter
+from apps.core.adapters.gemini_adapter import AsyncGeminiAdapter, GeminiAdapter
+from apps.core.choices import NormalizedRegion, Provider
+from apps.core.exceptions.ai_exceptions import GeminiAPIError, GeminiUnavailable
+from apps.core.utils.cache_helper import CacheHelper, TwoTierCache
+from apps.core.utils.circuit_breaker import CircuitBreaker
+from apps.core.utils.quantile_sketch import DDSketch
+from apps.core.utils.redis_cache import PooledRedisCache
+from apps.core.utils.region_mapper import (
+    REGION_REGISTRY,
+    RegionRegistry,
+    get_provider_regions,
+    normalize_region,
+)
+from apps.core.utils.ttl_cache import TTLCache
+
+
+class AWSAdapterMetricsBatchTest(SimpleTestCase):
+    """GetMetricData 배치 조회 테스트"""
+
+    def setUp(self):
+        self.adapter = AWSAdapter("test-key", "test-secret", "us-east-1")
+        self.stubber = Stubber(self.adapter.cloudwatch)
+        self.timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def _result(self, query_id, values):
+        return {
+            "Id": query_id,
+            "Label": query_id,
+            "Timestamps": [self.timestamp] * len(values),
+            "Values": values,
+            "StatusCode": "Complete",
+        }
+
+    def test_queries_are_split_and_paginated(self):
+        instance_ids = [f"i-{index:04d}" for index in range(100)]
+        # 100대 x 6개 지표 = 600 쿼리 → 2회 호출 (첫 호출은 NextToken으로 한 페이지 더)
+        self.stubber.add_response(
+            "get_metric_data",
+            {"MetricDataResults": [self._result("m0_cpu_avg", [10.0])], "NextToken": "next"},
+        )
+        self.stubber.add_response(
+            "get_metric_data",
+            {"MetricDataResults": [self._result("m0_cpu_avg", [30.0])]},
+        )
+        self.stubber.add_response(
+            "get_metric_data",
+            {"MetricDataResults": [self._result("m99_memory_avg", [55.0, 45.0])]},
+        )
+
+        with self.stubber:
+            result = self.adapter.get_metrics_batch(instance_ids)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(len(result), 100)
+        self.assertEqual(result["i-0000"]["cpu_avg"], 20.0)
+        self.assertIsNone(result["i-0000"]["memory_avg"])
+        self.assertEqual(result["i-0099"]["memory_avg"], 50.0)
+
+
+class FakeGeminiModel:
+    """행마다 NO_ACTION으로 답하고, fail_on 문자열이 든 프롬프트는 실패시키는 가짜 모델"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        with self.lock:
+            self.prompts.append(prompt)
+        if self.fail_on and self.fail_on in prompt:
+            raise RuntimeError("429 Resource exhausted")
+        rows = prompt.split("\n\n")[1].splitlines()[1:]
+        items = [
+            {"id": int(row.split("|")[0]), "recommendation_type": "NO_ACTION", "reason": "ok"}
+            for row in rows
+        ]
+        return SimpleNamespace(text=json.dumps({"diagnosis": "요약", "items": items}))
+
+
+class GeminiAdapterBatchTest(SimpleTestCase):
+    """토큰 예산 기반 배치 진단 테스트"""
+
+    def _resources(self, count):
+        return [
+            {
+                "resource_id": f"i-{index:05d}",
+                "provider": "AWS",
+                "instance_type": f"m5.type{index}",
+                "region": "us-east-1",
+                "region_normalized": "US_EAST",
+                "vcpu": 4,
+                "memory_gb": 16.0,
+                "cpu_usage_avg": 95.5,
+                "memory_usage_avg": None,
+                "current_monthly_cost": 140.16,
+            }
+            for index in range(count)
+        ]
+
+    def test_resources_are_packed_into_budgeted_chunks(self):
+        model = FakeGeminiModel()
+        adapter = GeminiAdapter(model=model, cache=TTLCache(maxsize=1000, ttl=60))
+
+        result = adapter.generate_batch_diagnosis(self._resources(500))
+
+        self.assertGreater(result.chunks, 1)
+        self.assertEqual(len(model.prompts), result.chunks)
+        for prompt in model.prompts:
+            self.assertLessEqual(adapter._estimate_tokens(prompt), adapter.MAX_INPUT_TOKENS)
+            self.assertNotIn("'resource_id'", prompt)
+        self.assertEqual(
+            sorted(item.resource_id for item in result.items),
+            [f"i-{index:05d}" for index in range(500)],
+        )
+
+    def test_failed_chunk_is_reported(self):
+        model = FakeGeminiModel(fail_on="\n0|AWS")
+        adapter = GeminiAdapter(
+            model=model,
+            cache=TTLCache(maxsize=1000, ttl=60),
+            circuit_breaker=CircuitBreaker(failure_threshold=10),
+        )
+        adapter.OUTPUT_TOKENS_PER_RESOURCE = adapter.MAX_OUTPUT_TOKENS // 10
+
+        result = adapter.generate_batch_diagnosis(self._resources(25))
+
+        # 10개씩 3청크 - 모든 청크가 행 0을 가지므로 전부 실패
+        self.assertEqual(result.chunks, 3)
+        self.assertEqual(len(result.failed_resource_ids), 25)
+        self.assertEqual(result.items, [])
+
+    def test_repeated_profiles_are_served_from_cache(self):
+        model = FakeGeminiModel()
+        cache = TTLCache(maxsize=1000, ttl=60)
+        adapter = GeminiAdapter(model=model, cache=cache)
+        resources = self._resources(3)
+        # 사용률 95.5%와 97%는 같은 5% 구간 → 같은 프로필
+        duplicate = dict(resources[0], resource_id="i-dup", cpu_usage_avg=97.0)
+
+        first = adapter.generate_batch_diagnosis(resources + [duplicate], catalog_version="v1")
+        second = adapter.generate_batch_diagnosis(resources, catalog_version="v1")
+        third = adapter.generate_batch_diagnosis(resources, catalog_version="v2")
+
+        self.assertEqual((first.cached, len(first.items)), (0, 4))
+        # 첫 호출(중복 제거된 3개 프로필 1청크) + 가격표 버전이 바뀐 세 번째 호출
+        self.assertEqual(len(model.prompts), 2)
+        self.assertEqual((second.cached, second.chunks), (3, 0))
+        self.assertEqual(third.cached, 0)
+        self.assertEqual(cache.stats()["hits"], 3)
+        self.assertEqual(len(cache), 6)
+
+
+class FakeAPIError(Exception):
+    """google.api_core 예외처럼 HTTP 상태 코드를 가진 예외"""
+
+    def __init__(self, code):
+        super().__init__(f"{code} error")
+        self.code = code
+
+
+class FakeAsyncGeminiModel:
+    """errors를 순서대로 던진 뒤 정상 응답하고, 동시 호출 수를 기록하는 가짜 비동기 모델"""
+
+    def __init__(self, errors=(), delay=0):
+        self.errors = list(errors)
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.errors:
+                raise self.errors.pop(0)
+        finally:
+            self.active -= 1
+        return SimpleNamespace(
+            text=json.dumps({"diagnosis": "요약", "recommendation_type": "NO_ACTION"})
+        )
+
+
+class AsyncGeminiAdapterTest(SimpleTestCase):
+    """비동기 Gemini 호출 재시도/타임아웃/차단 테스트"""
+
+    def _adapter(self, model, breaker=None, **attrs):
+        adapter = AsyncGeminiAdapter(
+            model=model,
+            cache=TTLCache(maxsize=100, ttl=60),
+            circuit_breaker=breaker or CircuitBreaker(),
+        )
+        adapter.BACKOFF_BASE = 0
+        for name, value in attrs.items():
+            setattr(adapter, name, value)
+        return adapter
+
+    def test_retries_rate_limit_then_succeeds(self):
+        model = FakeAsyncGeminiModel(errors=[FakeAPIError(429), FakeAPIError(503)])
+        adapter = self._adapter(model)
+
+        output = asyncio.run(adapter._agenerate("prompt"))
+
+        self.assertEqual(output["recommendation_type"], "NO_ACTION")
+        self.assertEqual(model.calls, 3)
+        self.assertEqual(adapter.circuit_breaker.state, CircuitBreaker.CLOSED)
+
+    def test_client_error_is_not_retried(self):
+        model = FakeAsyncGeminiModel(errors=[FakeAPIError(400)])
+        adapter = self._adapter(model)
+
+        with self.assertRaises(GeminiAPIError):
+            asyncio.run(adapter._agenerate("prompt"))
+        self.assertEqual(model.calls, 1)
+
+    def test_timeout_is_retried_until_limit(self):
+        model = FakeAsyncGeminiModel(delay=1)
+        adapter = self._adapter(model, CALL_TIMEOUT=0.01, MAX_RETRIES=1)
+
+        with self.assertRaises(GeminiAPIError):
+            asyncio.run(adapter._agenerate("prompt"))
+        self.assertEqual(model.calls, 2)
+
+    def test_open_circuit_fails_fast(self):
+        model = FakeAsyncGeminiModel(errors=[FakeAPIError(503)] * 10)
+        adapter = self._adapter(model, CircuitBreaker(failure_threshold=2), MAX_RETRIES=5)
+
+        with self.assertRaises(GeminiUnavailable):
+            asyncio.run(adapter._agenerate("prompt"))
+        # 2회 실패로 차단된 뒤에는 모델을 호출하지 않음
+        self.assertEqual(model.calls, 2)
+
+    def test_concurrency_is_capped_by_semaphore(self):
+        model = FakeAsyncGeminiModel(delay=0.01)
+        adapter = self._adapter(model, MAX_CONCURRENCY=3)
+        adapter._semaphores = weakref.WeakKeyDictionary()
+
+        async def run():
+            await asyncio.gather(*(adapter._agenerate(f"prompt {i}") for i in range(10)))
+
+        asyncio.run(run())
+
+        self.assertEqual(model.calls, 10)
+        self.assertEqual(model.max_active, 3)
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    def test_open_half_open_close(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, timer=lambda: now[0])
+        breaker.record_failure()
+        breaker.record_failure()
+
+        self.assertFalse(breaker.allow_request())
+        now[0] = 10
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())  # 시험 호출은 1건만
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        now[0] = 20
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+FAKE_REDIS_CACHES = {
+    "default": {
+        "BACKEND": "apps.core.utils.redis_cache.PooledRedisCache",
+        "LOCATION": "redis://fake-redis:6379/0",
+        "KEY_PREFIX": "test",
+        "OPTIONS": {"connection_class": fakeredis.FakeRedisConnection},
+    }
+}
+
+
+@override_settings(CACHES=FAKE_REDIS_CACHES)
+class RedisCacheTest(SimpleTestCase):
+    """Redis 캐시 백엔드 / 패턴 삭제 테스트 (fakeredis)"""
+
+    def setUp(self):
+        cache.get_client().flushdb()
+
+    def test_invalidate_pattern_scans_in_batches(self):
+        for index in range(25):
+            cache.set(f"user:1:item:{index}", index)
+        cache.set("user:2:item:0", 0)
+
+        client = cache.get_client()
+        with mock.patch.object(PooledRedisCache, "get_client", return_value=client):
+            with mock.patch.object(client, "unlink", wraps=client.unlink) as unlink:
+                deleted = cache.delete_pattern("user:1:*", batch_size=10)
+
+        self.assertEqual(deleted, 25)
+        self.assertEqual(unlink.call_count, 3)
+        self.assertIsNone(cache.get("user:1:item:0"))
+        self.assertEqual(CacheHelper.invalidate_pattern("user:2:*"), 1)
+        self.assertEqual(cache.get_client().dbsize(), 0)
+
+    def test_threads_share_one_connection_pool(self):
+        pools = []
+
+        def worker():
+            pools.append(caches["default"].get_client().connection_pool)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(pool) for pool in pools}), 1)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class CacheHelperGetOrSetTest(SimpleTestCase):
+    """get_or_set 센티널 / single-flight / stale-while-revalidate 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def _fetch(self, value, delay=0):
+        def fetch():
+            self.calls += 1
+            time.sleep(delay)
+            return value
+
+        return fetch
+
+    def test_falsy_and_decimal_values_are_cached(self):
+        self.assertEqual(CacheHelper.get_or_set("empty", self._fetch([])), [])
+        self.assertEqual(CacheHelper.get_or_set("empty", self._fetch([1])), [])
+        self.assertEqual(
+            CacheHelper.get_or_set("price", self._fetch(Decimal("0.0416"))), Decimal("0.0416")
+        )
+        self.assertEqual(self.calls, 2)
+
+    def test_concurrent_misses_compute_once(self):
+        results = []
+        fetch = self._fetch({"savings": 0}, delay=0.2)
+
+        def worker():
+            results.append(CacheHelper.get_or_set("hot", fetch))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{"savings": 0}] * 8)
+
+    def test_stale_value_is_served_while_another_worker_refreshes(self):
+        CacheHelper.get_or_set("compare", self._fetch("old"), timeout=10, stale_ttl=60)
+        later = time.time() + 30
+
+        with mock.patch("apps.core.utils.cache_helper.time.time", return_value=later):
+            cache.add("compare" + CacheHelper.LOCK_SUFFIX, "other-worker")
+            self.assertEqual(CacheHelper.get_or_set("compare", self._fetch("new")), "old")
+            cache.delete("compare" + CacheHelper.LOCK_SUFFIX)
+            self.assertEqual(CacheHelper.get_or_set("compare", self._fetch("new")), "new")
+        self.assertEqual(self.calls, 2)
+
+    def test_early_refresh_before_expiry(self):
+        CacheHelper.get_or_set("early", self._fetch("old", delay=0.05), timeout=1)
+
+        # random()이 1에 가까우면 -log(1 - r)이 매우 커져 만료 전이라도 갱신
+        with mock.patch("apps.core.utils.cache_helper.random.random", return_value=1 - 1e-12):
+            self.assertEqual(CacheHelper.get_or_set("early", self._fetch("new")), "new")
+        self.assertEqual(
+            CacheHelper.get_or_set("early", self._fetch("newer"), timeout=1, beta=0), "new"
+        )
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TwoTierCacheTest(SimpleTestCase):
+    """L1(프로세스) + L2(공유) 캐시 / 버전 스탬프 무효화 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.now = [0.0]
+        self.calls = 0
+
+    def _worker(self):
+        # 워커 프로세스마다 자기 L1을 가짐
+        return TwoTierCache("regions", local_ttl=30, timer=lambda: self.now[0])
+
+    def _fetch(self, value):
+        def fetch():
+            self.calls += 1
+            return value
+
+        return fetch
+
+    def test_hot_reads_stay_in_process(self):
+        worker = self._worker()
+        worker.get_or_set("US_EAST", self._fetch(["AWS"]))
+
+        with mock.patch.object(CacheHelper, "get_or_set") as shared:
+            self.assertEqual(worker.get_or_set("US_EAST", self._fetch(["GCP"])), ["AWS"])
+        shared.assert_not_called()
+        # 다른 워커는 L2에서 가져옴
+        self.assertEqual(self._worker().get_or_set("US_EAST", self._fetch(["GCP"])), ["AWS"])
+        self.assertEqual(self.calls, 1)
+
+    def test_invalidation_reaches_other_workers_via_version(self):
+        reader, writer = self._worker(), self._worker()
+        reader.get_or_set("KR", self._fetch([]))
+
+        writer.invalidate()
+        # 버전 확인 주기 전에는 L1 값을 그대로 사용
+        self.assertEqual(reader.get_or_set("KR", self._fetch(["AWS"])), [])
+        self.now[0] = TwoTierCache.VERSION_CHECK_INTERVAL
+        self.assertEqual(reader.get_or_set("KR", self._fetch(["AWS"])), ["AWS"])
+        self.assertEqual(self.calls, 2)
+
+
+class TTLCacheTest(SimpleTestCase):
+    def test_ttl_and_lru_eviction(self):
+        now = [0.0]
+        cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)  # 가장 오래 사용하지 않은 b 제거
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        now[0] = 11
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.stats(), {"size": 1, "hits": 2, "misses": 2, "evictions": 1})
+
+
+class RegionRegistryTest(SimpleTestCase):
+    def test_provider_tags_are_explicit(self):
+        us_east = get_provider_regions(NormalizedRegion.US_EAST)
+
+        self.assertEqual(us_east["AWS"], ("us-east-1", "us-east-2"))
+        self.assertEqual(us_east["GCP"], ("us-east1", "us-east4"))
+        self.assertEqual(us_east["AZURE"], ("eastus", "eastus2"))
+        self.assertNotIn("us-east1", REGION_REGISTRY.regions_for(Provider.AWS))
+        self.assertEqual(normalize_region("koreacentral"), NormalizedRegion.KR)
+
+    def test_loaded_from_data_with_same_name_across_providers(self):
+        registry = RegionRegistry.from_dict(
+            {"AWS": {"us-central": "US_EAST"}, "AZURE": {"us-central": "US_WEST"}}
+        )
+
+        self.assertEqual(registry.normalize("us-central", "AZURE"), NormalizedRegion.US_WEST)
+        with self.assertRaises(ValueError):
+            registry.normalize("us-central")
+        with self.assertRaises(ValueError):
+            RegionRegistry.from_dict({"AWS": {"eu-west-1": "EU_WEST"}})
+
+
+class DDSketchTest(SimpleTestCase):
+    """병합 가능한 분위수 스케치 테스트"""
+
+    def setUp(self):
+        self.values = np.random.default_rng(7).gamma(2.0, 8.0, size=5000).clip(0, 100)
+
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = DDSketch(relative_accuracy=0.01)
+        sketch.add_many(self.values)
+
+        self.assertEqual(sketch.count, 5000)
+        for q in (0.5, 0.95, 0.99):
+            exact = float(np.quantile(self.values, q, method="lower"))
+            self.assertAlmostEqual(sketch.quantile(q), exact, delta=exact * 0.011)
+        self.assertEqual(sketch.quantile(1), float(self.values.max()))
+
+    def test_merge_equals_single_sketch(self):
+        whole = DDSketch()
+        whole.add_many(self.values)
+        first, second = DDSketch(), DDSketch()
+        first.add_many(self.values[:2000])
+        for value in self.values[2000:]:
+            second.add(float(value))
+
+        merged = first.merge(second)
+
+        self.assertEqual(merged.bins, whole.bins)
+        self.assertEqual(merged.quantile(0.95), whole.quantile(0.95))
+        with self.assertRaises(ValueError):
+            merged.merge(DDSketch(relative_accuracy=0.05))
+
+    def test_serialization_roundtrip_is_compact(self):
+        sketch = DDSketch()
+        sketch.add_many([0.0, *self.values])
+
+        data = sketch.to_bytes()
+        restored = DDSketch.from_bytes(memoryview(data))
+
+        self.assertLess(len(data), 12 * 1024)
+        self.assertEqual((restored.zero_count, restored.bins), (1, sketch.bins))
+        self.assertEqual(restored.quantile(0.95), sketch.quantile(0.95))
+        self.assertIsNone(DDSketch.from_bytes(DDSketch().to_bytes()).quantile(0.5))
+
+    def test_bins_are_bounded(self):
+        sketch = DDSketch(max_bins=32)
+        sketch.add_many(np.geomspace(0.01, 100, 1000))
+
+        self.assertLessEqual(len(sketch.bins), 32)
+        self.assertEqual(sketch.count, 1000)
+        self.assertAlmostEqual(sketch.quantile(0.99), 91.2, delta=91.2 * 0.02)
@@ -1,28 +1,226 @@
 # core/utils/cache_helper.py
-import json
+import logging
+import math
+import random
+import time
+import uuid
 from typing import Any, Callable, Optional
 
 from django.core.cache import cache
 
+from apps.core.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# cache.get의 기본값 - None/0/[] 같은 falsy 결과도 캐시 적중으로 구분하기 위한 센티널
+_MISSING = object()
+
 
 class CacheHelper:
-    """Redis 캐싱 헬퍼"""
+    """
+    Redis 캐싱 헬퍼
+
+    get_or_set은 값을 (value, soft_expires_at, compute_seconds) 봉투로 저장합니다.
+    - soft_expires_at 이후에도 stale_ttl 동안은 키가 남아 있어 stale 값을 바로 돌려줄 수 있고
+    - 만료 직전에는 계산 시간에 비례한 확률로 미리 갱신하며 (probabilistic early refresh)
+    - 재계산은 키별 락(cache.add)을 잡은 워커 하나만 수행합니다 (single-flight).
+    직렬화는 캐시 백엔드의 pickle(최고 프로토콜)에 맡겨 Decimal/datetime도 그대로 저장합니다.
+    """
+
+    LOCK_SUFFIX = ":lock"
+    LOCK_TIMEOUT = 30
+    WAIT_TIMEOUT = 5
+    POLL_INTERVAL = 0.05
+    EARLY_REFRESH_BETA = 1.0
 
     @staticmethod
-    def get_or_set(key: str, fetch_func: Callable, timeout: int = 3600) -> Any:
+    def get_or_set(
+        key: str,
+        fetch_func: Callable,
+        timeout: int = 3600,
+        stale_ttl: Optional[int] = None,
+        beta: float = EARLY_REFRESH_BETA,
+    ) -> Any:
         """
         캐시 조회 후 없으면 fetch_func 실행하여 저장
+
+        Args:
+            key: 캐시 키
+            fetch_func: 값을 계산하는 함수
+            timeout: 신선한 값으로 취급하는 시간 (초)
+            stale_ttl: timeout 이후 재계산 중 대신 돌려줄 stale 값 보관 시간 (기본값: timeout의 10%)
+            beta: 미리 갱신 강도 (0이면 만료 전 갱신 안 함)
+        """
+        if stale_ttl is None:
+            stale_ttl = max(timeout // 10, 1)
+
+        entry = CacheHelper._get_entry(key)
+        if entry is not None:
+            value, expires_at, delta = entry
+            if not CacheHelper._should_refresh(expires_at, delta, beta):
+                return value
+            # 만료 임박 또는 stale - 락을 잡은 워커만 재계산하고 나머지는 기존 값 사용
+            token = CacheHelper._acquire(key)
+            if token is None:
+                return value
+            try:
+                return CacheHelper._compute(key, fetch_func, timeout, stale_ttl)
+            finally:
+                CacheHelper._release(key, token)
+
+        token = CacheHelper._acquire(key)
+        if token is None:
+            # 다른 워커가 계산 중 - 결과가 저장될 때까지 잠시 대기
+            entry = CacheHelper._wait_for(key)
+            if entry is not None:
+                return entry[0]
+            logger.info(f"캐시 계산 대기 시간 초과, 직접 계산: {key}")
+            return CacheHelper._compute(key, fetch_func, timeout, stale_ttl)
+        try:
+            return CacheHelper._compute(key, fetch_func, timeout, stale_ttl)
+        finally:
+            CacheHelper._release(key, token)
+
+    @staticmethod
+    def invalidate_pattern(pattern: str) -> int:
+        """
+        특정 패턴의 캐시 전체 삭제 (e.g., 'user:123:*')
+
+        Redis 백엔드(PooledRedisCache)는 SCAN + UNLINK로 해당 키만 지우고,
+        패턴 삭제를 못 하는 백엔드(LocMem 등)는 오래된 값이 남지 않도록 전체를 비웁니다.
         """
-        cached = cache.get(key)
-        if cached:
-            return json.loads(cached)
+        delete_pattern = getattr(cache, "delete_pattern", None)
+        if delete_pattern is not None:
+            return delete_pattern(pattern)
+
+        logger.info(f"패턴 삭제 미지원 캐시 백엔드 - 전체 삭제: {pattern}")
+        cache.clear()
+        return 0
+
+    @staticmethod
+    def _get_entry(key: str) -> Optional[tuple]:
+        entry = cache.get(key, _MISSING)
+        # 이전 형식(json 문자열)으로 저장된 값은 미스로 취급
+        if isinstance(entry, tuple) and len(entry) == 3:
+            return entry
+        return None
 
-        data = fetch_func()
-        cache.set(key, json.dumps(data), timeout)
-        return data
+    @staticmethod
+    def _should_refresh(expires_at: float, delta: float, beta: float) -> bool:
+        """XFetch: 남은 시간이 계산 시간 x beta x Exp(1) 보다 짧으면 갱신"""
+        now = time.time()
+        if now >= expires_at:
+            return True
+        if beta <= 0 or delta <= 0:
+            return False
+        return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+    @staticmethod
+    def _compute(key: str, fetch_func: Callable, timeout: int, stale_ttl: int) -> Any:
+        started = time.time()
+        value = fetch_func()
+        finished = time.time()
+        cache.set(key, (value, finished + timeout, finished - started), timeout + stale_ttl)
+        return value
+
+    @staticmethod
+    def _acquire(key: str) -> Optional[str]:
+        """키별 재계산 락 (SET NX + 만료) - 성공하면 토큰 반환"""
+        token = uuid.uuid4().hex
+        if cache.add(key + CacheHelper.LOCK_SUFFIX, token, CacheHelper.LOCK_TIMEOUT):
+            return token
+        return None
+
+    @staticmethod
+    def _release(key: str, token: str):
+        lock_key = key + CacheHelper.LOCK_SUFFIX
+        # 락이 만료되어 다른 워커가 잡은 경우 그 락은 지우지 않음
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
 
     @staticmethod
-    def invalidate_pattern(pattern: str):
-        """특정 패턴의 캐시 전체 삭제 (e.g., 'user:123:*')"""
-        # Redis SCAN 명령어 사용
-        pass
+    def _wait_for(key: str) -> Optional[tuple]:
+        deadline = time.monotonic() + CacheHelper.WAIT_TIMEOUT
+        lock_key = key + CacheHelper.LOCK_SUFFIX
+        while time.monotonic() < deadline:
+            time.sleep(CacheHelper.POLL_INTERVAL)
+            entry = CacheHelper._get_entry(key)
+            if entry is not None:
+                return entry
+            if cache.get(lock_key) is None:
+                # 계산하던 워커가 실패하고 락을 놓음
+                return None
+        return None
+
+
+class TwoTierCache:
+    """
+    2단계 캐시 (L1: 프로세스 로컬 LRU + 짧은 TTL / L2: 공유 캐시)
+
+    리전별 가격표 조각, 사용자 연동 provider처럼 작고 자주 읽는 값용입니다.
+    네임스페이스마다 공유 캐시에 버전 스탬프를 두고 L1/L2 키에 버전을 포함합니다.
+    invalidate()가 버전을 올리면 다른 워커는 VERSION_CHECK_INTERVAL 안에 새 버전을 보고
+    이전 버전의 L1 항목을 더 이상 읽지 않습니다. 평소 읽기는 네트워크 없이 L1에서 끝납니다.
+    """
+
+    VERSION_CHECK_INTERVAL = 5
+
+    def __init__(
+        self,
+        namespace: str,
+        maxsize: int = 1024,
+        local_ttl: float = 30,
+        timeout: int = 3600,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.local = TTLCache(maxsize, local_ttl, timer=timer)
+        self._timer = timer
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    def get_or_set(self, key: str, fetch_func: Callable) -> Any:
+        version = self.version()
+        local_key = (version, key)
+        value = self.local.get(local_key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = CacheHelper.get_or_set(
+            f"tt:{self.namespace}:v{version}:{key}", fetch_func, timeout=self.timeout
+        )
+        self.local.set(local_key, value)
+        return value
+
+    def version(self) -> int:
+        """네임스페이스 버전 (VERSION_CHECK_INTERVAL 동안은 로컬 값 사용)"""
+        now = self._timer()
+        if self._version is not None and now - self._checked_at < self.VERSION_CHECK_INTERVAL:
+            return self._version
+        version = cache.get(self._version_key)
+        if version is None:
+            cache.add(self._version_key, 1, None)
+            version = cache.get(self._version_key, 1)
+        if version != self._version:
+            self.local.clear()
+        self._version = version
+        self._checked_at = now
+        return version
+
+    def invalidate(self) -> int:
+        """버전을 올려 모든 워커의 L1/L2 항목을 무효화"""
+        cache.add(self._version_key, 1, None)
+        try:
+            version = cache.incr(self._version_key)
+        except ValueError:
+            # incr 직전에 키가 축출된 경우
+            version = int(time.time())
+            cache.set(self._version_key, version, None)
+        self.local.clear()
+        self._version = version
+        self._checked_at = self._timer()
+        return version
+
+    @property
+    def _version_key(self) -> str:
+        return f"tt:{self.namespace}:version"
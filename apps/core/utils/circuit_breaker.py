@@ -0,0 +1,72 @@
+# core/utils/circuit_breaker.py
+import threading
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    """
+    스레드 안전 circuit breaker
+
+    - CLOSED: 정상 호출. 연속 실패가 failure_threshold에 닿으면 OPEN
+    - OPEN: recovery_timeout 동안 호출을 바로 거절
+    - HALF_OPEN: 시험 호출 1건만 허용, 성공하면 CLOSED / 실패하면 다시 OPEN
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._timer = timer
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow_request(self) -> bool:
+        """호출 가능 여부 (HALF_OPEN에서는 시험 호출 1건만 허용)"""
+        with self._lock:
+            self._refresh()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._timer()
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        self.record_success()
+
+    def _refresh(self) -> None:
+        if self._state == self.OPEN and self._timer() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
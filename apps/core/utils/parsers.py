@@ -1 +1,30 @@
 # CSV/JSON 파싱 유틸
+import csv
+import io
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def open_csv_reader(file_obj: IO, encoding: str = "utf-8-sig") -> csv.DictReader:
+    """
+    업로드 파일을 한 줄씩 읽는 DictReader 생성 (파일 전체를 메모리에 올리지 않음)
+
+    Args:
+        file_obj: 바이너리(UploadedFile 등) 또는 텍스트 파일 객체
+        encoding: 바이너리 파일일 때 사용할 인코딩 (BOM 제거를 위해 utf-8-sig)
+    """
+    if isinstance(file_obj, io.TextIOBase):
+        return csv.DictReader(file_obj)
+    return csv.DictReader(io.TextIOWrapper(file_obj, encoding=encoding, newline=""))
+
+
+def iter_chunks(iterable: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    """iterable을 chunk_size 단위 리스트로 끊어서 반환하는 제너레이터"""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size는 양수여야 합니다.")
+
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
@@ -0,0 +1,158 @@
+# core/utils/quantile_sketch.py
+import math
+import struct
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+class DDSketch:
+    """
+    DDSketch 방식의 병합 가능한 분위수 스케치
+
+    값 x를 ceil(log_gamma(x)) 로그 구간에 세므로 어떤 분위수든 상대 오차 relative_accuracy
+    이내로 추정합니다. 구간 수는 값의 범위에만 비례하고 (사용률 0.01~100%면 수백 개 이하)
+    max_bins를 넘으면 가장 작은 구간부터 합쳐서 메모리를 고정합니다.
+    같은 relative_accuracy로 만든 스케치끼리는 구간 카운트를 더하는 것만으로 병합됩니다.
+    """
+
+    DEFAULT_RELATIVE_ACCURACY = 0.01
+    DEFAULT_MAX_BINS = 512
+    # 이 값 이하는 0 구간에 셈 (log 계산 불가 / 의미 없는 미세값)
+    MIN_INDEXABLE = 1e-3
+
+    # 직렬화: 버전, 상대 오차, 0 구간 개수, 최솟값, 최댓값, 구간 수 + (구간 키, 개수) 반복
+    _VERSION = 1
+    _HEADER = struct.Struct("<BdQddI")
+    _BIN = struct.Struct("<iQ")
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy는 0과 1 사이여야 합니다.")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.bins.values())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float, count: int = 1):
+        self._track(value, value)
+        if value <= self.MIN_INDEXABLE:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+        self._collapse()
+
+    def add_many(self, values: Iterable[float]):
+        """여러 값을 한 번에 반영 (구간 키 계산을 numpy로 벡터화)"""
+        values = np.asarray(list(values), dtype=np.float64)
+        if not len(values):
+            return
+        self._track(float(values.min()), float(values.max()))
+        indexable = values > self.MIN_INDEXABLE
+        self.zero_count += int((~indexable).sum())
+        keys, counts = np.unique(
+            np.ceil(np.log(values[indexable]) / self._log_gamma).astype(np.int64),
+            return_counts=True,
+        )
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.bins[key] = self.bins.get(key, 0) + count
+        self._collapse()
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        """다른 스케치를 이 스케치에 병합 (같은 relative_accuracy 필요)"""
+        if not math.isclose(self.gamma, other.gamma):
+            raise ValueError("relative_accuracy가 다른 스케치는 병합할 수 없습니다.")
+        if not other.count:
+            return self
+        self._track(other.min, other.max)
+        self.zero_count += other.zero_count
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self._collapse()
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수(0~1) 추정값 (비어 있으면 None)"""
+        if not 0 <= q <= 1:
+            raise ValueError("q는 0과 1 사이여야 합니다.")
+        total = self.count
+        if not total:
+            return None
+        # 양 끝은 정확한 최솟값/최댓값
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        rank = q * (total - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return max(self.min, 0.0)
+        value = self.max
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # 구간 (gamma^(k-1), gamma^k]의 상대 오차가 최소인 대표값
+                value = 2 * self.gamma**key / (self.gamma + 1)
+                break
+        return min(max(value, self.min), self.max)
+
+    def to_bytes(self) -> bytes:
+        header = self._HEADER.pack(
+            self._VERSION,
+            self.relative_accuracy,
+            self.zero_count,
+            self.min if self.min is not None else math.nan,
+            self.max if self.max is not None else math.nan,
+            len(self.bins),
+        )
+        return header + b"".join(
+            self._BIN.pack(key, count) for key, count in sorted(self.bins.items())
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, max_bins: int = DEFAULT_MAX_BINS) -> "DDSketch":
+        data = bytes(data)
+        version, accuracy, zero_count, low, high, size = cls._HEADER.unpack_from(data)
+        if version != cls._VERSION:
+            raise ValueError(f"지원하지 않는 스케치 버전: {version}")
+        sketch = cls(accuracy, max_bins)
+        sketch.zero_count = zero_count
+        sketch.min = None if math.isnan(low) else low
+        sketch.max = None if math.isnan(high) else high
+        offset = cls._HEADER.size
+        for _ in range(size):
+            key, count = cls._BIN.unpack_from(data, offset)
+            sketch.bins[key] = count
+            offset += cls._BIN.size
+        return sketch
+
+    def _track(self, low: float, high: float):
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def _collapse(self):
+        """구간 수가 max_bins를 넘으면 가장 작은 구간들을 하나로 합침 (높은 분위수 정확도 유지)"""
+        if len(self.bins) <= self.max_bins:
+            return
+        keys = sorted(self.bins)
+        overflow = keys[: len(keys) - self.max_bins + 1]
+        merged = sum(self.bins.pop(key) for key in overflow)
+        target = overflow[-1]
+        self.bins[target] = self.bins.get(target, 0) + merged
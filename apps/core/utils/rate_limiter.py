@@ -0,0 +1,35 @@
+# core/utils/rate_limiter.py
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """
+    스레드 안전 토큰 버킷 rate limiter
+
+    여러 스레드가 같은 계정(API 한도)을 공유할 때 초당 호출 수를 제한합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate는 양수여야 합니다.")
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """토큰이 생길 때까지 대기 후 소비"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
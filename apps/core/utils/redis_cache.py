@@ -0,0 +1,76 @@
+# core/utils/redis_cache.py
+import threading
+from typing import Dict, Optional, Tuple
+
+from django.core.cache.backends.redis import RedisCache, RedisCacheClient
+
+
+class PooledRedisCacheClient(RedisCacheClient):
+    """
+    프로세스 공용 커넥션 풀을 쓰는 Redis 클라이언트
+
+    Django 캐시 객체는 스레드마다 새로 만들어지고 기본 클라이언트는 인스턴스마다 풀을 만들기 때문에
+    스레드 풀(CloudWatch 동기화, Gemini 배치 등)을 쓰면 커넥션이 스레드 수만큼 늘어납니다.
+    같은 서버/옵션이면 프로세스 안에서 풀 하나를 공유합니다.
+    """
+
+    _shared_pools: Dict[Tuple[str, str], object] = {}
+    _shared_lock = threading.Lock()
+
+    def _get_connection_pool(self, write):
+        index = self._get_connection_pool_index(write)
+        pool = self._pools.get(index)
+        if pool is not None:
+            return pool
+
+        key = (self._servers[index], repr(sorted(self._pool_options.items(), key=str)))
+        with self._shared_lock:
+            pool = self._shared_pools.get(key)
+            if pool is None:
+                pool = self._pool_class.from_url(self._servers[index], **self._pool_options)
+                self._shared_pools[key] = pool
+        self._pools[index] = pool
+        return pool
+
+
+class PooledRedisCache(RedisCache):
+    """
+    Redis 캐시 백엔드 (프로세스 공용 커넥션 풀 + 패턴 삭제)
+
+    settings.CACHES 예:
+        "BACKEND": "apps.core.utils.redis_cache.PooledRedisCache",
+        "LOCATION": "redis://redis:6379/1",
+        "OPTIONS": {"max_connections": 50, "socket_timeout": 2},
+    """
+
+    SCAN_BATCH_SIZE = 500
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._class = PooledRedisCacheClient
+
+    def get_client(self, write: bool = True):
+        """redis-py 클라이언트 (캐시 API로 안 되는 명령용)"""
+        return self._cache.get_client(write=write)
+
+    def delete_pattern(
+        self, pattern: str, version: Optional[int] = None, batch_size: int = SCAN_BATCH_SIZE
+    ) -> int:
+        """
+        패턴에 맞는 키 삭제 (e.g., 'user:123:*')
+
+        KEYS/DEL 대신 SCAN으로 조금씩 훑고 UNLINK로 배치 삭제하므로
+        키가 많아도 Redis를 블로킹하지 않습니다. 삭제한 키 수를 반환합니다.
+        """
+        client = self.get_client(write=True)
+        match = self.make_and_validate_key(pattern, version=version)
+        deleted = 0
+        batch = []
+        for key in client.scan_iter(match=match, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += client.unlink(*batch)
+        return deleted
@@ -1,88 +1,127 @@
-from apps.core.choices import NormalizedRegion
-
-REGION_MAPPING: dict[str, NormalizedRegion] = {
-    # ===== AWS =====
-    # 아시아
-    "ap-northeast-2": NormalizedRegion.KR,
-    "ap-northeast-1": NormalizedRegion.JP,
-    "ap-northeast-3": NormalizedRegion.JP,
-    "ap-southeast-1": NormalizedRegion.SG,
-    "ap-east-1": NormalizedRegion.HK,
-    "ap-south-1": NormalizedRegion.IN,
-    "ap-southeast-2": NormalizedRegion.AU,
-    # 북미
-    "us-east-1": NormalizedRegion.US_EAST,
-    "us-east-2": NormalizedRegion.US_EAST,
-    "us-west-1": NormalizedRegion.US_WEST,
-    "us-west-2": NormalizedRegion.US_WEST,
-    "ca-central-1": NormalizedRegion.CA,
-    # # 유럽
-    # "eu-west-1": NormalizedRegion.EU_WEST,
-    # "eu-west-2": NormalizedRegion.UK,
-    # "eu-west-3": NormalizedRegion.FR,
-    # "eu-central-1": NormalizedRegion.DE,
-    # "eu-north-1": NormalizedRegion.EU_NORTH,
-    # # 남미
-    # "sa-east-1": NormalizedRegion.BR,
-    # ===== GCP =====
-    # 아시아
-    "asia-northeast3": NormalizedRegion.KR,
-    "asia-northeast1": NormalizedRegion.JP,
-    "asia-northeast2": NormalizedRegion.JP,
-    "asia-southeast1": NormalizedRegion.SG,
-    "asia-east2": NormalizedRegion.HK,
-    "asia-south1": NormalizedRegion.IN,
-    "australia-southeast1": NormalizedRegion.AU,
-    # 북미
-    "us-east1": NormalizedRegion.US_EAST,
-    "us-east4": NormalizedRegion.US_EAST,
-    "us-west1": NormalizedRegion.US_WEST,
-    "us-west2": NormalizedRegion.US_WEST,
-    "northamerica-northeast1": NormalizedRegion.CA,
-    # # 유럽
-    # "europe-west1": NormalizedRegion.EU_WEST,
-    # "europe-west2": NormalizedRegion.UK,
-    # "europe-west3": NormalizedRegion.DE,
-    # "europe-west4": NormalizedRegion.EU_WEST,
-    # "europe-west9": NormalizedRegion.FR,
-    # "europe-north1": NormalizedRegion.EU_NORTH,
-    # # 남미
-    # "southamerica-east1": NormalizedRegion.BR,
-    # ===== Azure =====
-    # 아시아
-    "koreacentral": NormalizedRegion.KR,
-    "koreasouth": NormalizedRegion.KR,
-    "japaneast": NormalizedRegion.JP,
-    "japanwest": NormalizedRegion.JP,
-    "southeastasia": NormalizedRegion.SG,
-    "eastasia": NormalizedRegion.HK,
-    "centralindia": NormalizedRegion.IN,
-    "australiaeast": NormalizedRegion.AU,
-    # 북미
-    "eastus": NormalizedRegion.US_EAST,
-    "eastus2": NormalizedRegion.US_EAST,
-    "westus": NormalizedRegion.US_WEST,
-    "westus2": NormalizedRegion.US_WEST,
-    "westus3": NormalizedRegion.US_WEST,
-    "canadacentral": NormalizedRegion.CA,
-    # # 유럽
-    # "westeurope": NormalizedRegion.EU_WEST,
-    # "uksouth": NormalizedRegion.UK,
-    # "ukwest": NormalizedRegion.UK,
-    # "germanywestcentral": NormalizedRegion.DE,
-    # "francecentral": NormalizedRegion.FR,
-    # "northeurope": NormalizedRegion.EU_NORTH,
-    # # 남미
-    # "brazilsouth": NormalizedRegion.BR,
-}
-
-
-def normalize_region(provider_region: str) -> NormalizedRegion:
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+from apps.core.choices import NormalizedRegion, Provider
+
+# provider별 원본 리전 → 정규화 리전 (리전 추가는 이 파일만 수정)
+REGIONS_FILE = Path(__file__).resolve().parent.parent / "data" / "regions.json"
+
+
+@dataclass(frozen=True)
+class RegionEntry:
+    """원본 리전 1건 (provider를 명시적으로 보관)"""
+
+    provider: str
+    region: str
+    normalized: NormalizedRegion
+
+
+class RegionRegistry:
+    """
+    리전 레지스트리 (생성 시 정/역방향 인덱스를 한 번만 계산, 이후 읽기 전용)
+
+    - 정방향: 원본 리전 → RegionEntry
+    - 역방향: 정규화 리전 → provider → 원본 리전 목록
+    리전명 접두사로 provider를 추측하지 않으므로 GCP "us-east1"이 AWS로 분류되지 않습니다.
+    """
+
+    def __init__(self, entries: Iterable[RegionEntry]):
+        by_region: dict[tuple[str, str], RegionEntry] = {}
+        forward: dict[str, list[RegionEntry]] = {}
+        reverse: dict[NormalizedRegion, dict[str, list[str]]] = {
+            normalized: {provider: [] for provider in Provider.values}
+            for normalized in NormalizedRegion
+        }
+        for entry in entries:
+            key = (entry.provider, entry.region)
+            if key in by_region:
+                raise ValueError(f"Duplicate region: {entry.provider} {entry.region}")
+            by_region[key] = entry
+            forward.setdefault(entry.region, []).append(entry)
+            reverse[entry.normalized][entry.provider].append(entry.region)
+
+        self._by_region = by_region
+        self._forward = {region: tuple(matches) for region, matches in forward.items()}
+        self._reverse = MappingProxyType(
+            {
+                normalized: MappingProxyType(
+                    {provider: tuple(regions) for provider, regions in providers.items()}
+                )
+                for normalized, providers in reverse.items()
+            }
+        )
+        self._provider_regions = {
+            provider: tuple(region for p, region in by_region if p == provider)
+            for provider in Provider.values
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, dict[str, str]]) -> "RegionRegistry":
+        """{"AWS": {"ap-northeast-2": "KR", ...}, "GCP": {...}} 형식에서 생성"""
+        entries = []
+        for provider, regions in data.items():
+            if provider not in Provider.values:
+                raise ValueError(f"Unknown provider: {provider}")
+            for region, normalized in regions.items():
+                if normalized not in NormalizedRegion.values:
+                    raise ValueError(f"Unknown normalized region: {normalized} ({region})")
+                entries.append(RegionEntry(provider, region, NormalizedRegion(normalized)))
+        return cls(entries)
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> "RegionRegistry":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def normalize(self, region: str, provider: Optional[str] = None) -> NormalizedRegion:
+        return self.lookup(region, provider).normalized
+
+    def lookup(self, region: str, provider: Optional[str] = None) -> RegionEntry:
+        """
+        원본 리전 조회
+
+        Raises:
+            ValueError: 매핑되지 않은 리전 / provider 없이 조회했는데 여러 provider에 같은 이름이 있음
+        """
+        if provider is not None:
+            entry = self._by_region.get((provider, region))
+            if entry is None:
+                raise ValueError(f"Unknown region: {provider} {region}")
+            return entry
+
+        matches = self._forward.get(region)
+        if not matches:
+            raise ValueError(f"Unknown region: {region}")
+        if len(matches) > 1:
+            raise ValueError(f"Ambiguous region (provider 필요): {region}")
+        return matches[0]
+
+    def provider_regions(self, normalized: NormalizedRegion) -> Mapping[str, tuple[str, ...]]:
+        return self._reverse[normalized]
+
+    def regions_for(self, provider: str) -> tuple[str, ...]:
+        return self._provider_regions.get(provider, ())
+
+    def __contains__(self, region: str) -> bool:
+        return region in self._forward
+
+    def __len__(self) -> int:
+        return len(self._by_region)
+
+
+REGION_REGISTRY = RegionRegistry.from_file(REGIONS_FILE)
+
+
+def normalize_region(provider_region: str, provider: Optional[str] = None) -> NormalizedRegion:
     """
     Provider별 리전명을 정규화된 리전으로 변환
 
     Args:
         provider_region: AWS/GCP/Azure 원본 리전명
+        provider: 원본 리전의 provider (여러 provider에 같은 이름이 있을 때 필요)
 
     Returns:
         NormalizedRegion enum 값
@@ -90,35 +129,17 @@ def normalize_region(provider_region: str) -> NormalizedRegion:
     Raises:
         ValueError: 매핑되지 않은 리전
     """
-    normalized = REGION_MAPPING.get(provider_region)
-    if normalized is None:
-        raise ValueError(f"Unknown region: {provider_region}")
-    return normalized
+    return REGION_REGISTRY.normalize(provider_region, provider)
 
 
-def get_provider_regions(normalized: NormalizedRegion) -> dict[str, list[str]]:
+def get_provider_regions(normalized: NormalizedRegion) -> Mapping[str, tuple[str, ...]]:
     """
-    정규화된 리전에 해당하는 각 provider의 원본 리전 목록 반환
+    정규화된 리전에 해당하는 각 provider의 원본 리전 목록 반환 (미리 계산된 인덱스, 읽기 전용)
 
     Args:
         normalized: 정규화된 리전
 
     Returns:
-        {"AWS": ["ap-northeast-2"], "GCP": ["asia-northeast3"], ...}
+        {"AWS": ("ap-northeast-2",), "GCP": ("asia-northeast3",), ...}
     """
-    result: dict[str, list[str]] = {"AWS": [], "GCP": [], "AZURE": []}
-
-    for region, norm in REGION_MAPPING.items():
-        if norm != normalized:
-            continue
-
-        if region.startswith(("ap-", "us-", "eu-", "ca-", "sa-")):
-            result["AWS"].append(region)
-        elif region.startswith(
-            ("asia-", "australia-", "europe-", "northamerica-", "southamerica-")
-        ):
-            result["GCP"].append(region)
-        else:
-            result["AZURE"].append(region)
-
-    return result
+    return REGION_REGISTRY.provider_regions(normalized)
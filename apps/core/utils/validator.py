@@ -1,5 +1,5 @@
 # core/utils/validators.py
-from core.exceptions.cloud_exceptions import InvalidCSVFormat
+from apps.core.exceptions.cloud_exception import InvalidCSVFormat
 
 
 class CloudValidator:
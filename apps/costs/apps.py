@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class CostsConfig(AppConfig):
     name = "apps.costs"
+
+    def ready(self):
+        from apps.costs import signals  # noqa: F401
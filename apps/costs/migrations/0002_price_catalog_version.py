@@ -0,0 +1,74 @@
+# Generated by Django 6.0 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("costs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cloudservice",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="가격/스펙 내용 해시 - 변경된 행만 갱신하는 데 사용",
+                max_length=64,
+            ),
+        ),
+        migrations.CreateModel(
+            name="PriceCatalogVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "provider",
+                    models.CharField(
+                        choices=[
+                            ("AWS", "Amazon Web Services"),
+                            ("GCP", "Google Cloud Platform"),
+                            ("AZURE", "Microsoft Azure"),
+                        ],
+                        help_text="클라우드 제공자(AWS, GCP, Azure)",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "offer_version",
+                    models.CharField(help_text="provider가 발행한 가격표 버전", max_length=50),
+                ),
+                (
+                    "publication_date",
+                    models.DateTimeField(blank=True, help_text="가격표 발행 시각", null=True),
+                ),
+                ("created_count", models.IntegerField(default=0, help_text="신규 상품 수")),
+                (
+                    "updated_count",
+                    models.IntegerField(default=0, help_text="가격/스펙이 바뀐 상품 수"),
+                ),
+                (
+                    "deactivated_count",
+                    models.IntegerField(default=0, help_text="가격표에서 빠져 비활성화된 상품 수"),
+                ),
+            ],
+            options={
+                "db_table": "price_catalog_versions",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["provider", "-created_at"], name="price_catal_provide_5fb419_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 6.0 on 2026-10-18 12:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# (리전, vCPU, 메모리 구간, 가격 모델, provider)별 최저가 활성 상품
+# 메모리 구간은 2의 거듭제곱으로 반올림 (PriceComparisonService.memory_bucket과 동일)
+CREATE_VIEW = """
+CREATE MATERIALIZED VIEW price_comparisons AS
+SELECT DISTINCT ON (region_normalized, vcpu, memory_bucket_gb, pricing_model, provider)
+    id AS service_id,
+    region_normalized,
+    vcpu,
+    memory_bucket_gb,
+    pricing_model,
+    provider,
+    instance_type,
+    region,
+    memory_gb,
+    currency,
+    price_per_hour
+FROM (
+    SELECT
+        *,
+        POWER(2, ROUND(LOG(2, memory_gb)))::numeric(8, 2) AS memory_bucket_gb
+    FROM cloud_services
+    WHERE is_active AND region_normalized IS NOT NULL AND memory_gb > 0
+) AS services
+ORDER BY region_normalized, vcpu, memory_bucket_gb, pricing_model, provider, price_per_hour, id
+WITH DATA;
+
+-- REFRESH ... CONCURRENTLY에 필요한 유니크 인덱스 + 비교 조회 키
+CREATE UNIQUE INDEX price_comparisons_key
+    ON price_comparisons (region_normalized, vcpu, memory_bucket_gb, pricing_model, provider);
+"""
+
+DROP_VIEW = "DROP MATERIALIZED VIEW IF EXISTS price_comparisons;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("costs", "0002_price_catalog_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PriceComparison",
+            fields=[
+                (
+                    "service",
+                    models.OneToOneField(
+                        db_constraint=False,
+                        help_text="해당 조합의 최저가 CloudService",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="costs.cloudservice",
+                    ),
+                ),
+                (
+                    "region_normalized",
+                    models.CharField(
+                        choices=[
+                            ("KR", "South Korea"),
+                            ("JP", "Japan"),
+                            ("SG", "Singapore"),
+                            ("HK", "Hong Kong"),
+                            ("IN", "India"),
+                            ("AU", "Australia"),
+                            ("US_EAST", "US East"),
+                            ("US_WEST", "US West"),
+                            ("CA", "Canada"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("vcpu", models.IntegerField()),
+                (
+                    "memory_bucket_gb",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="메모리 구간 (2의 거듭제곱으로 반올림, e.g. 3.75GB → 4GB)",
+                        max_digits=8,
+                    ),
+                ),
+                (
+                    "pricing_model",
+                    models.CharField(
+                        choices=[
+                            ("ON_DEMAND", "On Demand"),
+                            ("RESERVED", "Reserved / Committed"),
+                            ("SPOT", "Spot / Preemptible"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "provider",
+                    models.CharField(
+                        choices=[
+                            ("AWS", "Amazon Web Services"),
+                            ("GCP", "Google Cloud Platform"),
+                            ("AZURE", "Microsoft Azure"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("instance_type", models.CharField(max_length=50)),
+                ("region", models.CharField(max_length=50)),
+                ("memory_gb", models.DecimalField(decimal_places=2, max_digits=6)),
+                ("currency", models.CharField(max_length=50)),
+                ("price_per_hour", models.DecimalField(decimal_places=4, max_digits=10)),
+            ],
+            options={
+                "db_table": "price_comparisons",
+                "ordering": ["price_per_hour"],
+                "managed": False,
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEW, DROP_VIEW),
+    ]
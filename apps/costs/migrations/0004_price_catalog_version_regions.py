@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("costs", "0003_price_comparison_view"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pricecatalogversion",
+            name="regions",
+            field=models.JSONField(default=list, help_text="반영한 원본 리전 (정렬)"),
+        ),
+    ]
@@ -55,6 +55,12 @@ class CloudService(BaseModel):
     )
     last_verified_at = models.DateField(help_text="공식 api를 통해 검증된 마지막 가격정보 갱신시간")
     is_active = models.BooleanField(default=True, help_text=("활성화 상태"))
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="가격/스펙 내용 해시 - 변경된 행만 갱신하는 데 사용",
+    )
 
     class Meta:
         db_table = "cloud_services"
@@ -84,3 +90,76 @@ class CloudService(BaseModel):
         월 730 기준 예상 비용
         """
         return self.price_per_hour * 730
+
+
+class PriceCatalogVersion(BaseModel):
+    """
+    provider 공식 가격표 반영 이력
+
+    가격표 발행 버전이 같은 리전 범위의 직전 반영분과 같으면 크롤링을 건너뛰고,
+    달라졌을 때만 내용 해시가 바뀐 CloudService 행을 갱신합니다.
+    """
+
+    provider = models.CharField(
+        max_length=10, choices=Provider.choices, help_text="클라우드 제공자(AWS, GCP, Azure)"
+    )
+    offer_version = models.CharField(max_length=50, help_text="provider가 발행한 가격표 버전")
+    publication_date = models.DateTimeField(null=True, blank=True, help_text="가격표 발행 시각")
+    regions = models.JSONField(default=list, help_text="반영한 원본 리전 (정렬)")
+    created_count = models.IntegerField(default=0, help_text="신규 상품 수")
+    updated_count = models.IntegerField(default=0, help_text="가격/스펙이 바뀐 상품 수")
+    deactivated_count = models.IntegerField(
+        default=0, help_text="가격표에서 빠져 비활성화된 상품 수"
+    )
+
+    class Meta:
+        db_table = "price_catalog_versions"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["provider", "-created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.provider} {self.offer_version}"
+
+
+class PriceComparison(models.Model):
+    """
+    provider 간 가격 비교 (Postgres materialized view, 읽기 전용)
+
+    (region_normalized, vcpu, memory_bucket_gb, pricing_model, provider)마다
+    가장 싼 활성 CloudService 1건입니다. 가격표 갱신(catalog_refreshed) 후
+    PriceComparisonService.refresh()가 REFRESH ... CONCURRENTLY로 다시 계산합니다.
+    """
+
+    service = models.OneToOneField(
+        CloudService,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_constraint=False,
+        related_name="+",
+        help_text="해당 조합의 최저가 CloudService",
+    )
+    region_normalized = models.CharField(max_length=20, choices=NormalizedRegion.choices)
+    vcpu = models.IntegerField()
+    memory_bucket_gb = models.DecimalField(
+        max_digits=8,
+        decimal_places=2,
+        help_text="메모리 구간 (2의 거듭제곱으로 반올림, e.g. 3.75GB → 4GB)",
+    )
+    pricing_model = models.CharField(max_length=20, choices=PricingModel.choices)
+    provider = models.CharField(max_length=10, choices=Provider.choices)
+    instance_type = models.CharField(max_length=50)
+    region = models.CharField(max_length=50)
+    memory_gb = models.DecimalField(max_digits=6, decimal_places=2)
+    currency = models.CharField(max_length=50)
+    price_per_hour = models.DecimalField(max_digits=10, decimal_places=4)
+
+    class Meta:
+        managed = False
+        db_table = "price_comparisons"
+        ordering = ["price_per_hour"]
+
+    def __str__(self):
+        spec = f"{self.vcpu}vCPU/{self.memory_bucket_gb}GB"
+        return f"{self.region_normalized} {spec} {self.provider} {self.instance_type}"
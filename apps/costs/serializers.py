@@ -0,0 +1,17 @@
+from decimal import Decimal
+
+from rest_framework import serializers
+
+from apps.core.choices import NormalizedRegion
+from apps.costs.choices import PricingModel
+
+
+class PriceCompareQuerySerializer(serializers.Serializer):
+    """가격 비교 조회 조건"""
+
+    region = serializers.ChoiceField(choices=NormalizedRegion.choices)
+    vcpu = serializers.IntegerField(min_value=1)
+    memory_gb = serializers.DecimalField(max_digits=6, decimal_places=2, min_value=Decimal("0.1"))
+    pricing_model = serializers.ChoiceField(
+        choices=PricingModel.choices, default=PricingModel.ON_DEMAND
+    )
@@ -0,0 +1,96 @@
+import logging
+import math
+from decimal import Decimal
+
+from django.db import connection
+
+from apps.core.dto.cloud_service_dto import PriceComparisonDTO, PriceOfferDTO
+from apps.core.exceptions.cloud_exception import CloudServiceNotFound
+from apps.core.utils.cache_helper import TwoTierCache
+from apps.costs.choices import PricingModel
+from apps.costs.models import PriceComparison
+
+logger = logging.getLogger(__name__)
+
+# 비교 결과 캐시 (뷰 갱신 시 invalidate)
+comparison_cache = TwoTierCache("price_comparison", maxsize=2048)
+
+
+class PriceComparisonService:
+    """
+    provider 간 동일 스펙 가격 비교
+
+    요청마다 CloudService 전체를 그룹핑하지 않고 materialized view(price_comparisons)의
+    유니크 인덱스 키 (region_normalized, vcpu, memory_bucket_gb, pricing_model)로 조회합니다.
+    """
+
+    OFFER_FIELDS = (
+        "service_id",
+        "provider",
+        "instance_type",
+        "region",
+        "memory_gb",
+        "currency",
+        "price_per_hour",
+    )
+
+    @staticmethod
+    def memory_bucket(memory_gb: Decimal | float) -> Decimal:
+        """메모리를 2의 거듭제곱 구간으로 반올림 (e.g. 3.75 → 4, 7.5 → 8)"""
+        bucket = 2.0 ** round(math.log2(float(memory_gb)))
+        return Decimal(str(bucket)).quantize(Decimal("0.01"))
+
+    @staticmethod
+    def compare(
+        region_normalized: str,
+        vcpu: int,
+        memory_gb: Decimal | float,
+        pricing_model: str = PricingModel.ON_DEMAND,
+    ) -> PriceComparisonDTO:
+        """
+        같은 리전/스펙 구간에서 provider별 최저가 (저렴한 순)
+
+        Raises:
+            CloudServiceNotFound: 해당 조합의 상품이 없음
+        """
+        bucket = PriceComparisonService.memory_bucket(memory_gb)
+        offers = comparison_cache.get_or_set(
+            f"{region_normalized}:{vcpu}:{bucket}:{pricing_model}",
+            lambda: PriceComparisonService._offers(region_normalized, vcpu, bucket, pricing_model),
+        )
+        if not offers:
+            raise CloudServiceNotFound()
+        return PriceComparisonDTO(
+            region_normalized=region_normalized,
+            vcpu=vcpu,
+            memory_bucket_gb=bucket,
+            pricing_model=pricing_model,
+            offers=list(offers),
+        )
+
+    @staticmethod
+    def refresh(concurrently: bool = True):
+        """
+        비교 뷰 재계산
+
+        CONCURRENTLY는 갱신 중에도 기존 데이터로 조회를 계속 받습니다.
+        """
+        option = "CONCURRENTLY " if concurrently else ""
+        with connection.cursor() as cursor:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW {option}{PriceComparison._meta.db_table}")
+        comparison_cache.invalidate()
+        logger.info("가격 비교 뷰 갱신 완료")
+
+    @staticmethod
+    def _offers(region_normalized: str, vcpu: int, bucket: Decimal, pricing_model: str):
+        rows = (
+            PriceComparison.objects.filter(
+                region_normalized=region_normalized,
+                vcpu=vcpu,
+                memory_bucket_gb=bucket,
+                pricing_model=pricing_model,
+            )
+            .order_by("price_per_hour", "provider")
+            .values_list(*PriceComparisonService.OFFER_FIELDS)
+        )
+        return tuple(PriceOfferDTO(*row) for row in rows)
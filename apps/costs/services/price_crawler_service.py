@@ -0,0 +1,260 @@
+import hashlib
+import logging
+import operator
+from functools import reduce
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.core.adapters.cloud_price_adapter import AWSPriceAdapter
+from apps.core.choices import Provider
+from apps.core.dto.cloud_service_dto import (
+    CatalogChangesetDTO,
+    CatalogKey,
+    CloudServiceDTO,
+    PriceCrawlResultDTO,
+)
+from apps.core.utils.parsers import iter_chunks
+from apps.core.utils.region_mapper import REGION_REGISTRY, normalize_region
+from apps.costs.choices import ConfidenceLevel, PricingModel
+from apps.costs.models import CloudService, PriceCatalogVersion
+from apps.costs.signals import catalog_refreshed
+
+logger = logging.getLogger(__name__)
+
+
+class PriceCrawlerService:
+    """공식 가격표 크롤링 후 CloudService 적재"""
+
+    BATCH_SIZE = 1000
+    UPDATE_FIELDS = [
+        "region_normalized",
+        "vcpu",
+        "memory_gb",
+        "storage_gb",
+        "currency",
+        "price_per_hour",
+        "pricing_source",
+        "confidence_level",
+        "last_verified_at",
+        "is_active",
+        "content_hash",
+        "updated_at",
+    ]
+
+    @staticmethod
+    def crawl_aws(
+        source: Optional[str] = None,
+        regions: Optional[Iterable[str]] = None,
+        operating_system: str = "Linux",
+        batch_size: int = BATCH_SIZE,
+    ) -> PriceCrawlResultDTO:
+        """
+        AWS EC2 offer file을 스트리밍 파싱해 CloudService에 배치 upsert (전체 재기록)
+
+        재기록한 상품 전체를 updated로 담은 changeset을 PriceCatalogVersion에 기록하고
+        커밋 후 catalog_refreshed로 전달하므로 하위 캐시/진단 지문도 델타 반영과 같이 갱신됩니다.
+
+        Args:
+            source: offer file 경로 또는 URL (기본값: AWS 공식 URL)
+            regions: 수집할 AWS 리전 (기본값: 정규화 매핑에 등록된 AWS 리전 전체)
+            operating_system: 수집할 OS
+            batch_size: 한 번에 upsert 할 행 수
+        """
+        regions = sorted(regions) if regions is not None else PriceCrawlerService._aws_regions()
+
+        adapter = AWSPriceAdapter(source)
+        version, publication_date = adapter.read_version()
+        result = PriceCrawlResultDTO(provider=Provider.AWS)
+        written: Dict[CatalogKey, None] = {}
+        for batch in iter_chunks(adapter.iter_services(regions, operating_system), batch_size):
+            result.matched += len(batch)
+            result.saved += PriceCrawlerService._save_batch(batch)
+            written.update(
+                dict.fromkeys((dto.instance_type, dto.region, dto.pricing_model) for dto in batch)
+            )
+
+        changeset = CatalogChangesetDTO(
+            provider=Provider.AWS, offer_version=version, updated=list(written)
+        )
+        with transaction.atomic():
+            PriceCatalogVersion.objects.create(
+                provider=Provider.AWS,
+                offer_version=version,
+                publication_date=publication_date,
+                updated_count=len(changeset.updated),
+                regions=regions,
+            )
+            transaction.on_commit(
+                lambda: catalog_refreshed.send(sender=PriceCrawlerService, changeset=changeset)
+            )
+
+        logger.info(f"AWS 가격 크롤링 완료 matched={result.matched} saved={result.saved}")
+        return result
+
+    @staticmethod
+    def refresh_aws(
+        source: Optional[str] = None,
+        regions: Optional[Iterable[str]] = None,
+        operating_system: str = "Linux",
+        batch_size: int = BATCH_SIZE,
+        force: bool = False,
+    ) -> CatalogChangesetDTO:
+        """
+        AWS 가격표 델타 반영
+
+        1. offer file 버전이 같은 리전 범위의 직전 반영분과 같으면 건너뜀 (force=True면 강제 진행)
+        2. 상품별 내용 해시를 비교해 신규/변경 행만 upsert
+        3. 가격표에서 사라진 상품은 비활성화
+        4. 커밋 후 catalog_refreshed 시그널로 changeset 전달
+
+        Returns:
+            CatalogChangesetDTO
+        """
+        adapter = AWSPriceAdapter(source)
+        version, publication_date = adapter.read_version()
+        changeset = CatalogChangesetDTO(provider=Provider.AWS, offer_version=version)
+
+        regions = sorted(regions) if regions is not None else PriceCrawlerService._aws_regions()
+        # 일부 리전만 반영한 이력으로 나머지 리전의 크롤링을 건너뛰지 않도록 리전 범위별로 비교
+        latest = PriceCatalogVersion.objects.filter(provider=Provider.AWS, regions=regions).first()
+        if latest and latest.offer_version == version and not force:
+            logger.info(f"AWS 가격표 버전 변경 없음({version}) - 크롤링 생략")
+            changeset.skipped = True
+            return changeset
+
+        # (instance_type, region, pricing_model) -> (content_hash, is_active)
+        existing: Dict[CatalogKey, Tuple[str, bool]] = {
+            (instance_type, region, pricing_model): (content_hash, is_active)
+            for instance_type, region, pricing_model, content_hash, is_active in (
+                CloudService.objects.filter(
+                    provider=Provider.AWS,
+                    region__in=regions,
+                    pricing_model=PricingModel.ON_DEMAND,
+                ).values_list(
+                    "instance_type", "region", "pricing_model", "content_hash", "is_active"
+                )
+            )
+        }
+
+        # 같은 상품이 여러 번 나오면 최저가 사용 (_save_batch와 같은 기준)
+        offers: Dict[CatalogKey, CloudServiceDTO] = {}
+        for dto in adapter.iter_services(regions, operating_system):
+            key = (dto.instance_type, dto.region, dto.pricing_model)
+            current = offers.get(key)
+            if current is None or dto.price_per_hour < current.price_per_hour:
+                offers[key] = dto
+
+        changed: List[CloudServiceDTO] = []
+        for key, dto in offers.items():
+            previous = existing.get(key)
+            if previous is None:
+                changeset.created.append(key)
+            elif previous != (PriceCrawlerService._content_hash(dto), True):
+                changeset.updated.append(key)
+            else:
+                changeset.unchanged_count += 1
+                continue
+            changed.append(dto)
+
+        for batch in iter_chunks(changed, batch_size):
+            PriceCrawlerService._save_batch(batch)
+
+        changeset.deactivated = [
+            key for key, (_, is_active) in existing.items() if is_active and key not in offers
+        ]
+        with transaction.atomic():
+            PriceCrawlerService._deactivate(changeset.deactivated)
+            PriceCatalogVersion.objects.create(
+                provider=Provider.AWS,
+                offer_version=version,
+                publication_date=publication_date,
+                regions=regions,
+                created_count=len(changeset.created),
+                updated_count=len(changeset.updated),
+                deactivated_count=len(changeset.deactivated),
+            )
+            transaction.on_commit(
+                lambda: catalog_refreshed.send(sender=PriceCrawlerService, changeset=changeset)
+            )
+
+        logger.info(
+            f"AWS 가격표 델타 반영 version={version} created={len(changeset.created)} "
+            f"updated={len(changeset.updated)} deactivated={len(changeset.deactivated)} "
+            f"unchanged={changeset.unchanged_count}"
+        )
+        return changeset
+
+    @staticmethod
+    def _aws_regions() -> List[str]:
+        return sorted(REGION_REGISTRY.regions_for(Provider.AWS))
+
+    @staticmethod
+    def _content_hash(dto: CloudServiceDTO) -> str:
+        """가격/스펙 필드 기준 내용 해시 (DB 정밀도에 맞춰 정규화)"""
+        payload = "|".join(
+            [
+                str(dto.vcpu),
+                f"{dto.memory_gb:.2f}",
+                str(dto.storage_gb or ""),
+                dto.currency,
+                f"{dto.price_per_hour:.4f}",
+                dto.pricing_source,
+            ]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _deactivate(keys: List[CatalogKey]):
+        """가격표에서 사라진 상품 비활성화"""
+        for batch in iter_chunks(keys, PriceCrawlerService.BATCH_SIZE):
+            # 배치마다 UPDATE 한 번 (상품 키 조건을 OR로 묶음)
+            condition = reduce(
+                operator.or_,
+                (
+                    Q(instance_type=instance_type, region=region, pricing_model=pricing_model)
+                    for instance_type, region, pricing_model in batch
+                ),
+            )
+            CloudService.objects.filter(condition, provider=Provider.AWS).update(
+                is_active=False, updated_at=timezone.now()
+            )
+
+    @staticmethod
+    def _save_batch(dtos: List[CloudServiceDTO]) -> int:
+        """배치 upsert (unique_cloud_service 기준, 배치 내 중복은 최저가 사용)"""
+        today = timezone.now().date()
+        unique: Dict[Tuple[str, str, str, str], CloudService] = {}
+        for dto in dtos:
+            key = (dto.provider, dto.instance_type, dto.region, dto.pricing_model)
+            existing = unique.get(key)
+            if existing is not None and existing.price_per_hour <= dto.price_per_hour:
+                continue
+            unique[key] = CloudService(
+                provider=dto.provider,
+                instance_type=dto.instance_type,
+                region=dto.region,
+                region_normalized=normalize_region(dto.region, dto.provider),
+                vcpu=dto.vcpu,
+                memory_gb=dto.memory_gb,
+                storage_gb=dto.storage_gb,
+                currency=dto.currency,
+                price_per_hour=dto.price_per_hour,
+                pricing_model=dto.pricing_model,
+                pricing_source=dto.pricing_source,
+                confidence_level=ConfidenceLevel.HIGH,
+                last_verified_at=today,
+                is_active=True,
+                content_hash=PriceCrawlerService._content_hash(dto),
+            )
+
+        with transaction.atomic():
+            CloudService.objects.bulk_create(
+                unique.values(),
+                update_conflicts=True,
+                unique_fields=["provider", "instance_type", "region", "pricing_model"],
+                update_fields=PriceCrawlerService.UPDATE_FIELDS,
+            )
+        return len(unique)
@@ -0,0 +1,14 @@
+from django.dispatch import Signal, receiver
+
+from apps.costs.services.price_comparison_service import PriceComparisonService
+
+# 가격표 델타 반영이 커밋된 뒤 발송
+# kwargs: changeset (CatalogChangesetDTO)
+catalog_refreshed = Signal()
+
+
+@receiver(catalog_refreshed)
+def refresh_price_comparisons(sender, changeset, **kwargs):
+    """가격표가 바뀌면 provider 간 가격 비교 뷰 재계산"""
+    if changeset.has_changes:
+        PriceComparisonService.refresh()
@@ -1,3 +1,230 @@
+import json
+import tempfile
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from apps.costs.choices import PricingModel, PricingSource
+from apps.costs.models import CloudService, PriceCatalogVersion, PriceComparison
+from apps.costs.services.price_comparison_service import PriceComparisonService
+from apps.costs.services.price_crawler_service import PriceCrawlerService
+from apps.costs.signals import catalog_refreshed
+
+User = get_user_model()
+
+OFFER_FIXTURE = Path(__file__).parent / "testdata" / "aws_ec2_offer_sample.json"
+
+
+class PriceCrawlerServiceTest(TestCase):
+    """AWS offer file 스트리밍 크롤링 테스트"""
+
+    def test_crawl_filters_region_and_os(self):
+        result = PriceCrawlerService.crawl_aws(
+            source=str(OFFER_FIXTURE), regions=["us-east-1", "ap-northeast-2"], batch_size=2
+        )
+
+        # Linux + Shared + On-Demand 만 적재 (Windows, Dedicated, 다른 리전, 스토리지 제외)
+        self.assertEqual(result.matched, 4)
+        self.assertEqual(CloudService.objects.count(), 4)
+        service = CloudService.objects.get(instance_type="t3.medium", region="ap-northeast-2")
+        self.assertEqual(service.region_normalized, "KR")
+        self.assertEqual(service.price_per_hour, Decimal("0.0520"))
+        self.assertEqual(service.memory_gb, Decimal("4.00"))
+        self.assertEqual(
+            CloudService.objects.get(instance_type="x2iedn.metal").memory_gb, Decimal("4096.00")
+        )
+        # 전체 재기록도 가격표 반영 이력을 남김 (진단 지문의 가격표 버전)
+        version = PriceCatalogVersion.objects.get()
+        self.assertEqual(version.updated_count, 4)
+        self.assertEqual(version.regions, ["ap-northeast-2", "us-east-1"])
+
+    def test_recrawl_updates_in_place(self):
+        PriceCrawlerService.crawl_aws(source=str(OFFER_FIXTURE), regions=["us-east-1"])
+        PriceCrawlerService.crawl_aws(source=str(OFFER_FIXTURE), regions=["us-east-1"])
+
+        self.assertEqual(CloudService.objects.filter(region="us-east-1").count(), 2)
+
+
+class PriceCatalogRefreshTest(TestCase):
+    """가격표 버전/내용 해시 기반 델타 반영 테스트"""
+
+    REGIONS = ["us-east-1", "ap-northeast-2"]
+
+    def setUp(self):
+        self.offer = json.loads(OFFER_FIXTURE.read_text())
+        self.changesets = []
+        catalog_refreshed.connect(self._on_refreshed)
+        self.addCleanup(catalog_refreshed.disconnect, self._on_refreshed)
+
+    def _on_refreshed(self, sender, changeset, **kwargs):
+        self.changesets.append(changeset)
+
+    def _refresh(self, regions=None, **kwargs):
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(self.offer, f)
+        self.addCleanup(Path(f.name).unlink)
+        with self.captureOnCommitCallbacks(execute=True):
+            return PriceCrawlerService.refresh_aws(
+                source=f.name, regions=regions or self.REGIONS, **kwargs
+            )
+
+    def test_same_version_is_skipped(self):
+        first = self._refresh()
+        second = self._refresh()
+
+        self.assertEqual(len(first.created), 4)
+        self.assertTrue(second.skipped)
+        self.assertEqual(PriceCatalogVersion.objects.count(), 1)
+        self.assertEqual(len(self.changesets), 1)
+
+    def test_only_changed_rows_are_written(self):
+        self._refresh()
+        self.offer["version"] = "20261101000000"
+        self.offer["terms"]["OnDemand"]["SKU1"]["SKU1.JRTCKXETXF"]["priceDimensions"][
+            "SKU1.JRTCKXETXF.6YS6EN2CT7"
+        ]["pricePerUnit"]["USD"] = "0.0400000000"
+        # m5.xlarge(SKU2)가 가격표에서 빠짐
+        del self.offer["products"]["SKU2"]
+
+        changeset = self._refresh()
+
+        self.assertEqual(changeset.created, [])
+        self.assertEqual(changeset.updated, [("t3.medium", "us-east-1", "ON_DEMAND")])
+        self.assertEqual(changeset.deactivated, [("m5.xlarge", "us-east-1", "ON_DEMAND")])
+        self.assertEqual(changeset.unchanged_count, 2)
+        self.assertEqual(changeset.affected_regions, {"us-east-1"})
+        self.assertIs(self.changesets[-1], changeset)
+        self.assertEqual(
+            CloudService.objects.get(instance_type="t3.medium", region="us-east-1").price_per_hour,
+            Decimal("0.0400"),
+        )
+        self.assertFalse(CloudService.objects.get(instance_type="m5.xlarge").is_active)
+
+    def test_subset_refresh_does_not_skip_full_refresh(self):
+        subset = self._refresh(regions=["us-east-1"])
+        full = self._refresh()
+
+        self.assertEqual(len(subset.created), 2)
+        self.assertFalse(full.skipped)
+        self.assertEqual(len(full.created), 2)
+        self.assertEqual(CloudService.objects.filter(region="ap-northeast-2").count(), 2)
+        self.assertTrue(self._refresh().skipped)
+
+    def test_force_refresh_without_changes(self):
+        self._refresh()
+        changeset = self._refresh(force=True)
+
+        self.assertFalse(changeset.skipped)
+        self.assertFalse(changeset.has_changes)
+        self.assertEqual(changeset.unchanged_count, 4)
+
+    def test_duplicate_offers_keep_lowest_price(self):
+        # 같은 상품(t3.medium, us-east-1)이 더 싼 SKU로 한 번 더 나옴
+        self.offer["products"]["SKU1B"] = {
+            **self.offer["products"]["SKU1"],
+            "sku": "SKU1B",
+        }
+        term = json.loads(
+            json.dumps(self.offer["terms"]["OnDemand"]["SKU1"]).replace("SKU1", "SKU1B")
+        )
+        term["SKU1B.JRTCKXETXF"]["priceDimensions"]["SKU1B.JRTCKXETXF.6YS6EN2CT7"]["pricePerUnit"][
+            "USD"
+        ] = "0.0300000000"
+        self.offer["terms"]["OnDemand"]["SKU1B"] = term
+
+        first = self._refresh()
+        second = self._refresh(force=True)
+
+        self.assertEqual(len(first.created), 4)
+        self.assertEqual(
+            CloudService.objects.get(instance_type="t3.medium", region="us-east-1").price_per_hour,
+            Decimal("0.0300"),
+        )
+        # 저장된 행과 해시 비교 대상이 같으므로 다시 반영해도 변경 없음
+        self.assertEqual(second.updated, [])
+        self.assertEqual(second.unchanged_count, 4)
+
+    def test_deactivate_updates_once_per_batch(self):
+        self._refresh()
+        keys = [
+            ("t3.medium", "us-east-1", "ON_DEMAND"),
+            ("m5.xlarge", "us-east-1", "ON_DEMAND"),
+        ]
+
+        with self.assertNumQueries(1):
+            PriceCrawlerService._deactivate(keys)
+
+        self.assertEqual(CloudService.objects.filter(is_active=False).count(), 2)
+
+    def test_refresh_rebuilds_price_comparisons(self):
+        self._refresh()
+
+        services = CloudService.objects.filter(is_active=True, region_normalized__isnull=False)
+        self.assertEqual(PriceComparison.objects.count(), services.count())
+
+
+class PriceComparisonTest(TestCase):
+    """provider 간 가격 비교 뷰 / API 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        # 3.75GB / 4GB / 8GB - 앞의 둘은 같은 4GB 구간
+        self._service("AWS", "t3.medium", "us-east-1", "4", "0.0416")
+        self._service("AWS", "c5.large", "us-east-1", "4", "0.0850")
+        self._service("GCP", "n1-standard-2", "us-east1", "3.75", "0.0950")
+        self._service("AZURE", "B2s", "eastus", "4", "0.0400")
+        self._service("AWS", "t3.large", "us-east-1", "8", "0.0832")
+        self._service("AZURE", "B2s-old", "eastus", "4", "0.0100", is_active=False)
+        PriceComparisonService.refresh(concurrently=False)
+
+    def _service(self, provider, instance_type, region, memory_gb, price, is_active=True):
+        return CloudService.objects.create(
+            provider=provider,
+            instance_type=instance_type,
+            region=region,
+            region_normalized="US_EAST",
+            vcpu=2,
+            memory_gb=Decimal(memory_gb),
+            price_per_hour=Decimal(price),
+            pricing_model=PricingModel.ON_DEMAND,
+            pricing_source=PricingSource.AWS_API,
+            last_verified_at=date(2026, 10, 1),
+            is_active=is_active,
+        )
+
+    def test_cheapest_offer_per_provider(self):
+        response = self.client.get(
+            reverse("price-compare"), {"region": "US_EAST", "vcpu": 2, "memory_gb": "3.8"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["memory_bucket_gb"], Decimal("4.00"))
+        self.assertEqual(response.data["cheapest_provider"], "AZURE")
+        offers = [(offer["provider"], offer["instance_type"]) for offer in response.data["offers"]]
+        self.assertEqual(offers, [("AZURE", "B2s"), ("AWS", "t3.medium"), ("GCP", "n1-standard-2")])
+
+    def test_refresh_invalidates_cached_comparison(self):
+        PriceComparisonService.compare("US_EAST", 2, 8)
+        self._service("GCP", "e2-standard-2", "us-east1", "8", "0.0670")
+        PriceComparisonService.refresh()
+
+        comparison = PriceComparisonService.compare("US_EAST", 2, 8)
+
+        self.assertEqual(comparison.cheapest.instance_type, "e2-standard-2")
+
+    def test_unknown_spec_returns_404(self):
+        response = self.client.get(
+            reverse("price-compare"), {"region": "KR", "vcpu": 64, "memory_gb": "256"}
+        )
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 404)
@@ -1,3 +1,7 @@
 from django.urls import path
 
-urlpatterns = []
+from apps.costs.views import PriceCompareView
+
+urlpatterns = [
+    path("compare/", PriceCompareView.as_view(), name="price-compare"),
+]
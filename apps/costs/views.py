@@ -1,3 +1,26 @@
-from django.shortcuts import render
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from apps.costs.serializers import PriceCompareQuerySerializer
+from apps.costs.services.price_comparison_service import PriceComparisonService
+
+
+class PriceCompareView(APIView):
+    """provider 간 동일 스펙 가격 비교 뷰"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        serializer = PriceCompareQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        comparison = PriceComparisonService.compare(
+            serializer.validated_data["region"],
+            serializer.validated_data["vcpu"],
+            serializer.validated_data["memory_gb"],
+            pricing_model=serializer.validated_data["pricing_model"],
+        )
+
+        return Response(comparison.to_dict(), status=status.HTTP_200_OK)
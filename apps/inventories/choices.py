@@ -0,0 +1,8 @@
+from django.db import models
+
+
+class UtilizationMetric(models.TextChoices):
+    """동기화하는 사용률 지표"""
+
+    CPU = "CPU", "CPU Utilization"
+    MEMORY = "MEMORY", "Memory Utilization"
@@ -0,0 +1,79 @@
+# Generated by Django 6.0 on 2026-10-18 10:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventories", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InventoryMetricState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[("CPU", "CPU Utilization"), ("MEMORY", "Memory Utilization")],
+                        help_text="지표 종류",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "last_datapoint_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="마지막으로 반영한 데이터 포인트 시각 (high-water mark)",
+                        null=True,
+                    ),
+                ),
+                (
+                    "window_sum",
+                    models.FloatField(default=0, help_text="윈도우 내 데이터 포인트 합"),
+                ),
+                (
+                    "window_count",
+                    models.IntegerField(default=0, help_text="윈도우 내 데이터 포인트 수"),
+                ),
+                (
+                    "window_max",
+                    models.FloatField(blank=True, help_text="윈도우 내 최댓값", null=True),
+                ),
+                (
+                    "hourly_buckets",
+                    models.JSONField(
+                        default=dict,
+                        help_text="시간 단위 집계 {epoch_hour: [sum, count, max, {1%구간: count}]}",
+                    ),
+                ),
+                (
+                    "inventory",
+                    models.ForeignKey(
+                        help_text="대상 인벤토리",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="metric_states",
+                        to="inventories.userinventory",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "inventory_metric_states",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("inventory", "metric"), name="unique_inventory_metric_state"
+                    )
+                ],
+            },
+        ),
+    ]
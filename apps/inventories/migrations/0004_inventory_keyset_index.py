@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 12:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventories", "0003_inventory_metric_state"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # (user, is_active)는 keyset 인덱스의 접두사로 대체
+        migrations.RemoveIndex(
+            model_name="userinventory",
+            name="user_invent_user_id_785fa2_idx",
+        ),
+        migrations.AddIndex(
+            model_name="userinventory",
+            index=models.Index(
+                fields=["user", "is_active", "-created_at", "-id"], name="inventory_user_keyset"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userinventory",
+            index=models.Index(
+                fields=["user", "is_active", "provider", "instance_type", "-created_at", "-id"],
+                name="inventory_user_type_keyset",
+            ),
+        ),
+    ]
@@ -0,0 +1,171 @@
+# Generated by Django 6.0 on 2026-10-18 13:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 파티션은 UtilizationStoreService.ensure_partitions가 쓰기 전에 필요한 범위만 만들고
+# apply_retention이 보관 기간이 지난 파티션을 DROP 합니다.
+# 인벤토리 FK 제약은 두지 않음 (삭제된 인벤토리 행은 보관 기간 후 파티션과 함께 정리)
+CREATE_TABLES = """
+CREATE TABLE utilization_points (
+    inventory_id bigint NOT NULL,
+    metric varchar(10) NOT NULL,
+    recorded_at timestamp with time zone NOT NULL,
+    value double precision NOT NULL,
+    PRIMARY KEY (inventory_id, metric, recorded_at)
+) PARTITION BY RANGE (recorded_at);
+
+CREATE TABLE utilization_hourly (
+    inventory_id bigint NOT NULL,
+    metric varchar(10) NOT NULL,
+    bucket_start timestamp with time zone NOT NULL,
+    avg_value double precision NOT NULL,
+    p95_value double precision NOT NULL,
+    max_value double precision NOT NULL,
+    sample_count integer NOT NULL,
+    PRIMARY KEY (inventory_id, metric, bucket_start)
+) PARTITION BY RANGE (bucket_start);
+
+CREATE TABLE utilization_daily (
+    inventory_id bigint NOT NULL,
+    metric varchar(10) NOT NULL,
+    bucket_start timestamp with time zone NOT NULL,
+    avg_value double precision NOT NULL,
+    p95_value double precision NOT NULL,
+    max_value double precision NOT NULL,
+    sample_count integer NOT NULL,
+    PRIMARY KEY (inventory_id, metric, bucket_start)
+) PARTITION BY RANGE (bucket_start);
+"""
+
+DROP_TABLES = """
+DROP TABLE IF EXISTS utilization_points;
+DROP TABLE IF EXISTS utilization_hourly;
+DROP TABLE IF EXISTS utilization_daily;
+"""
+
+
+def inventory_field():
+    return (
+        "inventory",
+        models.ForeignKey(
+            db_constraint=False,
+            help_text="대상 인벤토리",
+            on_delete=django.db.models.deletion.DO_NOTHING,
+            related_name="+",
+            to="inventories.userinventory",
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventories", "0004_inventory_keyset_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TABLES, DROP_TABLES),
+        migrations.CreateModel(
+            name="UtilizationDaily",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "inventory",
+                        "metric",
+                        "bucket_start",
+                        blank=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                inventory_field(),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[("CPU", "CPU Utilization"), ("MEMORY", "Memory Utilization")],
+                        help_text="지표 종류",
+                        max_length=10,
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField(help_text="집계 구간 시작 시각 (UTC)")),
+                ("avg_value", models.FloatField(help_text="평균 사용률 (%)")),
+                ("p95_value", models.FloatField(help_text="95 백분위 사용률 (%)")),
+                ("max_value", models.FloatField(help_text="최대 사용률 (%)")),
+                ("sample_count", models.IntegerField(help_text="집계한 데이터 포인트 수")),
+            ],
+            options={
+                "db_table": "utilization_daily",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="UtilizationHourly",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "inventory",
+                        "metric",
+                        "bucket_start",
+                        blank=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                inventory_field(),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[("CPU", "CPU Utilization"), ("MEMORY", "Memory Utilization")],
+                        help_text="지표 종류",
+                        max_length=10,
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField(help_text="집계 구간 시작 시각 (UTC)")),
+                ("avg_value", models.FloatField(help_text="평균 사용률 (%)")),
+                ("p95_value", models.FloatField(help_text="95 백분위 사용률 (%)")),
+                ("max_value", models.FloatField(help_text="최대 사용률 (%)")),
+                ("sample_count", models.IntegerField(help_text="집계한 데이터 포인트 수")),
+            ],
+            options={
+                "db_table": "utilization_hourly",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="UtilizationPoint",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "inventory",
+                        "metric",
+                        "recorded_at",
+                        blank=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                inventory_field(),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[("CPU", "CPU Utilization"), ("MEMORY", "Memory Utilization")],
+                        help_text="지표 종류",
+                        max_length=10,
+                    ),
+                ),
+                ("recorded_at", models.DateTimeField(help_text="데이터 포인트 시각")),
+                ("value", models.FloatField(help_text="사용률 (%)")),
+            ],
+            options={
+                "db_table": "utilization_points",
+                "managed": False,
+            },
+        ),
+    ]
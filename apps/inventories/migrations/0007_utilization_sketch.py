@@ -0,0 +1,58 @@
+# Generated by Django 6.0 on 2026-10-18 14:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventories", "0006_utilization_maintenance_schedule"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UtilizationSketch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[("CPU", "CPU Utilization"), ("MEMORY", "Memory Utilization")],
+                        help_text="지표 종류",
+                        max_length=10,
+                    ),
+                ),
+                ("day", models.DateField(help_text="집계 일자 (UTC)")),
+                ("sketch", models.BinaryField(help_text="DDSketch.to_bytes() 결과")),
+                (
+                    "sample_count",
+                    models.IntegerField(default=0, help_text="스케치에 반영한 데이터 포인트 수"),
+                ),
+                (
+                    "inventory",
+                    models.ForeignKey(
+                        help_text="대상 인벤토리",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="utilization_sketches",
+                        to="inventories.userinventory",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "utilization_sketches",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("inventory", "metric", "day"), name="unique_utilization_sketch"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventories", "0007_utilization_sketch"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="inventorymetricstate",
+            name="hourly_buckets",
+            field=models.JSONField(
+                default=dict, help_text="시간 단위 집계 {epoch_hour: [sum, count, max]}"
+            ),
+        ),
+    ]
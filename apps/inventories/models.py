@@ -1,8 +1,12 @@
+from datetime import datetime
+from typing import Iterable, Tuple
+
 from django.contrib.auth import get_user_model
 from django.db import models
 
 from apps.core.choices import NormalizedRegion, Provider
 from apps.core.models import BaseModel
+from apps.inventories.choices import UtilizationMetric
 
 User = get_user_model()
 
@@ -67,8 +71,16 @@ class UserInventory(BaseModel):
         db_table = "user_inventories"
         ordering = ["-created_at"]
         indexes = [
-            # 사용자별 활성 리소스 조회 최적화
-            models.Index(fields=["user", "is_active"]),
+            # 사용자별 활성 리소스 조회 + 목록 keyset 페이지네이션 (created_at, id 역순)
+            models.Index(
+                fields=["user", "is_active", "-created_at", "-id"], name="inventory_user_keyset"
+            ),
+            # provider + instance_type 필터 목록의 keyset 페이지네이션
+            # (provider만 / region 필터는 위 인덱스를 따라가며 행 단위로 거름)
+            models.Index(
+                fields=["user", "is_active", "provider", "instance_type", "-created_at", "-id"],
+                name="inventory_user_type_keyset",
+            ),
             # Provider + 인스턴스 타입 검색 최적화
             models.Index(fields=["provider", "instance_type"]),
             # 3사 비교 쿼리 최적화
@@ -95,5 +107,201 @@ class UserInventory(BaseModel):
     def is_under_utilized(self) -> bool | None:
         """과소 사용 여부(CPU 10% 미만)"""
         if self.cpu_usage_avg is not None:
-            return self.cpu_usage_avg > 10
+            return self.cpu_usage_avg < 10
         return None
+
+
+class InventoryMetricState(BaseModel):
+    """
+    리소스별 지표 동기화 상태
+
+    마지막으로 반영한 데이터 포인트 시각(high-water mark)과 최근 7일 시간 단위 집계를 보관해
+    다음 동기화 때 watermark 이후의 데이터 포인트만 조회하고 rolling 평균을 증분 갱신합니다.
+    """
+
+    WINDOW_HOURS = 24 * 7
+
+    inventory = models.ForeignKey(
+        UserInventory,
+        on_delete=models.CASCADE,
+        related_name="metric_states",
+        help_text="대상 인벤토리",
+    )
+    metric = models.CharField(
+        max_length=10, choices=UtilizationMetric.choices, help_text="지표 종류"
+    )
+    last_datapoint_at = models.DateTimeField(
+        null=True, blank=True, help_text="마지막으로 반영한 데이터 포인트 시각 (high-water mark)"
+    )
+
+    # 7일 rolling 집계
+    window_sum = models.FloatField(default=0, help_text="윈도우 내 데이터 포인트 합")
+    window_count = models.IntegerField(default=0, help_text="윈도우 내 데이터 포인트 수")
+    window_max = models.FloatField(null=True, blank=True, help_text="윈도우 내 최댓값")
+    hourly_buckets = models.JSONField(
+        default=dict,
+        help_text="시간 단위 집계 {epoch_hour: [sum, count, max]}",
+    )
+
+    class Meta:
+        db_table = "inventory_metric_states"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["inventory", "metric"], name="unique_inventory_metric_state"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.inventory_id} - {self.metric} (~{self.last_datapoint_at})"
+
+    @property
+    def average(self) -> float | None:
+        """최근 7일 평균"""
+        if not self.window_count:
+            return None
+        return self.window_sum / self.window_count
+
+    def add_datapoints(self, points: Iterable[Tuple[datetime, float]], now: datetime) -> int:
+        """
+        watermark 이후의 데이터 포인트만 시간 버킷에 반영하고 윈도우 밖 버킷을 제거
+
+        Returns:
+            새로 반영한 데이터 포인트 수
+        """
+        added = 0
+        for timestamp, value in points:
+            if self.last_datapoint_at and timestamp <= self.last_datapoint_at:
+                continue
+            key = str(int(timestamp.timestamp()) // 3600)
+            bucket = self.hourly_buckets.setdefault(key, [0.0, 0, value])
+            bucket[0] += value
+            bucket[1] += 1
+            bucket[2] = max(bucket[2], value)
+
+            self.window_sum += value
+            self.window_count += 1
+            if self.last_datapoint_at is None or timestamp > self.last_datapoint_at:
+                self.last_datapoint_at = timestamp
+            added += 1
+
+        self._expire_buckets(now)
+        return added
+
+    def _expire_buckets(self, now: datetime):
+        """윈도우(7일)를 벗어난 버킷을 빼면서 합계/개수를 증분 차감"""
+        oldest = int(now.timestamp()) // 3600 - self.WINDOW_HOURS
+        for key in [k for k in self.hourly_buckets if int(k) <= oldest]:
+            bucket_sum, bucket_count, _ = self.hourly_buckets.pop(key)
+            self.window_sum -= bucket_sum
+            self.window_count -= bucket_count
+
+        if self.window_count <= 0:
+            self.window_sum, self.window_count = 0.0, 0
+        self.window_max = max((b[2] for b in self.hourly_buckets.values()), default=None)
+
+
+class UtilizationPoint(models.Model):
+    """
+    사용률 원본 데이터 포인트 (CloudWatch 5분 단위)
+
+    Postgres 테이블은 recorded_at 기준 일 단위 range partition이며 (0005 마이그레이션)
+    보관 기간이 지난 파티션은 UtilizationStoreService.apply_retention이 통째로 DROP 합니다.
+    인벤토리가 삭제되어도 행은 보관 기간 동안 남았다가 파티션과 함께 정리됩니다.
+    """
+
+    pk = models.CompositePrimaryKey("inventory", "metric", "recorded_at")
+    inventory = models.ForeignKey(
+        UserInventory,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        help_text="대상 인벤토리",
+    )
+    metric = models.CharField(
+        max_length=10, choices=UtilizationMetric.choices, help_text="지표 종류"
+    )
+    recorded_at = models.DateTimeField(help_text="데이터 포인트 시각")
+    value = models.FloatField(help_text="사용률 (%)")
+
+    class Meta:
+        managed = False
+        db_table = "utilization_points"
+
+    def __str__(self):
+        return f"{self.inventory_id} - {self.metric} {self.recorded_at}: {self.value}"
+
+
+class UtilizationRollup(models.Model):
+    """사용률 다운샘플 집계 공통 필드 (원본 포인트에서 계산)"""
+
+    pk = models.CompositePrimaryKey("inventory", "metric", "bucket_start")
+    inventory = models.ForeignKey(
+        UserInventory,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        help_text="대상 인벤토리",
+    )
+    metric = models.CharField(
+        max_length=10, choices=UtilizationMetric.choices, help_text="지표 종류"
+    )
+    bucket_start = models.DateTimeField(help_text="집계 구간 시작 시각 (UTC)")
+    avg_value = models.FloatField(help_text="평균 사용률 (%)")
+    p95_value = models.FloatField(help_text="95 백분위 사용률 (%)")
+    max_value = models.FloatField(help_text="최대 사용률 (%)")
+    sample_count = models.IntegerField(help_text="집계한 데이터 포인트 수")
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f"{self.inventory_id} - {self.metric} {self.bucket_start}: p95 {self.p95_value}"
+
+
+class UtilizationHourly(UtilizationRollup):
+    """시간 단위 집계 (월 단위 range partition)"""
+
+    class Meta:
+        managed = False
+        db_table = "utilization_hourly"
+
+
+class UtilizationDaily(UtilizationRollup):
+    """일 단위 집계 (연 단위 range partition)"""
+
+    class Meta:
+        managed = False
+        db_table = "utilization_daily"
+
+
+class UtilizationSketch(BaseModel):
+    """
+    리소스/지표/일자별 분위수 스케치 (DDSketch 직렬화)
+
+    CloudWatch 동기화 때 새 데이터 포인트만 그날 스케치에 더하고,
+    최근 N일 백분위는 일자별 스케치를 병합해 계산하므로 원본 이력을 읽지 않습니다.
+    """
+
+    inventory = models.ForeignKey(
+        UserInventory,
+        on_delete=models.CASCADE,
+        related_name="utilization_sketches",
+        help_text="대상 인벤토리",
+    )
+    metric = models.CharField(
+        max_length=10, choices=UtilizationMetric.choices, help_text="지표 종류"
+    )
+    day = models.DateField(help_text="집계 일자 (UTC)")
+    sketch = models.BinaryField(help_text="DDSketch.to_bytes() 결과")
+    sample_count = models.IntegerField(default=0, help_text="스케치에 반영한 데이터 포인트 수")
+
+    class Meta:
+        db_table = "utilization_sketches"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["inventory", "metric", "day"], name="unique_utilization_sketch"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.inventory_id} - {self.metric} {self.day} ({self.sample_count})"
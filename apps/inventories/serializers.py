@@ -0,0 +1,61 @@
+from rest_framework import serializers
+
+from apps.core.choices import NormalizedRegion, Provider
+from apps.inventories.models import UserInventory
+
+
+class InventoryListQuerySerializer(serializers.Serializer):
+    """인벤토리 목록 조회 조건"""
+
+    provider = serializers.ChoiceField(choices=Provider.choices, required=False)
+    instance_type = serializers.CharField(max_length=50, required=False)
+    region_normalized = serializers.ChoiceField(choices=NormalizedRegion.choices, required=False)
+    is_active = serializers.BooleanField(default=True)
+    fields = serializers.CharField(required=False, help_text="응답 필드 (콤마 구분)")
+
+    def validate_fields(self, value):
+        fields = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = set(fields) - set(InventoryListSerializer.Meta.fields)
+        if unknown:
+            raise serializers.ValidationError(f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+        return fields
+
+    def validate(self, attrs):
+        # (provider, instance_type) 인덱스를 타도록 instance_type은 provider와 함께만 허용
+        if attrs.get("instance_type") and not attrs.get("provider"):
+            raise serializers.ValidationError(
+                {"instance_type": "instance_type 필터는 provider와 함께 사용해야 합니다."}
+            )
+        return attrs
+
+
+class InventoryListSerializer(serializers.ModelSerializer):
+    """인벤토리 목록 시리얼라이저 (fields 인자로 응답 필드 선택)"""
+
+    class Meta:
+        model = UserInventory
+        fields = [
+            "id",
+            "provider",
+            "resource_id",
+            "instance_type",
+            "region",
+            "region_normalized",
+            "vcpu",
+            "memory_gb",
+            "storage_gb",
+            "cpu_usage_avg",
+            "memory_usage_avg",
+            "current_monthly_cost",
+            "currency",
+            "is_active",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
@@ -0,0 +1,315 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.adapters.aws_adapter import MAX_METRIC_QUERIES, AWSAdapter
+from apps.core.choices import Provider
+from apps.core.dto.inventory_dto import CloudWatchSyncResultDTO
+from apps.core.exceptions.cloud_exception import CloudWatchConnectionError
+from apps.core.utils.parsers import iter_chunks
+from apps.core.utils.rate_limiter import TokenBucketRateLimiter
+from apps.inventories.choices import UtilizationMetric
+from apps.inventories.models import InventoryMetricState, UserInventory
+from apps.inventories.services.inventory_upsert_service import InventoryUpsertService
+from apps.inventories.services.utilization_sketch_service import UtilizationSketchService
+from apps.inventories.services.utilization_store_service import (
+    UtilizationRow,
+    UtilizationStoreService,
+)
+from apps.users.models import CloudCredential
+
+logger = logging.getLogger(__name__)
+
+# {instance_id: {adapter_metric_key: [(timestamp, value), ...]}}
+SeriesByInstance = Dict[str, Dict[str, List[Tuple[datetime, float]]]]
+
+
+class CloudWatchSyncService:
+    """
+    CloudWatch 사용률 지표 동기화
+
+    사용자의 AWS 계정(CloudCredential) x 리전 조합을 스레드 풀에서 병렬로 조회하고,
+    결과를 UserInventory.cpu_usage_avg / memory_usage_avg에 벌크 upsert 합니다.
+    리소스별 watermark(InventoryMetricState) 이후의 데이터 포인트만 조회하고
+    7일 rolling 평균은 증분으로 갱신합니다. 원본 5분 포인트는 UtilizationStoreService에
+    저장하고, 같은 포인트를 일자별 분위수 스케치(UtilizationSketch)에도 더합니다.
+    DB 접근은 메인 스레드에서만 하고, 워커 스레드는 CloudWatch 호출만 담당합니다.
+    """
+
+    MAX_WORKERS = 8
+    # 계정당 초당 GetMetricData 호출 수 (계정의 여러 리전이 나눠 씀)
+    REQUESTS_PER_SECOND = 10
+    PERIOD_SECONDS = 300
+    WINDOW = timedelta(hours=InventoryMetricState.WINDOW_HOURS)
+
+    # 지표 -> (AWSAdapter 지표 키, UserInventory 필드)
+    METRICS = {
+        UtilizationMetric.CPU: ("cpu_avg", "cpu_usage_avg"),
+        UtilizationMetric.MEMORY: ("memory_avg", "memory_usage_avg"),
+    }
+    ADAPTER_KEYS = [adapter_key for adapter_key, _ in METRICS.values()]
+    UPDATE_FIELDS = [field for _, field in METRICS.values()]
+    # 한 번의 GetMetricData 호출에 담기는 인스턴스 수
+    INSTANCES_PER_CALL = MAX_METRIC_QUERIES // len(METRICS)
+
+    @staticmethod
+    def sync_user(user, max_workers: int = MAX_WORKERS) -> CloudWatchSyncResultDTO:
+        """
+        사용자의 활성 AWS 인벤토리 사용률을 CloudWatch에서 증분 갱신
+
+        Args:
+            user: 동기화 대상 사용자
+            max_workers: 동시에 조회할 (계정, 리전) 조합 수
+
+        Returns:
+            CloudWatchSyncResultDTO
+        """
+        result = CloudWatchSyncResultDTO()
+        now = timezone.now()
+
+        credentials = [
+            credential
+            for credential in CloudCredential.objects.filter(
+                user=user, provider=Provider.AWS, is_active=True
+            ).select_related("user")
+            if credential.has_valid_credentials
+        ]
+        inventories = list(
+            UserInventory.objects.filter(user=user, provider=Provider.AWS, is_active=True)
+        )
+        if not credentials or not inventories:
+            return result
+
+        states = CloudWatchSyncService._load_states(user, inventories)
+
+        # 리전별 (instance_id, 조회 시작 시각) 목록
+        requests_by_region: Dict[str, List[Tuple[str, datetime]]] = defaultdict(list)
+        for inventory in inventories:
+            start_time = CloudWatchSyncService._start_time(inventory, states, now)
+            requests_by_region[inventory.region].append((inventory.resource_id, start_time))
+
+        # 어떤 계정이 어떤 리소스를 소유하는지 모르므로 계정 x 리전 전체를 조회하고
+        # 데이터가 돌아온 계정의 값을 사용
+        pairs = [
+            (credential, region) for credential in credentials for region in requests_by_region
+        ]
+        limiters = {
+            credential.pk: TokenBucketRateLimiter(CloudWatchSyncService.REQUESTS_PER_SECOND)
+            for credential in credentials
+        }
+        result.pairs_total = len(pairs)
+        result.instances_requested = len(inventories)
+
+        series: SeriesByInstance = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    CloudWatchSyncService._fetch_pair,
+                    credential,
+                    region,
+                    requests_by_region[region],
+                    now,
+                    limiters[credential.pk],
+                ): (credential, region)
+                for credential, region in pairs
+            }
+            for future in as_completed(futures):
+                credential, region = futures[future]
+                try:
+                    CloudWatchSyncService._merge(series, future.result())
+                except Exception as e:
+                    # 한 조합의 실패(연결, 자격 증명, 잘못된 리전 등)가 다른 조합 결과를 버리지 않게 함
+                    detail = e.detail if isinstance(e, CloudWatchConnectionError) else str(e)
+                    result.pairs_failed += 1
+                    result.errors.append(f"{credential} / {region}: {detail}")
+                    logger.warning(f"CloudWatch 동기화 실패 {credential} / {region}: {detail}")
+
+        # watermark가 갱신되기 전에 새 포인트만 추림 (스케치는 중복 포인트를 두 번 셈)
+        rows = CloudWatchSyncService._points(inventories, states, series)
+        updated_inventories, updated_states = CloudWatchSyncService._apply(
+            inventories, states, series, now
+        )
+        result.instances_synced = len({row[0] for row in rows})
+        if updated_states:
+            CloudWatchSyncService._save_states(updated_states)
+        if rows:
+            UtilizationStoreService.record(rows)
+            UtilizationSketchService.update(rows, now)
+        if updated_inventories:
+            result.upsert = InventoryUpsertService.bulk_upsert(
+                updated_inventories, update_fields=CloudWatchSyncService.UPDATE_FIELDS
+            )
+        return result
+
+    @staticmethod
+    def _load_states(
+        user, inventories: List[UserInventory]
+    ) -> Dict[Tuple[int, str], InventoryMetricState]:
+        """인벤토리별 지표 상태를 한 번에 조회 (없으면 새 객체)"""
+        states = {
+            (state.inventory_id, state.metric): state
+            for state in InventoryMetricState.objects.filter(
+                inventory__user=user, inventory__provider=Provider.AWS
+            )
+        }
+        for inventory in inventories:
+            for metric in CloudWatchSyncService.METRICS:
+                states.setdefault(
+                    (inventory.pk, metric),
+                    InventoryMetricState(inventory=inventory, metric=metric),
+                )
+        return states
+
+    @staticmethod
+    def _start_time(
+        inventory: UserInventory,
+        states: Dict[Tuple[int, str], InventoryMetricState],
+        now: datetime,
+    ) -> datetime:
+        """
+        조회 시작 시각 = 지표 watermark 중 가장 오래된 값 (없으면 7일 전)
+
+        지표마다 watermark가 다르므로 가장 이른 시각부터 조회하고, 이미 반영한 포인트는
+        지표별로 add_datapoints/_points에서 걸러냅니다. CWAgent가 없는 인스턴스는
+        memory watermark가 영영 비어 있으므로 비어 있는 watermark는 기준에서 제외합니다.
+        같은 시간대 인스턴스끼리 한 번에 조회되도록 정시 단위로 내림합니다.
+        """
+        oldest = now - CloudWatchSyncService.WINDOW
+        watermarks = [
+            states[(inventory.pk, metric)].last_datapoint_at
+            for metric in CloudWatchSyncService.METRICS
+        ]
+        watermarks = [w for w in watermarks if w is not None and w > oldest]
+        start_time = min(watermarks) if watermarks else oldest
+        return start_time.replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def _fetch_pair(
+        credential: CloudCredential,
+        region: str,
+        requests: List[Tuple[str, datetime]],
+        end_time: datetime,
+        rate_limiter: TokenBucketRateLimiter,
+    ) -> SeriesByInstance:
+        """(계정, 리전) 하나를 조회 — 워커 스레드에서 실행, Session/Client는 조합당 1개"""
+        adapter = AWSAdapter(
+            credential.aws_access_key_id,
+            credential.aws_secret_access_key,
+            region,
+            rate_limiter=rate_limiter,
+        )
+
+        # GetMetricData는 호출당 StartTime이 하나이므로 시작 시각이 같은 인스턴스끼리 묶음
+        by_start: Dict[datetime, List[str]] = defaultdict(list)
+        for instance_id, start_time in requests:
+            by_start[start_time].append(instance_id)
+
+        series: SeriesByInstance = {}
+        for start_time, instance_ids in by_start.items():
+            for chunk in iter_chunks(instance_ids, CloudWatchSyncService.INSTANCES_PER_CALL):
+                series.update(
+                    adapter.get_metric_series_batch(
+                        chunk,
+                        start_time,
+                        end_time,
+                        period=CloudWatchSyncService.PERIOD_SECONDS,
+                        metric_keys=CloudWatchSyncService.ADAPTER_KEYS,
+                    )
+                )
+        return series
+
+    @staticmethod
+    def _merge(target: SeriesByInstance, source: SeriesByInstance):
+        """데이터 포인트가 실제로 조회된 인스턴스만 병합 (다른 계정의 빈 결과로 덮어쓰지 않음)"""
+        for instance_id, metrics in source.items():
+            if any(metrics.values()):
+                target.setdefault(instance_id, metrics)
+
+    @staticmethod
+    def _apply(
+        inventories: List[UserInventory],
+        states: Dict[Tuple[int, str], InventoryMetricState],
+        series: SeriesByInstance,
+        now: datetime,
+    ) -> Tuple[List[UserInventory], List[InventoryMetricState]]:
+        """
+        새 데이터 포인트를 지표 상태에 반영하고 인벤토리 평균값을 갱신
+
+        새 포인트가 없는 리소스도 윈도우를 벗어난 버킷은 빠져야 하므로 모든 상태를 갱신합니다.
+
+        Returns:
+            (평균값이 바뀐 인벤토리, 저장할 지표 상태)
+        """
+        updated_inventories = []
+        updated_states = []
+        for inventory in inventories:
+            metrics = series.get(inventory.resource_id) or {}
+            changed = False
+            for metric, (adapter_key, field) in CloudWatchSyncService.METRICS.items():
+                state = states[(inventory.pk, metric)]
+                added = state.add_datapoints(metrics.get(adapter_key, []), now)
+                # 데이터가 한 번도 없었던 지표는 빈 상태를 만들지 않음
+                if state.pk is None and not added:
+                    continue
+                state.updated_at = now
+                updated_states.append(state)
+                average = CloudWatchSyncService._to_percent(state.average)
+                if getattr(inventory, field) != average:
+                    setattr(inventory, field, average)
+                    changed = True
+            if changed:
+                updated_inventories.append(inventory)
+        return updated_inventories, updated_states
+
+    @staticmethod
+    def _points(
+        inventories: List[UserInventory],
+        states: Dict[Tuple[int, str], InventoryMetricState],
+        series: SeriesByInstance,
+    ) -> List[UtilizationRow]:
+        """조회한 데이터 포인트 중 watermark 이후 것만 시계열 저장소 행으로 변환"""
+        rows = []
+        for inventory in inventories:
+            metrics = series.get(inventory.resource_id)
+            if not metrics:
+                continue
+            for metric, (adapter_key, _) in CloudWatchSyncService.METRICS.items():
+                watermark = states[(inventory.pk, metric)].last_datapoint_at
+                rows.extend(
+                    (inventory.pk, metric, timestamp, value)
+                    for timestamp, value in metrics.get(adapter_key, [])
+                    if watermark is None or timestamp > watermark
+                )
+        return rows
+
+    @staticmethod
+    def _save_states(states: List[InventoryMetricState]):
+        """신규 상태는 bulk_create, 기존 상태는 bulk_update"""
+        new_states = [state for state in states if state.pk is None]
+        existing_states = [state for state in states if state.pk is not None]
+        with transaction.atomic():
+            InventoryMetricState.objects.bulk_create(new_states, batch_size=1000)
+            InventoryMetricState.objects.bulk_update(
+                existing_states,
+                fields=[
+                    "last_datapoint_at",
+                    "window_sum",
+                    "window_count",
+                    "window_max",
+                    "hourly_buckets",
+                    "updated_at",
+                ],
+                batch_size=1000,
+            )
+
+    @staticmethod
+    def _to_percent(value: Optional[float]) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(str(round(value, 2)))
@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from django.db.models import QuerySet
+
+from apps.inventories.models import UserInventory
+
+
+class InventoryQueryService:
+    """인벤토리 목록 조회"""
+
+    # keyset 커서를 만들 때 항상 필요한 컬럼
+    CURSOR_FIELDS = ("id", "created_at")
+
+    @staticmethod
+    def list_for_user(
+        user,
+        is_active: bool = True,
+        provider: Optional[str] = None,
+        instance_type: Optional[str] = None,
+        region_normalized: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> QuerySet:
+        """
+        사용자 인벤토리 목록 QuerySet (정렬/페이지네이션은 KeysetPagination이 담당)
+
+        Args:
+            fields: 응답에 필요한 필드 - 지정하면 해당 컬럼만 SELECT
+        """
+        queryset = UserInventory.objects.filter(user=user, is_active=is_active)
+        if provider:
+            queryset = queryset.filter(provider=provider)
+            if instance_type:
+                queryset = queryset.filter(instance_type=instance_type)
+        if region_normalized:
+            queryset = queryset.filter(region_normalized=region_normalized)
+        if fields:
+            queryset = queryset.only(*InventoryQueryService.CURSOR_FIELDS, *fields)
+        return queryset
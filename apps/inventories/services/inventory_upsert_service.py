@@ -0,0 +1,121 @@
+import logging
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.core.dto.inventory_dto import InventoryUpsertResultDTO
+from apps.core.utils.parsers import iter_chunks
+from apps.inventories.models import UserInventory
+
+logger = logging.getLogger(__name__)
+
+
+class InventoryUpsertService:
+    """
+    UserInventory 벌크 upsert
+
+    unique_user_resource(user, provider, resource_id) 제약을 기준으로
+    PostgreSQL INSERT ... ON CONFLICT DO UPDATE 한 번에 배치 전체를 반영합니다.
+    값이 실제로 바뀐 행만 UPDATE 되므로 재업로드 시 불필요한 쓰기가 발생하지 않습니다.
+    """
+
+    BATCH_SIZE = 1000
+    CONFLICT_FIELDS = ("user", "provider", "resource_id")
+
+    @staticmethod
+    def bulk_upsert(
+        inventories: Iterable[UserInventory],
+        update_fields: Sequence[str],
+        batch_size: int = BATCH_SIZE,
+    ) -> InventoryUpsertResultDTO:
+        """
+        저장되지 않은 UserInventory 객체들을 배치 단위로 upsert
+
+        Args:
+            inventories: 저장할 UserInventory 인스턴스 (pk 불필요)
+            update_fields: 충돌(이미 존재) 시 갱신할 필드명
+            batch_size: 한 번의 INSERT 문에 담을 행 수
+
+        Returns:
+            InventoryUpsertResultDTO (inserted / updated / unchanged 건수)
+        """
+        if not update_fields:
+            raise ValueError("update_fields는 최소 1개 이상이어야 합니다.")
+
+        fields = [f for f in UserInventory._meta.concrete_fields if not f.primary_key]
+        field_names = {f.name for f in fields}
+        unknown = set(update_fields) - field_names
+        if unknown or set(update_fields) & set(InventoryUpsertService.CONFLICT_FIELDS):
+            raise ValueError(f"갱신할 수 없는 필드: {sorted(update_fields)}")
+
+        sql = InventoryUpsertService._build_sql(fields, update_fields)
+        result = InventoryUpsertResultDTO()
+        for batch in iter_chunks(inventories, batch_size):
+            result.merge(InventoryUpsertService._upsert_batch(sql, fields, batch))
+
+        logger.info(
+            f"UserInventory upsert 완료 inserted={result.inserted} "
+            f"updated={result.updated} unchanged={result.unchanged}"
+        )
+        return result
+
+    @staticmethod
+    def _build_sql(fields: List, update_fields: Sequence[str]) -> str:
+        """INSERT ... ON CONFLICT DO UPDATE ... RETURNING 문 생성 (VALUES 자리는 %s로 남김)"""
+        qn = connection.ops.quote_name
+        by_name = {f.name: f for f in fields}
+
+        columns = ", ".join(qn(f.column) for f in fields)
+        conflict = ", ".join(
+            qn(by_name[name].column) for name in InventoryUpsertService.CONFLICT_FIELDS
+        )
+
+        compared = [qn(by_name[name].column) for name in update_fields if name != "updated_at"]
+        assignments = [f"{col} = EXCLUDED.{col}" for col in compared]
+        assignments.append(f"{qn('updated_at')} = EXCLUDED.{qn('updated_at')}")
+
+        target_values = ", ".join(f"t.{col}" for col in compared)
+        excluded_values = ", ".join(f"EXCLUDED.{col}" for col in compared)
+
+        # xmax = 0 이면 새로 INSERT 된 행, 아니면 UPDATE 된 행
+        # WHERE 조건에 걸려 갱신되지 않은 행은 RETURNING 되지 않음 → unchanged
+        return (
+            f"INSERT INTO {qn(UserInventory._meta.db_table)} AS t ({columns}) VALUES %s "
+            f"ON CONFLICT ({conflict}) DO UPDATE SET {', '.join(assignments)} "
+            f"WHERE ROW({target_values}) IS DISTINCT FROM ROW({excluded_values}) "
+            f"RETURNING (t.xmax = 0) AS inserted"
+        )
+
+    @staticmethod
+    def _upsert_batch(
+        sql: str, fields: List, batch: List[UserInventory]
+    ) -> InventoryUpsertResultDTO:
+        """배치 하나를 단일 쿼리로 반영"""
+        # 같은 리소스가 한 배치에 두 번 있으면 ON CONFLICT가 실패하므로 마지막 값만 사용
+        unique: Dict[Tuple, UserInventory] = {}
+        for inventory in batch:
+            unique[(inventory.user_id, inventory.provider, inventory.resource_id)] = inventory
+
+        now = timezone.now()
+        placeholder = f"({', '.join(['%s'] * len(fields))})"
+        params = []
+        for inventory in unique.values():
+            inventory.created_at = inventory.created_at or now
+            inventory.updated_at = now
+            params.extend(
+                f.get_db_prep_save(getattr(inventory, f.attname), connection) for f in fields
+            )
+
+        values_sql = ", ".join([placeholder] * len(unique))
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(sql.replace("VALUES %s", f"VALUES {values_sql}", 1), params)
+            flags = [row[0] for row in cursor.fetchall()]
+
+        inserted = sum(1 for flag in flags if flag)
+        updated = len(flags) - inserted
+        return InventoryUpsertResultDTO(
+            inserted=inserted,
+            updated=updated,
+            unchanged=len(unique) - inserted - updated,
+        )
@@ -0,0 +1,204 @@
+import logging
+from decimal import Decimal, InvalidOperation
+from typing import IO, Dict, List, Optional, Tuple
+
+from django.db import transaction
+
+from apps.core.choices import Provider
+from apps.core.dto.inventory_dto import (
+    CSVIngestionResultDTO,
+    CSVInventoryDTO,
+    InventoryUpsertResultDTO,
+)
+from apps.core.utils.parsers import iter_chunks, open_csv_reader
+from apps.core.utils.region_mapper import normalize_region
+from apps.core.utils.validator import CloudValidator
+from apps.costs.models import CloudService
+from apps.inventories.models import UserInventory
+from apps.inventories.services.inventory_upsert_service import InventoryUpsertService
+from apps.inventories.signals import inventories_changed
+
+logger = logging.getLogger(__name__)
+
+# 결과 DTO에 보관할 최대 에러 메시지 수 (수백만 행 파일에서 메모리 폭증 방지)
+MAX_ERROR_MESSAGES = 100
+
+
+class CSVIngestionService:
+    """
+    빌링 CSV 스트리밍 적재
+
+    업로드 파일을 chunk 단위로 읽어 CSVInventoryDTO로 변환한 뒤
+    UserInventory에 배치로 저장합니다. 한 번에 chunk 하나만 메모리에 올라가므로
+    파일 크기와 무관하게 메모리 사용량이 일정합니다.
+    """
+
+    CHUNK_SIZE = 5000
+
+    # CSV 컬럼명 (필수: ResourceId, InstanceType, Cost)
+    COLUMN_RESOURCE_ID = "ResourceId"
+    COLUMN_INSTANCE_TYPE = "InstanceType"
+    COLUMN_COST = "Cost"
+    COLUMN_PROVIDER = "Provider"
+    COLUMN_REGION = "Region"
+    COLUMN_VCPU = "vCPU"
+    COLUMN_MEMORY = "MemoryGB"
+
+    # 재업로드 시 갱신하는 필드 (CloudWatch 지표는 건드리지 않음)
+    UPDATE_FIELDS = [
+        "instance_type",
+        "region",
+        "region_normalized",
+        "vcpu",
+        "memory_gb",
+        "current_monthly_cost",
+        "is_active",
+    ]
+
+    @staticmethod
+    def ingest(user, file_obj: IO, chunk_size: int = CHUNK_SIZE) -> CSVIngestionResultDTO:
+        """
+        CSV 파일을 chunk 단위로 읽어 사용자 인벤토리에 적재
+
+        Args:
+            user: 인벤토리 소유 사용자
+            file_obj: 업로드된 CSV 파일 (바이너리/텍스트 모두 가능)
+            chunk_size: 한 번에 처리할 행 수
+
+        Returns:
+            CSVIngestionResultDTO (전체/저장/스킵 행 수)
+        """
+        reader = open_csv_reader(file_obj)
+        # 헤더 검증은 파일당 한 번만
+        CloudValidator.validate_csv_headers(reader.fieldnames or [])
+
+        result = CSVIngestionResultDTO()
+        # instance_type -> (vcpu, memory_gb), 파일 전체에서 재사용
+        spec_cache: Dict[str, Optional[Tuple[int, Decimal]]] = {}
+
+        for chunk in iter_chunks(reader, chunk_size):
+            result.total_rows += len(chunk)
+            dtos = CSVIngestionService._to_dtos(chunk, spec_cache, result)
+            batch_result = CSVIngestionService._save_batch(user, dtos)
+            result.upsert.merge(batch_result)
+            result.saved_rows += batch_result.total
+
+        if result.upsert.inserted or result.upsert.updated:
+            transaction.on_commit(
+                lambda: inventories_changed.send(sender=CSVIngestionService, user_id=user.pk)
+            )
+
+        logger.info(
+            f"CSV 적재 완료 user={user.pk} total={result.total_rows} "
+            f"saved={result.saved_rows} skipped={result.skipped_rows} "
+            f"inserted={result.upsert.inserted} updated={result.upsert.updated} "
+            f"unchanged={result.upsert.unchanged}"
+        )
+        return result
+
+    @staticmethod
+    def _to_dtos(
+        rows: List[dict],
+        spec_cache: Dict[str, Optional[Tuple[int, Decimal]]],
+        result: CSVIngestionResultDTO,
+    ) -> List[CSVInventoryDTO]:
+        """chunk 내 행을 DTO로 변환 (변환 실패 행은 스킵하고 기록)"""
+        CSVIngestionService._load_specs(rows, spec_cache)
+
+        dtos = []
+        for row in rows:
+            try:
+                dtos.append(CSVIngestionService._row_to_dto(row, spec_cache))
+            except (ValueError, InvalidOperation) as e:
+                result.skipped_rows += 1
+                if len(result.errors) < MAX_ERROR_MESSAGES:
+                    resource_id = row.get(CSVIngestionService.COLUMN_RESOURCE_ID)
+                    result.errors.append(f"{resource_id}: {str(e)}")
+        return dtos
+
+    @staticmethod
+    def _load_specs(rows: List[dict], spec_cache: Dict[str, Optional[Tuple[int, Decimal]]]):
+        """스펙 컬럼이 없는 행의 instance_type을 CloudService 카탈로그에서 한 번에 조회"""
+        missing = {
+            row.get(CSVIngestionService.COLUMN_INSTANCE_TYPE)
+            for row in rows
+            if not (
+                row.get(CSVIngestionService.COLUMN_VCPU)
+                and row.get(CSVIngestionService.COLUMN_MEMORY)
+            )
+        }
+        missing = {t for t in missing if t and t not in spec_cache}
+        if not missing:
+            return
+
+        for instance_type in missing:
+            spec_cache[instance_type] = None
+        specs = CloudService.objects.filter(instance_type__in=missing).values_list(
+            "instance_type", "vcpu", "memory_gb"
+        )
+        for instance_type, vcpu, memory_gb in specs:
+            spec_cache[instance_type] = (vcpu, memory_gb)
+
+    @staticmethod
+    def _row_to_dto(
+        row: dict, spec_cache: Dict[str, Optional[Tuple[int, Decimal]]]
+    ) -> CSVInventoryDTO:
+        """CSV 한 행을 CSVInventoryDTO로 변환"""
+        resource_id = (row.get(CSVIngestionService.COLUMN_RESOURCE_ID) or "").strip()
+        instance_type = (row.get(CSVIngestionService.COLUMN_INSTANCE_TYPE) or "").strip()
+        if not resource_id or not instance_type:
+            raise ValueError("ResourceId/InstanceType 값이 비어 있습니다.")
+
+        provider = (row.get(CSVIngestionService.COLUMN_PROVIDER) or Provider.AWS).strip().upper()
+        if provider not in Provider.values:
+            raise ValueError(f"Unknown provider: {provider}")
+
+        vcpu = row.get(CSVIngestionService.COLUMN_VCPU)
+        memory_gb = row.get(CSVIngestionService.COLUMN_MEMORY)
+        if vcpu and memory_gb:
+            vcpu, memory_gb = int(vcpu), float(memory_gb)
+        else:
+            spec = spec_cache.get(instance_type)
+            if spec is None:
+                raise ValueError(f"스펙을 알 수 없는 인스턴스 유형: {instance_type}")
+            vcpu, memory_gb = spec[0], float(spec[1])
+        CloudValidator.validate_instance_spec(vcpu, memory_gb)
+
+        dto = CSVInventoryDTO(
+            resource_id=resource_id,
+            instance_type=instance_type,
+            provider=provider,
+            vcpu=vcpu,
+            memory_gb=memory_gb,
+            monthly_cost=float(Decimal(row[CSVIngestionService.COLUMN_COST])),
+        )
+        region = (row.get(CSVIngestionService.COLUMN_REGION) or "").strip()
+        if region:
+            dto.region = region
+        # 매핑되지 않은 리전이면 ValueError → 스킵 처리
+        normalize_region(dto.region, dto.provider)
+        return dto
+
+    @staticmethod
+    def _save_batch(user, dtos: List[CSVInventoryDTO]) -> InventoryUpsertResultDTO:
+        """DTO 배치를 UserInventory에 upsert (같은 리소스가 배치에 여러 번 있으면 마지막 행 사용)"""
+        inventories = [
+            UserInventory(
+                user=user,
+                provider=dto.provider,
+                resource_id=dto.resource_id,
+                instance_type=dto.instance_type,
+                region=dto.region,
+                region_normalized=normalize_region(dto.region, dto.provider),
+                vcpu=dto.vcpu,
+                memory_gb=Decimal(str(dto.memory_gb)),
+                current_monthly_cost=Decimal(str(dto.monthly_cost)),
+            )
+            for dto in dtos
+        ]
+        if not inventories:
+            return InventoryUpsertResultDTO()
+
+        return InventoryUpsertService.bulk_upsert(
+            inventories, update_fields=CSVIngestionService.UPDATE_FIELDS
+        )
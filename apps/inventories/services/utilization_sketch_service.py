@@ -0,0 +1,117 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.utils.quantile_sketch import DDSketch
+from apps.inventories.models import UtilizationSketch
+from apps.inventories.services.utilization_store_service import UtilizationRow
+
+logger = logging.getLogger(__name__)
+
+SketchKey = Tuple[int, str, date]
+
+
+class UtilizationSketchService:
+    """
+    리소스/지표별 분위수 스케치 유지
+
+    스케치는 일자별로 나눠 저장하므로 임의의 최근 N일 백분위를 병합으로 구할 수 있고,
+    리소스당 저장 크기는 (보관 일수 x 스케치 구간 수)로 고정됩니다.
+    """
+
+    WINDOW_DAYS = 7
+    # 윈도우 경계 일자를 포함하도록 하루 더 보관
+    RETENTION_DAYS = WINDOW_DAYS + 1
+    PERCENTILE = 0.95
+
+    @staticmethod
+    @transaction.atomic
+    def update(rows: List[UtilizationRow], now: Optional[datetime] = None) -> int:
+        """
+        새 데이터 포인트를 일자별 스케치에 더하고 보관 기간이 지난 스케치 삭제
+
+        같은 포인트를 두 번 넣으면 두 번 세므로 호출자가 watermark 이후 포인트만 넘겨야 합니다.
+
+        Returns:
+            갱신/생성한 스케치 수
+        """
+        if not rows:
+            return 0
+        now = now or timezone.now()
+        values: Dict[SketchKey, List[float]] = defaultdict(list)
+        for inventory_id, metric, recorded_at, value in rows:
+            day = recorded_at.astimezone(dt_timezone.utc).date()
+            values[(inventory_id, metric, day)].append(value)
+
+        inventory_ids = {key[0] for key in values}
+        existing = {
+            (sketch.inventory_id, sketch.metric, sketch.day): sketch
+            for sketch in UtilizationSketch.objects.filter(
+                inventory_id__in=inventory_ids, day__in={key[2] for key in values}
+            )
+        }
+
+        created, updated = [], []
+        for key, points in values.items():
+            record = existing.get(key)
+            if record is None:
+                inventory_id, metric, day = key
+                record = UtilizationSketch(inventory_id=inventory_id, metric=metric, day=day)
+                sketch = DDSketch()
+                created.append(record)
+            else:
+                sketch = DDSketch.from_bytes(record.sketch)
+                record.updated_at = now
+                updated.append(record)
+            sketch.add_many(points)
+            record.sketch = sketch.to_bytes()
+            record.sample_count += len(points)
+
+        UtilizationSketch.objects.bulk_create(created, batch_size=1000)
+        UtilizationSketch.objects.bulk_update(
+            updated, fields=["sketch", "sample_count", "updated_at"], batch_size=1000
+        )
+        cutoff = (now - timedelta(days=UtilizationSketchService.RETENTION_DAYS)).date()
+        UtilizationSketch.objects.filter(inventory_id__in=inventory_ids, day__lt=cutoff).delete()
+        return len(created) + len(updated)
+
+    @staticmethod
+    def percentiles(
+        inventory_ids: Iterable[int],
+        q: float = PERCENTILE,
+        days: int = WINDOW_DAYS,
+        now: Optional[datetime] = None,
+    ) -> Dict[Tuple[int, str], float]:
+        """
+        최근 days일 일자별 스케치를 병합한 리소스/지표별 분위수
+
+        Returns:
+            {(inventory_id, metric): value} - 스케치가 없는 리소스는 빠짐
+        """
+        inventory_ids = list(inventory_ids)
+        if not inventory_ids:
+            return {}
+        now = now or timezone.now()
+        since = (now - timedelta(days=days)).astimezone(dt_timezone.utc).date()
+
+        merged: Dict[Tuple[int, str], DDSketch] = {}
+        for inventory_id, metric, data in UtilizationSketch.objects.filter(
+            inventory_id__in=inventory_ids, day__gte=since
+        ).values_list("inventory_id", "metric", "sketch"):
+            sketch = DDSketch.from_bytes(data)
+            key = (inventory_id, metric)
+            if key in merged:
+                merged[key].merge(sketch)
+            else:
+                merged[key] = sketch
+
+        return {
+            key: value
+            for key, sketch in merged.items()
+            if (value := sketch.quantile(q)) is not None
+        }
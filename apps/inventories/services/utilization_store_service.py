@@ -0,0 +1,241 @@
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.core.utils.parsers import iter_chunks
+
+logger = logging.getLogger(__name__)
+
+# (inventory_id, metric, recorded_at, value)
+UtilizationRow = Tuple[int, str, datetime, float]
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """range partition 테이블 하나의 파티션 단위/보관 기간"""
+
+    table: str
+    interval: str  # "day" | "month" | "year"
+    retention: timedelta
+
+    SUFFIX_FORMATS = {"day": "%Y%m%d", "month": "%Y%m", "year": "%Y"}
+
+    def floor(self, value: datetime) -> datetime:
+        value = value.astimezone(dt_timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        if self.interval in ("month", "year"):
+            value = value.replace(day=1)
+        if self.interval == "year":
+            value = value.replace(month=1)
+        return value
+
+    def next(self, start: datetime) -> datetime:
+        if self.interval == "day":
+            return start + timedelta(days=1)
+        if self.interval == "month":
+            return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+        return start.replace(year=start.year + 1)
+
+    def name(self, start: datetime) -> str:
+        return f"{self.table}_p{start.strftime(self.SUFFIX_FORMATS[self.interval])}"
+
+    def parse(self, name: str) -> Optional[datetime]:
+        """파티션 이름에서 구간 시작 시각 복원 (규칙에 맞지 않으면 None)"""
+        match = re.fullmatch(rf"{re.escape(self.table)}_p(\d+)", name)
+        if not match:
+            return None
+        try:
+            start = datetime.strptime(match.group(1), self.SUFFIX_FORMATS[self.interval])
+        except ValueError:
+            return None
+        return start.replace(tzinfo=dt_timezone.utc)
+
+
+class UtilizationStoreService:
+    """
+    사용률 시계열 저장소 (Postgres range partition)
+
+    - utilization_points: CloudWatch 5분 포인트 원본, 일 단위 파티션, 14일 보관
+    - utilization_hourly / utilization_daily: 원본에서 계산한 avg/p95/max, 90일 / 2년 보관
+    record()가 원본을 넣고 해당 구간의 시간/일 집계를 바로 다시 계산하므로 별도 배치가 필요 없고,
+    보관 기간은 행 DELETE 대신 파티션 DROP으로 정리합니다.
+    percentiles()는 원본 포인트의 임의 구간 백분위 조회용이고, 적정 사이징은 일자별 스케치
+    (UtilizationSketchService)의 p95를 사용합니다.
+    """
+
+    RAW = PartitionSpec("utilization_points", "day", timedelta(days=14))
+    HOURLY = PartitionSpec("utilization_hourly", "month", timedelta(days=90))
+    DAILY = PartitionSpec("utilization_daily", "year", timedelta(days=730))
+    PARTITIONS = (RAW, HOURLY, DAILY)
+
+    BATCH_SIZE = 5000
+    PERCENTILE = 0.95
+    PERCENTILE_WINDOW = timedelta(days=7)
+
+    @staticmethod
+    def record(rows: List[UtilizationRow]) -> int:
+        """
+        원본 포인트 저장 후 포인트가 속한 날짜의 시간/일 집계 재계산
+
+        이미 저장된 (inventory, metric, recorded_at)은 무시하므로 같은 구간을 다시 넣어도 됩니다.
+
+        Returns:
+            새로 저장한 포인트 수
+        """
+        if not rows:
+            return 0
+        start = min(row[2] for row in rows)
+        end = max(row[2] for row in rows)
+        UtilizationStoreService.ensure_partitions(UtilizationStoreService.RAW, start, end)
+
+        inserted = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            for batch in iter_chunks(rows, UtilizationStoreService.BATCH_SIZE):
+                values = ", ".join(["(%s, %s, %s, %s)"] * len(batch))
+                cursor.execute(
+                    "INSERT INTO utilization_points (inventory_id, metric, recorded_at, value) "
+                    f"VALUES {values} ON CONFLICT DO NOTHING",
+                    [value for row in batch for value in row],
+                )
+                inserted += cursor.rowcount
+
+            inventory_ids = sorted({row[0] for row in rows})
+            day_start = UtilizationStoreService.RAW.floor(start)
+            day_end = UtilizationStoreService.RAW.floor(end) + timedelta(days=1)
+            UtilizationStoreService.rollup(inventory_ids, day_start, day_end)
+
+        logger.info(f"사용률 원본 저장 inserted={inserted}/{len(rows)}")
+        return inserted
+
+    @staticmethod
+    def rollup(inventory_ids: List[int], start: datetime, end: datetime):
+        """[start, end) 구간 원본으로 시간/일 집계 upsert (구간은 일 경계여야 함)"""
+        for spec, unit in (
+            (UtilizationStoreService.HOURLY, "hour"),
+            (UtilizationStoreService.DAILY, "day"),
+        ):
+            UtilizationStoreService.ensure_partitions(spec, start, end - timedelta(microseconds=1))
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    INSERT INTO {spec.table} AS t (
+                        inventory_id, metric, bucket_start,
+                        avg_value, p95_value, max_value, sample_count
+                    )
+                    SELECT
+                        inventory_id,
+                        metric,
+                        date_trunc('{unit}', recorded_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+                        avg(value),
+                        percentile_cont(%s) WITHIN GROUP (ORDER BY value),
+                        max(value),
+                        count(*)
+                    FROM utilization_points
+                    WHERE inventory_id = ANY(%s) AND recorded_at >= %s AND recorded_at < %s
+                    GROUP BY 1, 2, 3
+                    ON CONFLICT (inventory_id, metric, bucket_start) DO UPDATE SET
+                        avg_value = EXCLUDED.avg_value,
+                        p95_value = EXCLUDED.p95_value,
+                        max_value = EXCLUDED.max_value,
+                        sample_count = EXCLUDED.sample_count
+                    """,
+                    [UtilizationStoreService.PERCENTILE, inventory_ids, start, end],
+                )
+
+    @staticmethod
+    def percentiles(
+        inventory_ids: Iterable[int],
+        q: float = PERCENTILE,
+        since: Optional[datetime] = None,
+    ) -> Dict[Tuple[int, str], float]:
+        """
+        리소스/지표별 최근 구간 백분위 (원본 포인트 기준, 파티션 pruning으로 해당 일자만 읽음)
+
+        Args:
+            inventory_ids: 대상 인벤토리
+            q: 백분위 (0~1)
+            since: 시작 시각 (기본값: 7일 전)
+
+        Returns:
+            {(inventory_id, metric): value} - 포인트가 없는 리소스는 빠짐
+        """
+        inventory_ids = list(inventory_ids)
+        if not inventory_ids:
+            return {}
+        since = since or timezone.now() - UtilizationStoreService.PERCENTILE_WINDOW
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT inventory_id, metric, percentile_cont(%s) WITHIN GROUP (ORDER BY value)
+                FROM utilization_points
+                WHERE inventory_id = ANY(%s) AND recorded_at >= %s
+                GROUP BY inventory_id, metric
+                """,
+                [q, inventory_ids, since],
+            )
+            return {
+                (inventory_id, metric): value for inventory_id, metric, value in cursor.fetchall()
+            }
+
+    @staticmethod
+    def ensure_partitions(spec: PartitionSpec, start: datetime, end: datetime):
+        """[start, end]를 덮는 파티션 생성 (이미 있으면 건너뜀)"""
+        qn = connection.ops.quote_name
+        partition_start = spec.floor(start)
+        with connection.cursor() as cursor:
+            while partition_start <= end:
+                partition_end = spec.next(partition_start)
+                # DDL은 바인드 파라미터를 받지 않으므로 UTC 시각 리터럴로 지정
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS {qn(spec.name(partition_start))} "
+                    f"PARTITION OF {qn(spec.table)} "
+                    f"FOR VALUES FROM ('{partition_start.isoformat()}') "
+                    f"TO ('{partition_end.isoformat()}')"
+                )
+                partition_start = partition_end
+
+    @staticmethod
+    def apply_retention(now: Optional[datetime] = None) -> List[str]:
+        """보관 기간이 지난 파티션 DROP (파티션 전체가 기간 밖일 때만)"""
+        now = now or timezone.now()
+        qn = connection.ops.quote_name
+        dropped = []
+        with connection.cursor() as cursor:
+            for spec in UtilizationStoreService.PARTITIONS:
+                cutoff = now - spec.retention
+                for name in UtilizationStoreService._partitions(cursor, spec.table):
+                    start = spec.parse(name)
+                    if start is None or spec.next(start) > cutoff:
+                        continue
+                    cursor.execute(f"DROP TABLE IF EXISTS {qn(name)}")
+                    dropped.append(name)
+        if dropped:
+            logger.info(f"보관 기간이 지난 사용률 파티션 삭제: {dropped}")
+        return dropped
+
+    @staticmethod
+    def maintain(now: Optional[datetime] = None) -> List[str]:
+        """다음 구간 파티션을 미리 만들고 보관 기간이 지난 파티션 정리 (주기 작업)"""
+        now = now or timezone.now()
+        for spec in UtilizationStoreService.PARTITIONS:
+            UtilizationStoreService.ensure_partitions(spec, now, spec.next(spec.floor(now)))
+        return UtilizationStoreService.apply_retention(now)
+
+    @staticmethod
+    def _partitions(cursor, table: str) -> List[str]:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [table],
+        )
+        return [name for (name,) in cursor.fetchall()]
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# 벌크 upsert처럼 post_save가 발송되지 않는 인벤토리 변경이 커밋된 뒤 발송
+# kwargs: user_id
+inventories_changed = Signal()
@@ -0,0 +1,6 @@
+from apps.inventories.services.utilization_store_service import UtilizationStoreService
+
+
+def maintain_utilization_store():
+    """django_q 주기 작업 진입점 - 사용률 파티션 생성/보관 기간 정리 (0006 마이그레이션에서 등록)"""
+    UtilizationStoreService.maintain()
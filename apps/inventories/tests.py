@@ -1,3 +1,512 @@
+import io
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from apps.core.exceptions.cloud_exception import InvalidCSVFormat
+from apps.core.pagination import KeysetPagination
+from apps.inventories.models import (
+    InventoryMetricState,
+    UserInventory,
+    UtilizationDaily,
+    UtilizationHourly,
+    UtilizationPoint,
+    UtilizationSketch,
+)
+from apps.inventories.services.cloudwatch_sync_service import CloudWatchSyncService
+from apps.inventories.services.inventory_upsert_service import InventoryUpsertService
+from apps.inventories.services.scv_ingestion_service import CSVIngestionService
+from apps.inventories.services.utilization_sketch_service import UtilizationSketchService
+from apps.inventories.services.utilization_store_service import UtilizationStoreService
+from apps.users.models import CloudCredential
+
+User = get_user_model()
+
+
+class CSVIngestionServiceTest(TestCase):
+    """CSV 스트리밍 적재 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+
+    def test_ingest_in_chunks(self):
+        csv_text = (
+            "ResourceId,InstanceType,Cost,Region,vCPU,MemoryGB\n"
+            "i-001,t3.large,60.74,ap-northeast-2,2,8\n"
+            "i-002,t3.medium,30.37,us-east-1,2,4\n"
+            "i-003,m5.xlarge,140.16,us-west-2,4,16\n"
+        )
+        result = CSVIngestionService.ingest(self.user, io.StringIO(csv_text), chunk_size=2)
+
+        self.assertEqual(result.total_rows, 3)
+        self.assertEqual(result.saved_rows, 3)
+        self.assertEqual(UserInventory.objects.filter(user=self.user).count(), 3)
+        inventory = UserInventory.objects.get(resource_id="i-001")
+        self.assertEqual(inventory.region_normalized, "KR")
+        self.assertEqual(inventory.current_monthly_cost, Decimal("60.74"))
+
+    def test_reupload_counts_unchanged_rows(self):
+        csv_text = (
+            "ResourceId,InstanceType,Cost,Region,vCPU,MemoryGB\n"
+            "i-001,t3.large,60.74,ap-northeast-2,2,8\n"
+            "i-002,t3.medium,30.37,us-east-1,2,4\n"
+        )
+        CSVIngestionService.ingest(self.user, io.StringIO(csv_text))
+        result = CSVIngestionService.ingest(
+            self.user, io.StringIO(csv_text.replace("30.37", "25.00"))
+        )
+
+        self.assertEqual(result.upsert.inserted, 0)
+        self.assertEqual(result.upsert.updated, 1)
+        self.assertEqual(result.upsert.unchanged, 1)
+
+    def test_invalid_rows_are_skipped(self):
+        csv_text = (
+            "ResourceId,InstanceType,Cost,Region,vCPU,MemoryGB\n"
+            "i-001,t3.large,60.74,ap-northeast-2,2,8\n"
+            "i-002,t3.medium,abc,us-east-1,2,4\n"
+            "i-003,m5.xlarge,140.16,mars-north-1,4,16\n"
+            "i-004,x9.unknown,10.00,us-east-1,,\n"
+        )
+        result = CSVIngestionService.ingest(self.user, io.BytesIO(csv_text.encode()))
+
+        self.assertEqual(result.saved_rows, 1)
+        self.assertEqual(result.skipped_rows, 3)
+
+    def test_missing_required_header(self):
+        with self.assertRaises(InvalidCSVFormat):
+            CSVIngestionService.ingest(self.user, io.StringIO("ResourceId,Cost\ni-001,1\n"))
+
+
+class InventoryUpsertServiceTest(TestCase):
+    """UserInventory 벌크 upsert 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+
+    def _inventory(self, resource_id, cpu_usage_avg=None):
+        return UserInventory(
+            user=self.user,
+            provider="AWS",
+            resource_id=resource_id,
+            instance_type="t3.large",
+            region="us-east-1",
+            region_normalized="US_EAST",
+            vcpu=2,
+            memory_gb=Decimal("8.00"),
+            cpu_usage_avg=cpu_usage_avg,
+            current_monthly_cost=Decimal("60.74"),
+        )
+
+    def test_bulk_upsert_counts(self):
+        result = InventoryUpsertService.bulk_upsert(
+            [self._inventory(f"i-{i}") for i in range(5)],
+            update_fields=["cpu_usage_avg"],
+            batch_size=2,
+        )
+        self.assertEqual((result.inserted, result.updated, result.unchanged), (5, 0, 0))
+
+        result = InventoryUpsertService.bulk_upsert(
+            [self._inventory("i-0", Decimal("12.50")), self._inventory("i-1")],
+            update_fields=["cpu_usage_avg"],
+        )
+        self.assertEqual((result.inserted, result.updated, result.unchanged), (0, 1, 1))
+        self.assertEqual(
+            UserInventory.objects.get(resource_id="i-0").cpu_usage_avg, Decimal("12.50")
+        )
+
+    def test_conflict_fields_cannot_be_updated(self):
+        with self.assertRaises(ValueError):
+            InventoryUpsertService.bulk_upsert([self._inventory("i-0")], update_fields=["user"])
+
+
+class FakeAWSAdapter:
+    """리전별로 정해진 데이터 포인트를 돌려주는 AWSAdapter 대역"""
+
+    created = []
+    requested_starts = []
+    series_by_region = {}
+
+    def __init__(self, access_key, secret_key, region, rate_limiter=None):
+        self.region = region
+        FakeAWSAdapter.created.append((access_key, region))
+
+    def get_metric_series_batch(self, instance_ids, start_time, end_time, period, metric_keys):
+        FakeAWSAdapter.requested_starts.append(start_time)
+        known = FakeAWSAdapter.series_by_region.get(self.region, {})
+        return {
+            instance_id: {
+                key: [p for p in known.get(instance_id, {}).get(key, []) if p[0] >= start_time]
+                for key in metric_keys
+            }
+            for instance_id in instance_ids
+        }
+
+
+class CloudWatchSyncServiceTest(TestCase):
+    """계정 x 리전 병렬 증분 동기화 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+        for nickname in ("prod", "dev"):
+            CloudCredential.objects.create(
+                user=self.user,
+                provider="AWS",
+                credential_type="ACCESS_KEY",
+                nickname=nickname,
+                aws_access_key_id=f"key-{nickname}",
+                aws_secret_access_key="secret",
+            )
+        for resource_id, region, normalized in (
+            ("i-kr", "ap-northeast-2", "KR"),
+            ("i-us", "us-east-1", "US_EAST"),
+        ):
+            UserInventory.objects.create(
+                user=self.user,
+                provider="AWS",
+                resource_id=resource_id,
+                instance_type="t3.large",
+                region=region,
+                region_normalized=normalized,
+                vcpu=2,
+                memory_gb=Decimal("8.00"),
+                current_monthly_cost=Decimal("60.74"),
+            )
+        base = timezone.now() - timedelta(hours=3)
+        FakeAWSAdapter.created = []
+        FakeAWSAdapter.requested_starts = []
+        FakeAWSAdapter.series_by_region = {
+            "ap-northeast-2": {
+                "i-kr": {
+                    "cpu_avg": [(base, 10.0), (base + timedelta(minutes=5), 14.7)],
+                    "memory_avg": [(base, 40.0)],
+                }
+            },
+            "us-east-1": {"i-us": {"cpu_avg": [(base, 75.0)], "memory_avg": []}},
+        }
+        self.base = base
+
+    def _sync(self):
+        with mock.patch(
+            "apps.inventories.services.cloudwatch_sync_service.AWSAdapter", FakeAWSAdapter
+        ):
+            return CloudWatchSyncService.sync_user(self.user, max_workers=4)
+
+    def test_sync_fans_out_and_writes_back(self):
+        result = self._sync()
+
+        self.assertEqual(result.pairs_total, 4)
+        self.assertEqual(len(FakeAWSAdapter.created), 4)
+        self.assertEqual(result.instances_synced, 2)
+        self.assertEqual(result.upsert.updated, 2)
+
+        kr = UserInventory.objects.get(resource_id="i-kr")
+        self.assertEqual(kr.cpu_usage_avg, Decimal("12.35"))
+        self.assertEqual(kr.memory_usage_avg, Decimal("40.00"))
+        self.assertIsNone(UserInventory.objects.get(resource_id="i-us").memory_usage_avg)
+        # 원본 포인트는 로컬 시계열 저장소에도 쌓임
+        self.assertEqual(UtilizationPoint.objects.filter(inventory=kr).count(), 3)
+
+    def test_unexpected_pair_error_keeps_other_results(self):
+        original = FakeAWSAdapter.__init__
+
+        def init(adapter, access_key, secret_key, region, rate_limiter=None):
+            if access_key == "key-dev":
+                raise ValueError("You must specify a region.")
+            original(adapter, access_key, secret_key, region, rate_limiter)
+
+        with mock.patch.object(FakeAWSAdapter, "__init__", init):
+            result = self._sync()
+
+        self.assertEqual(result.pairs_failed, 2)
+        self.assertEqual(len(result.errors), 2)
+        self.assertEqual(result.instances_synced, 2)
+        kr = UserInventory.objects.get(resource_id="i-kr")
+        self.assertEqual(kr.cpu_usage_avg, Decimal("12.35"))
+
+    def test_second_sync_only_reads_new_datapoints(self):
+        self._sync()
+        kr_series = FakeAWSAdapter.series_by_region["ap-northeast-2"]["i-kr"]
+        kr_series["cpu_avg"].append((self.base + timedelta(hours=1), 30.0))
+        FakeAWSAdapter.requested_starts = []
+
+        self._sync()
+
+        # 두 번째 동기화는 watermark(마지막 포인트 시각) 이후부터만 조회
+        self.assertTrue(
+            all(
+                start >= self.base - timedelta(hours=1) for start in FakeAWSAdapter.requested_starts
+            )
+        )
+        state = InventoryMetricState.objects.get(inventory__resource_id="i-kr", metric="CPU")
+        self.assertEqual(state.window_count, 3)
+        self.assertEqual(state.window_max, 30.0)
+        kr = UserInventory.objects.get(resource_id="i-kr")
+        self.assertEqual(kr.cpu_usage_avg, Decimal("18.23"))
+        # 스케치에는 새 포인트만 더해짐 (이미 센 포인트를 다시 세지 않음)
+        sketch_count = sum(
+            UtilizationSketch.objects.filter(inventory=kr, metric="CPU").values_list(
+                "sample_count", flat=True
+            )
+        )
+        self.assertEqual(sketch_count, 3)
+
+    def test_memory_behind_cpu_watermark_is_fetched(self):
+        kr_series = FakeAWSAdapter.series_by_region["ap-northeast-2"]["i-kr"]
+        kr_series["cpu_avg"].append((self.base + timedelta(hours=2), 14.7))
+        self._sync()
+        # memory watermark(base) 이후, CPU watermark(base+2시간) 이전의 memory 포인트가 늦게 도착
+        kr_series["memory_avg"].append((self.base + timedelta(minutes=30), 60.0))
+
+        self._sync()
+
+        kr = UserInventory.objects.get(resource_id="i-kr")
+        self.assertEqual(kr.memory_usage_avg, Decimal("50.00"))
+        self.assertEqual(UtilizationPoint.objects.filter(inventory=kr, metric="MEMORY").count(), 2)
+
+    def test_idle_instance_window_expires_without_new_points(self):
+        self._sync()
+        FakeAWSAdapter.series_by_region = {}
+
+        later = timezone.now() + timedelta(days=8)
+        with mock.patch("apps.inventories.services.cloudwatch_sync_service.timezone.now") as now:
+            now.return_value = later
+            self._sync()
+
+        kr = UserInventory.objects.get(resource_id="i-kr")
+        self.assertIsNone(kr.cpu_usage_avg)
+        state = InventoryMetricState.objects.get(inventory=kr, metric="CPU")
+        self.assertEqual((state.window_count, state.hourly_buckets), (0, {}))
+
+
+class InventoryListViewTest(TestCase):
+    """인벤토리 keyset 페이지네이션 / 필드 선택 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password1234"
+        )
+        created_at = timezone.now()
+        for index in range(5):
+            inventory = self._create(self.user, f"i-{index:03d}", "t3.large")
+            # 2건씩 같은 created_at - id로 순서가 정해지는지 확인
+            UserInventory.objects.filter(pk=inventory.pk).update(
+                created_at=created_at - timedelta(minutes=index // 2)
+            )
+        self._create(self.user, "i-gone", "t3.large", is_active=False)
+        self._create(self.user, "i-big", "m5.xlarge")
+        self._create(other, "i-other", "t3.large")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @staticmethod
+    def _create(user, resource_id, instance_type, is_active=True):
+        return UserInventory.objects.create(
+            user=user,
+            provider="AWS",
+            resource_id=resource_id,
+            instance_type=instance_type,
+            region="ap-northeast-2",
+            region_normalized="KR",
+            vcpu=2,
+            memory_gb=Decimal("8"),
+            current_monthly_cost=Decimal("60.74"),
+            is_active=is_active,
+        )
+
+    def test_pages_follow_keyset_order(self):
+        expected = list(
+            UserInventory.objects.filter(user=self.user, is_active=True)
+            .order_by("-created_at", "-id")
+            .values_list("resource_id", flat=True)
+        )
+        seen = []
+        url = reverse("inventory-list") + "?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen += [row["resource_id"] for row in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(seen), 6)
+
+    def test_sparse_fields(self):
+        response = self.client.get(
+            reverse("inventory-list"), {"fields": "resource_id,instance_type"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"resource_id", "instance_type"})
+
+    def test_filters(self):
+        response = self.client.get(
+            reverse("inventory-list"), {"provider": "AWS", "instance_type": "m5.xlarge"}
+        )
+        self.assertEqual([row["resource_id"] for row in response.data["results"]], ["i-big"])
+
+        response = self.client.get(reverse("inventory-list"), {"is_active": "false"})
+        self.assertEqual([row["resource_id"] for row in response.data["results"]], ["i-gone"])
+
+        response = self.client.get(reverse("inventory-list"), {"instance_type": "m5.xlarge"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse("inventory-list"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+        cursor = KeysetPagination.encode_cursor(timezone.now(), 10)
+        self.assertEqual(KeysetPagination.decode_cursor(cursor)[1], 10)
+
+
+class UtilizationStoreServiceTest(TestCase):
+    """사용률 시계열 저장소 (파티션/집계/보관 기간) 테스트"""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+        self.inventory = UserInventory.objects.create(
+            user=user,
+            provider="AWS",
+            resource_id="i-001",
+            instance_type="t3.large",
+            region="ap-northeast-2",
+            region_normalized="KR",
+            vcpu=2,
+            memory_gb=Decimal("8"),
+            current_monthly_cost=Decimal("60.74"),
+        )
+        self.start = datetime(2026, 10, 17, 23, 0, tzinfo=dt_timezone.utc)
+
+    def _rows(self, values, start=None):
+        start = start or self.start
+        return [
+            (self.inventory.pk, "CPU", start + timedelta(minutes=5 * i), value)
+            for i, value in enumerate(values)
+        ]
+
+    def test_record_rolls_up_hours_and_days(self):
+        # 23:00~23:55 12개 + 다음날 00:00~00:55 12개
+        values = [10.0] * 11 + [90.0] + [20.0] * 12
+        inserted = UtilizationStoreService.record(self._rows(values))
+
+        self.assertEqual(inserted, 24)
+        self.assertEqual(UtilizationStoreService.record(self._rows(values)), 0)
+
+        hours = list(
+            UtilizationHourly.objects.filter(inventory=self.inventory).order_by("bucket_start")
+        )
+        self.assertEqual([hour.sample_count for hour in hours], [12, 12])
+        self.assertAlmostEqual(hours[0].avg_value, (10.0 * 11 + 90.0) / 12)
+        self.assertEqual(hours[0].max_value, 90.0)
+        self.assertGreater(hours[0].p95_value, 10.0)
+        self.assertEqual(hours[1].p95_value, 20.0)
+
+        days = UtilizationDaily.objects.filter(inventory=self.inventory).order_by("bucket_start")
+        self.assertEqual(
+            [(day.bucket_start.day, day.sample_count) for day in days], [(17, 12), (18, 12)]
+        )
+
+    def test_percentiles_read_locally(self):
+        UtilizationStoreService.record(self._rows([float(v) for v in range(1, 101)]))
+
+        values = UtilizationStoreService.percentiles(
+            [self.inventory.pk], since=self.start - timedelta(days=1)
+        )
+
+        self.assertAlmostEqual(values[(self.inventory.pk, "CPU")], 95.05)
+        self.assertEqual(UtilizationStoreService.percentiles([]), {})
+
+    def test_retention_drops_expired_partitions(self):
+        old = self.start - timedelta(days=30)
+        UtilizationStoreService.record(self._rows([50.0], start=old))
+        UtilizationStoreService.record(self._rows([50.0]))
+
+        dropped = UtilizationStoreService.apply_retention(now=self.start)
+
+        self.assertIn("utilization_points_p20260917", dropped)
+        self.assertNotIn("utilization_hourly_p202609", dropped)
+        self.assertEqual(UtilizationPoint.objects.filter(inventory=self.inventory).count(), 1)
+        self.assertEqual(UtilizationHourly.objects.filter(inventory=self.inventory).count(), 2)
+
+
+class UtilizationSketchServiceTest(TestCase):
+    """일자별 분위수 스케치 (갱신/병합/보관 기간) 테스트"""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+        self.inventory = UserInventory.objects.create(
+            user=user,
+            provider="AWS",
+            resource_id="i-001",
+            instance_type="t3.large",
+            region="ap-northeast-2",
+            region_normalized="KR",
+            vcpu=2,
+            memory_gb=Decimal("8"),
+            current_monthly_cost=Decimal("60.74"),
+        )
+        self.now = datetime(2026, 10, 18, 12, 0, tzinfo=dt_timezone.utc)
+
+    def _rows(self, values, start):
+        return [
+            (self.inventory.pk, "CPU", start + timedelta(minutes=5 * i), value)
+            for i, value in enumerate(values)
+        ]
+
+    def test_update_accumulates_daily_sketch(self):
+        start = self.now - timedelta(hours=2)
+        UtilizationSketchService.update(self._rows([10.0] * 12, start), now=self.now)
+        UtilizationSketchService.update(
+            self._rows([20.0] * 12, start + timedelta(hours=1)), now=self.now
+        )
+
+        sketch = UtilizationSketch.objects.get(inventory=self.inventory, metric="CPU")
+        self.assertEqual(sketch.day, self.now.date())
+        self.assertEqual(sketch.sample_count, 24)
+
+    def test_percentiles_merge_days(self):
+        # 6일 동안 낮은 사용률, 하루만 피크 - 병합한 p95는 피크를 반영
+        for offset in range(1, 7):
+            start = self.now - timedelta(days=offset)
+            UtilizationSketchService.update(self._rows([10.0] * 100, start), now=self.now)
+        UtilizationSketchService.update(
+            self._rows([90.0] * 60, self.now - timedelta(hours=6)), now=self.now
+        )
+
+        values = UtilizationSketchService.percentiles([self.inventory.pk], now=self.now)
+
+        self.assertEqual(UtilizationSketch.objects.filter(inventory=self.inventory).count(), 7)
+        self.assertAlmostEqual(values[(self.inventory.pk, "CPU")], 90.0, delta=90.0 * 0.01)
+        self.assertEqual(UtilizationSketchService.percentiles([]), {})
+
+    def test_update_deletes_expired_days(self):
+        old = self.now - timedelta(days=20)
+        UtilizationSketchService.update(self._rows([50.0], old), now=old)
+        UtilizationSketchService.update(self._rows([50.0], self.now), now=self.now)
 
-# Create your tests here.
+        days = UtilizationSketch.objects.filter(inventory=self.inventory).values_list(
+            "day", flat=True
+        )
+        self.assertEqual(list(days), [self.now.date()])
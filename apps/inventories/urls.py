@@ -1,3 +1,7 @@
 from django.urls import path
 
-urlpatterns = []
+from apps.inventories.views import InventoryListView
+
+urlpatterns = [
+    path("", InventoryListView.as_view(), name="inventory-list"),
+]
@@ -1,3 +1,32 @@
-from django.shortcuts import render
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
 
-# Create your views here.
+from apps.core.pagination import KeysetPagination
+from apps.inventories.serializers import InventoryListQuerySerializer, InventoryListSerializer
+from apps.inventories.services.inventory_query_service import InventoryQueryService
+
+
+class InventoryListView(APIView):
+    """
+    인벤토리 목록 조회 뷰
+
+    GET /api/inventories/?provider=AWS&instance_type=m5.large&fields=id,resource_id&cursor=...
+    """
+
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get(self, request):
+        query = InventoryListQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        fields = query.validated_data.pop("fields", None)
+
+        queryset = InventoryQueryService.list_for_user(
+            request.user, fields=fields, **query.validated_data
+        )
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+
+        return paginator.get_paginated_response(
+            InventoryListSerializer(page, many=True, fields=fields).data
+        )
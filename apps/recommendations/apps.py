@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class SolutionRecommendConfig(AppConfig):
     name = "apps.recommendations"
+
+    def ready(self):
+        from apps.recommendations import signals  # noqa: F401
@@ -0,0 +1,107 @@
+# Generated by Django 6.0 on 2026-10-18 11:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventories", "0003_inventory_metric_state"),
+        ("recommendations", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recommendation",
+            name="error_message",
+            field=models.TextField(blank=True, default="", help_text="실패 사유 (FAILED일 때)"),
+        ),
+        migrations.AddField(
+            model_name="recommendation",
+            name="progress",
+            field=models.PositiveSmallIntegerField(default=0, help_text="진행률 (0~100)"),
+        ),
+        migrations.AddField(
+            model_name="recommendation",
+            name="stage",
+            field=models.CharField(
+                choices=[
+                    ("QUEUED", "대기 중"),
+                    ("METRICS", "사용률 갱신"),
+                    ("RIGHTSIZING", "적정 사이징"),
+                    ("AI_DIAGNOSIS", "AI 진단"),
+                    ("SAVING", "결과 저장"),
+                    ("DONE", "완료"),
+                ],
+                default="QUEUED",
+                help_text="비동기 진단 진행 단계",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="recommendation",
+            name="task_id",
+            field=models.CharField(
+                blank=True, default="", help_text="django_q 작업 ID", max_length=32
+            ),
+        ),
+        migrations.AddField(
+            model_name="recommendationitem",
+            name="inventory",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="추천 대상 인벤토리 (사용자 전체 진단일 때 리소스 구분용)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="recommendation_items",
+                to="inventories.userinventory",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recommendation",
+            name="diagnosis_summary",
+            field=models.TextField(
+                blank=True, default="", help_text="AI가 생성한 진단 요약 메시지"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recommendation",
+            name="inventory",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="진단 대상 인벤토리 (비어 있으면 사용자 전체 인벤토리 진단)",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="recommendations",
+                to="inventories.userinventory",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recommendation",
+            name="total_current_cost",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                help_text="현재 월 비용 (진단 시점 스냅샷)",
+                max_digits=10,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recommendation",
+            name="total_optimized_cost",
+            field=models.DecimalField(
+                decimal_places=2, default=0, help_text="최적화 후 예상 월 비용", max_digits=10
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recommendation",
+            name="total_savings",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                help_text="총 예상 절감액 (current - optimized)",
+                max_digits=10,
+            ),
+        ),
+    ]
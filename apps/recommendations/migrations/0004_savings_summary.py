@@ -0,0 +1,101 @@
+# Generated by Django 6.0 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recommendations", "0003_audit_progress"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SavingsSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "resource_count",
+                    models.PositiveIntegerField(default=0, help_text="활성 리소스 수"),
+                ),
+                (
+                    "total_current_cost",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        help_text="활성 인벤토리 월 비용 합계",
+                        max_digits=12,
+                    ),
+                ),
+                (
+                    "cost_by_provider",
+                    models.JSONField(default=dict, help_text="provider별 월 비용"),
+                ),
+                (
+                    "cost_by_region",
+                    models.JSONField(default=dict, help_text="정규화 리전별 월 비용"),
+                ),
+                (
+                    "total_potential_savings",
+                    models.DecimalField(
+                        decimal_places=2, default=0, help_text="예상 절감액 합계", max_digits=12
+                    ),
+                ),
+                (
+                    "savings_percentage",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="절감률 (%) - save() 시 자동 계산",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "savings_by_provider",
+                    models.JSONField(default=dict, help_text="provider별 예상 절감액"),
+                ),
+                (
+                    "savings_by_region",
+                    models.JSONField(default=dict, help_text="정규화 리전별 예상 절감액"),
+                ),
+                (
+                    "savings_by_type",
+                    models.JSONField(default=dict, help_text="추천 유형별 예상 절감액"),
+                ),
+                (
+                    "latest_recommendation",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="절감액 계산에 사용한 최근 완료 진단",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="recommendations.recommendation",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        help_text="요약 대상 사용자",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="savings_summary",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "savings_summaries",
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-18 11:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventories", "0004_inventory_keyset_index"),
+        ("recommendations", "0004_savings_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditFingerprint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "fingerprint",
+                    models.CharField(help_text="진단 입력 해시 (sha256)", max_length=64),
+                ),
+                (
+                    "inventory",
+                    models.OneToOneField(
+                        help_text="진단 대상 인벤토리",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="audit_fingerprint",
+                        to="inventories.userinventory",
+                    ),
+                ),
+                (
+                    "recommendation",
+                    models.ForeignKey(
+                        help_text="이 입력으로 진단한 Recommendation (삭제되면 지문도 삭제되어 다시 진단)",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="recommendations.recommendation",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "audit_fingerprints",
+            },
+        ),
+    ]
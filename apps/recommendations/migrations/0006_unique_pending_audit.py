@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-18 16:10
+
+from django.db import migrations, models
+
+
+def fail_duplicate_pending(apps, schema_editor):
+    """사용자별로 가장 최근 PENDING 전체 진단만 남기고 나머지는 FAILED로 전환"""
+    Recommendation = apps.get_model("recommendations", "Recommendation")
+    pending = Recommendation.objects.filter(status="PENDING", inventory__isnull=True)
+    latest = {}
+    for pk, user_id in pending.order_by("user_id", "-created_at", "-id").values_list(
+        "id", "user_id"
+    ):
+        latest.setdefault(user_id, pk)
+    pending.exclude(pk__in=latest.values()).update(
+        status="FAILED", error_message="중복 진단 정리"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recommendations", "0005_audit_fingerprint"),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_duplicate_pending, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="recommendation",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("inventory__isnull", True), ("status", "PENDING")),
+                fields=("user",),
+                name="unique_pending_audit",
+            ),
+        ),
+    ]
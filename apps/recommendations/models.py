@@ -22,6 +22,16 @@ class Recommendation(BaseModel):
         COMPLETED = "COMPLETED", "완료"
         FAILED = "FAILED", "실패"
 
+    class Stage(models.TextChoices):
+        """비동기 진단 진행 단계"""
+
+        QUEUED = "QUEUED", "대기 중"
+        METRICS = "METRICS", "사용률 갱신"
+        RIGHTSIZING = "RIGHTSIZING", "적정 사이징"
+        AI_DIAGNOSIS = "AI_DIAGNOSIS", "AI 진단"
+        SAVING = "SAVING", "결과 저장"
+        DONE = "DONE", "완료"
+
     # ==================== 연결 정보 ====================
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -32,8 +42,10 @@ class Recommendation(BaseModel):
     inventory = models.ForeignKey(
         UserInventory,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         related_name="recommendations",
-        help_text="진단 대상 인벤토리 (어떤 리소스에 대한 진단인지)",
+        help_text="진단 대상 인벤토리 (비어 있으면 사용자 전체 인벤토리 진단)",
     )
 
     # ==================== 진단 상태 ====================
@@ -43,21 +55,45 @@ class Recommendation(BaseModel):
         default=Status.PENDING,
         help_text="진단 처리 상태",
     )
+    stage = models.CharField(
+        max_length=20,
+        choices=Stage.choices,
+        default=Stage.QUEUED,
+        help_text="비동기 진단 진행 단계",
+    )
+    progress = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="진행률 (0~100)",
+    )
+    task_id = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        help_text="django_q 작업 ID",
+    )
+    error_message = models.TextField(
+        blank=True,
+        default="",
+        help_text="실패 사유 (FAILED일 때)",
+    )
 
     # ==================== 비용 요약 ====================
     total_current_cost = models.DecimalField(
         max_digits=10,
         decimal_places=2,
+        default=0,
         help_text="현재 월 비용 (진단 시점 스냅샷)",
     )
     total_optimized_cost = models.DecimalField(
         max_digits=10,
         decimal_places=2,
+        default=0,
         help_text="최적화 후 예상 월 비용",
     )
     total_savings = models.DecimalField(
         max_digits=10,
         decimal_places=2,
+        default=0,
         help_text="총 예상 절감액 (current - optimized)",
     )
     savings_percentage = models.DecimalField(
@@ -70,6 +106,8 @@ class Recommendation(BaseModel):
 
     # ==================== AI 진단 결과 ====================
     diagnosis_summary = models.TextField(
+        blank=True,
+        default="",
         help_text="AI가 생성한 진단 요약 메시지",
     )
 
@@ -82,15 +120,28 @@ class Recommendation(BaseModel):
             # 인벤토리별 진단 이력 조회
             models.Index(fields=["inventory"]),
         ]
+        constraints = [
+            # 사용자당 진행 중인 전체 진단은 하나
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(status="PENDING", inventory__isnull=True),
+                name="unique_pending_audit",
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.user.username} - {self.inventory.instance_type} - ${self.total_savings} 절감"
+        target = self.inventory.instance_type if self.inventory else "전체"
+        return f"{self.user.username} - {target} - ${self.total_savings} 절감"
 
     def save(self, *args, **kwargs):
         """저장 시 절감률 자동 계산"""
+        self.compute_savings()
+        super().save(*args, **kwargs)
+
+    def compute_savings(self):
+        """절감률 계산"""
         if self.total_current_cost and self.total_current_cost > 0:
             self.savings_percentage = (self.total_savings / self.total_current_cost) * 100
-        super().save(*args, **kwargs)
 
 
 class RecommendationItem(BaseModel):
@@ -117,6 +168,14 @@ class RecommendationItem(BaseModel):
         related_name="items",
         help_text="상위 추천 결과",
     )
+    inventory = models.ForeignKey(
+        UserInventory,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="recommendation_items",
+        help_text="추천 대상 인벤토리 (사용자 전체 진단일 때 리소스 구분용)",
+    )
     recommended_service = models.ForeignKey(
         CloudService,
         on_delete=models.SET_NULL,
@@ -206,8 +265,115 @@ class RecommendationItem(BaseModel):
 
     def save(self, *args, **kwargs):
         """저장 시 절감액/절감률 자동 계산"""
+        self.compute_savings()
+        super().save(*args, **kwargs)
+
+    def compute_savings(self):
+        """절감액/절감률 계산 (save()와 RecommendationBulkService가 공유)"""
         if self.original_monthly_cost and self.expected_monthly_cost:
             self.savings_amount = self.original_monthly_cost - self.expected_monthly_cost
             if self.original_monthly_cost > 0:
                 self.savings_percentage = (self.savings_amount / self.original_monthly_cost) * 100
+
+
+class SavingsSummary(BaseModel):
+    """
+    사용자별 비용/절감 요약 (대시보드용 비정규화 테이블)
+
+    인벤토리가 바뀌거나 진단이 완료될 때 SavingsSummaryService가 해당 사용자 행만 갱신하므로
+    대시보드는 recommendations ⋈ recommendation_items ⋈ user_inventories 집계 없이 1행만 읽습니다.
+    breakdown 값은 Decimal 문자열입니다 (예: {"AWS": "120.50"}).
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="savings_summary",
+        help_text="요약 대상 사용자",
+    )
+    latest_recommendation = models.ForeignKey(
+        Recommendation,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        help_text="절감액 계산에 사용한 최근 완료 진단",
+    )
+
+    # ==================== 현재 비용 (활성 인벤토리 기준) ====================
+    resource_count = models.PositiveIntegerField(default=0, help_text="활성 리소스 수")
+    total_current_cost = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        help_text="활성 인벤토리 월 비용 합계",
+    )
+    cost_by_provider = models.JSONField(default=dict, help_text="provider별 월 비용")
+    cost_by_region = models.JSONField(default=dict, help_text="정규화 리전별 월 비용")
+
+    # ==================== 절감 가능액 (최근 완료 진단 기준) ====================
+    total_potential_savings = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        help_text="예상 절감액 합계",
+    )
+    savings_percentage = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="절감률 (%) - save() 시 자동 계산",
+    )
+    savings_by_provider = models.JSONField(default=dict, help_text="provider별 예상 절감액")
+    savings_by_region = models.JSONField(default=dict, help_text="정규화 리전별 예상 절감액")
+    savings_by_type = models.JSONField(default=dict, help_text="추천 유형별 예상 절감액")
+
+    class Meta:
+        db_table = "savings_summaries"
+
+    def __str__(self):
+        return f"{self.user.username} - ${self.total_potential_savings} 절감 가능"
+
+    def save(self, *args, **kwargs):
+        """저장 시 절감률 자동 계산"""
+        self.compute_savings()
         super().save(*args, **kwargs)
+
+    def compute_savings(self):
+        """절감률 계산 (절감액이 현재 비용보다 커지는 경우 100%로 제한)"""
+        if self.total_current_cost and self.total_current_cost > 0:
+            percentage = (self.total_potential_savings / self.total_current_cost) * 100
+            self.savings_percentage = min(percentage, 100)
+        else:
+            self.savings_percentage = None
+
+
+class AuditFingerprint(BaseModel):
+    """
+    리소스별 마지막 진단 입력 지문
+
+    (인벤토리 스펙/비용/사용률, 가격표 버전, 규칙 버전)의 해시와 그 입력으로 진단한
+    Recommendation을 기록합니다. 다음 진단에서 지문이 같으면 다시 진단하지 않고
+    해당 Recommendation의 추천 항목을 이어받습니다.
+    """
+
+    inventory = models.OneToOneField(
+        UserInventory,
+        on_delete=models.CASCADE,
+        related_name="audit_fingerprint",
+        help_text="진단 대상 인벤토리",
+    )
+    fingerprint = models.CharField(max_length=64, help_text="진단 입력 해시 (sha256)")
+    recommendation = models.ForeignKey(
+        Recommendation,
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="이 입력으로 진단한 Recommendation (삭제되면 지문도 삭제되어 다시 진단)",
+    )
+
+    class Meta:
+        db_table = "audit_fingerprints"
+
+    def __str__(self):
+        return f"{self.inventory_id} - {self.fingerprint[:12]}"
@@ -0,0 +1,34 @@
+from rest_framework import serializers
+
+from apps.recommendations.models import Recommendation, SavingsSummary
+from apps.recommendations.services.audit_task_service import AuditTaskService
+
+
+class AuditStatusSerializer(serializers.ModelSerializer):
+    """비동기 진단 상태 시리얼라이저 (폴링 응답)"""
+
+    class Meta:
+        model = Recommendation
+        fields = list(AuditTaskService.STATUS_FIELDS)
+        read_only_fields = fields
+
+
+class SavingsSummarySerializer(serializers.ModelSerializer):
+    """사용자 비용/절감 요약 시리얼라이저 (대시보드)"""
+
+    class Meta:
+        model = SavingsSummary
+        fields = [
+            "resource_count",
+            "total_current_cost",
+            "total_potential_savings",
+            "savings_percentage",
+            "cost_by_provider",
+            "cost_by_region",
+            "savings_by_provider",
+            "savings_by_region",
+            "savings_by_type",
+            "latest_recommendation",
+            "updated_at",
+        ]
+        read_only_fields = fields
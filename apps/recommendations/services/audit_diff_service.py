@@ -0,0 +1,141 @@
+import hashlib
+import logging
+from typing import Dict, List, Set
+
+from django.db.models import QuerySet
+
+from apps.core.dto.recommendation_dto import AuditPlanDTO
+from apps.costs.models import PriceCatalogVersion
+from apps.inventories.choices import UtilizationMetric
+from apps.inventories.models import UserInventory
+from apps.inventories.services.utilization_sketch_service import UtilizationSketchService
+from apps.recommendations.models import AuditFingerprint, Recommendation, RecommendationItem
+from apps.recommendations.services.audit_service import AuditRuleEngine
+
+logger = logging.getLogger(__name__)
+
+
+class AuditDiffService:
+    """
+    진단 입력 지문 비교
+
+    리소스마다 (스펙/비용/사용률, p95, 가격표 버전, 규칙 버전)을 해시해 마지막 진단 때와 비교합니다.
+    지문이 같은 리소스는 다시 진단하지 않고 이전 추천 항목을 복사하므로
+    야간 재진단 비용이 계정 크기가 아니라 바뀐 리소스 수에 비례합니다.
+    """
+
+    # 진단 결과에 영향을 주는 인벤토리 컬럼
+    INPUT_FIELDS = (
+        "provider",
+        "instance_type",
+        "region_normalized",
+        "vcpu",
+        "memory_gb",
+        "cpu_usage_avg",
+        "memory_usage_avg",
+        "current_monthly_cost",
+    )
+    # 적정 사이징이 쓰는 분위수 스케치 p95 (평균이 같아도 피크가 바뀌면 다시 진단)
+    PERCENTILE_METRICS = (UtilizationMetric.CPU, UtilizationMetric.MEMORY)
+
+    @staticmethod
+    def plan(user) -> AuditPlanDTO:
+        """활성 인벤토리의 현재 지문을 계산해 다시 진단할 리소스와 이어받을 리소스로 분류"""
+        catalog_version = AuditDiffService._catalog_version()
+        rows = list(
+            UserInventory.objects.filter(user=user, is_active=True).values_list(
+                "id",
+                *AuditDiffService.INPUT_FIELDS,
+                "audit_fingerprint__fingerprint",
+                "audit_fingerprint__recommendation_id",
+            )
+        )
+        percentiles = UtilizationSketchService.percentiles([row[0] for row in rows])
+
+        plan = AuditPlanDTO()
+        for inventory_id, *inputs, previous, recommendation_id in rows:
+            peaks = [
+                percentiles.get((inventory_id, metric))
+                for metric in AuditDiffService.PERCENTILE_METRICS
+            ]
+            fingerprint = AuditDiffService.fingerprint(
+                [*inputs, *(None if peak is None else f"{peak:.2f}" for peak in peaks)],
+                catalog_version,
+            )
+            plan.fingerprints[inventory_id] = fingerprint
+            if fingerprint == previous:
+                plan.carried[inventory_id] = recommendation_id
+                plan.carried_cost += float(inputs[-1])
+            else:
+                plan.changed_ids.append(inventory_id)
+
+        logger.info(
+            f"진단 입력 비교 user={user.pk} changed={len(plan.changed_ids)} "
+            f"carried={len(plan.carried)}"
+        )
+        return plan
+
+    @staticmethod
+    def fingerprint(inputs, catalog_version) -> str:
+        """INPUT_FIELDS 순서의 값(+ p95) + 가격표/규칙 버전 해시"""
+        payload = "|".join(
+            [
+                str(catalog_version),
+                str(AuditRuleEngine.VERSION),
+                *("" if value is None else str(value) for value in inputs),
+            ]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def carry_forward(
+        recommendation: Recommendation, plan: AuditPlanDTO
+    ) -> List[RecommendationItem]:
+        """입력이 바뀌지 않은 리소스의 이전 추천 항목을 새 Recommendation으로 복사 (저장 전)"""
+        if not plan.carried:
+            return []
+        previous: QuerySet = RecommendationItem.objects.select_related("inventory").filter(
+            recommendation_id__in=set(plan.carried.values()),
+            inventory_id__in=plan.carried.keys(),
+        )
+        items = []
+        for item in previous:
+            if plan.carried.get(item.inventory_id) != item.recommendation_id:
+                continue
+            item.pk = None
+            item._state.adding = True
+            item.recommendation = recommendation
+            items.append(item)
+        return items
+
+    @staticmethod
+    def record(recommendation: Recommendation, plan: AuditPlanDTO, unsettled_ids: Set[int]):
+        """
+        진단이 끝난 리소스의 지문을 새 Recommendation 기준으로 저장
+
+        AI 결과를 받지 못한 리소스는 기록하지 않아 다음 진단에서 다시 진단합니다.
+        """
+        settled: Dict[int, str] = {
+            inventory_id: fingerprint
+            for inventory_id, fingerprint in plan.fingerprints.items()
+            if inventory_id not in unsettled_ids
+        }
+        AuditFingerprint.objects.bulk_create(
+            [
+                AuditFingerprint(
+                    inventory_id=inventory_id,
+                    fingerprint=fingerprint,
+                    recommendation=recommendation,
+                )
+                for inventory_id, fingerprint in settled.items()
+            ],
+            batch_size=2000,
+            update_conflicts=True,
+            unique_fields=["inventory"],
+            update_fields=["fingerprint", "recommendation", "updated_at"],
+        )
+
+    @staticmethod
+    def _catalog_version() -> int:
+        """최신 가격표 반영 이력 id (가격표가 바뀌면 새 행이 생김)"""
+        return PriceCatalogVersion.objects.values_list("id", flat=True).first() or 0
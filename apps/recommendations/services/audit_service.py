@@ -0,0 +1,781 @@
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+import numpy as np
+from asgiref.sync import sync_to_async
+
+from apps.core.adapters.gemini_adapter import AsyncGeminiAdapter, GeminiAdapter
+from apps.core.dto.recommendation_dto import (
+    AIBatchResultDTO,
+    AuditDecisionDTO,
+    DiagnosisResultDTO,
+    RecommendationItemDTO,
+    RightsizingItemDTO,
+    RightsizingReportDTO,
+)
+from apps.core.utils.cache_helper import TwoTierCache
+from apps.costs.choices import PricingModel
+from apps.costs.models import CloudService, PriceCatalogVersion
+from apps.inventories.choices import UtilizationMetric
+from apps.inventories.models import UserInventory
+from apps.inventories.services.utilization_sketch_service import UtilizationSketchService
+from apps.recommendations.models import RecommendationItem
+
+logger = logging.getLogger(__name__)
+
+HOURS_PER_MONTH = 730
+
+# 리전별 가격표 조각 캐시 (catalog_refreshed 수신 시 invalidate)
+catalog_cache = TwoTierCache("catalog_slice", maxsize=256)
+
+RecommendationType = RecommendationItem.RecommendationType
+
+
+@dataclass
+class InventoryArrays:
+    """인벤토리 컬럼 배열 (행 = 리소스)"""
+
+    ids: np.ndarray
+    resource_ids: np.ndarray
+    providers: np.ndarray
+    instance_types: np.ndarray
+    regions: np.ndarray
+    vcpu: np.ndarray
+    memory_gb: np.ndarray
+    cpu_usage: np.ndarray  # 사용률 미수집은 NaN
+    memory_usage: np.ndarray
+    monthly_cost: np.ndarray
+    # 일자별 분위수 스케치를 병합한 최근 7일 p95 (스케치가 없으면 NaN)
+    cpu_p95: np.ndarray = field(default=None)
+    memory_p95: np.ndarray = field(default=None)
+
+    FIELDS = (
+        "id",
+        "resource_id",
+        "provider",
+        "instance_type",
+        "region_normalized",
+        "vcpu",
+        "memory_gb",
+        "cpu_usage_avg",
+        "memory_usage_avg",
+        "current_monthly_cost",
+    )
+
+    @classmethod
+    def from_queryset(cls, queryset: QuerySet) -> "InventoryArrays":
+        rows = list(queryset.values_list(*cls.FIELDS))
+        columns = list(zip(*rows)) if rows else [()] * len(cls.FIELDS)
+        return cls(
+            ids=np.array(columns[0], dtype=np.int64),
+            resource_ids=np.array(columns[1], dtype=object),
+            providers=np.array(columns[2], dtype=object),
+            instance_types=np.array(columns[3], dtype=object),
+            regions=np.array([r or "" for r in columns[4]], dtype=object),
+            vcpu=np.array(columns[5], dtype=np.float64),
+            memory_gb=np.array(columns[6], dtype=np.float64),
+            cpu_usage=_to_float_array(columns[7]),
+            memory_usage=_to_float_array(columns[8]),
+            monthly_cost=np.array(columns[9], dtype=np.float64),
+        )
+
+    def __post_init__(self):
+        if self.cpu_p95 is None:
+            self.cpu_p95 = np.full(len(self.ids), np.nan)
+        if self.memory_p95 is None:
+            self.memory_p95 = np.full(len(self.ids), np.nan)
+
+    def apply_percentiles(self, values: Dict[Tuple[int, str], float]):
+        """UtilizationSketchService.percentiles 결과를 p95 배열에 반영"""
+        for column, metric in (
+            (self.cpu_p95, UtilizationMetric.CPU),
+            (self.memory_p95, UtilizationMetric.MEMORY),
+        ):
+            column[:] = [values.get((inventory_id, metric), np.nan) for inventory_id in self.ids]
+
+    @property
+    def peak_cpu(self) -> np.ndarray:
+        """과다 스펙 판단용 CPU 사용률 (p95, 없으면 평균)"""
+        return np.where(np.isnan(self.cpu_p95), self.cpu_usage, self.cpu_p95)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+@dataclass
+class CatalogArrays:
+    """후보 CloudService 컬럼 배열 (행 = 상품, 월 비용 오름차순)"""
+
+    ids: np.ndarray
+    providers: np.ndarray
+    instance_types: np.ndarray
+    regions: np.ndarray
+    vcpu: np.ndarray
+    memory_gb: np.ndarray
+    monthly_cost: np.ndarray
+
+    @classmethod
+    def from_queryset(cls, queryset: QuerySet) -> "CatalogArrays":
+        rows = list(
+            queryset.values_list(
+                "id",
+                "provider",
+                "instance_type",
+                "region_normalized",
+                "vcpu",
+                "memory_gb",
+                "price_per_hour",
+            )
+        )
+        columns = list(zip(*rows)) if rows else [()] * 7
+        monthly_cost = np.array(columns[6], dtype=np.float64) * HOURS_PER_MONTH
+        return cls(
+            ids=np.array(columns[0], dtype=np.int64),
+            providers=np.array(columns[1], dtype=object),
+            instance_types=np.array(columns[2], dtype=object),
+            regions=np.array(columns[3], dtype=object),
+            vcpu=np.array(columns[4], dtype=np.float64),
+            memory_gb=np.array(columns[5], dtype=np.float64),
+            monthly_cost=monthly_cost,
+        ).sorted()
+
+    @classmethod
+    def concat(cls, parts: List["CatalogArrays"]) -> "CatalogArrays":
+        """리전별 조각을 합쳐 다시 월 비용 오름차순으로 정렬"""
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return cls.from_queryset(CloudService.objects.none())
+        return cls(
+            **{
+                name: np.concatenate([getattr(part, name) for part in parts])
+                for name in cls.__dataclass_fields__
+            }
+        ).sorted()
+
+    def sorted(self) -> "CatalogArrays":
+        order = np.argsort(self.monthly_cost, kind="stable")
+        return CatalogArrays(
+            **{name: getattr(self, name)[order] for name in self.__dataclass_fields__}
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def _to_float_array(values: Iterable) -> np.ndarray:
+    """Decimal/None 목록을 float 배열로 (None은 NaN)"""
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+
+class RightsizingEngine:
+    """
+    벡터화 적정 사이징 엔진
+
+    1. 사용률을 목표 사용률로 나눠 리소스별 필요 vCPU/메모리를 한 번에 계산
+    2. 파티션(리전, provider)마다 필요 스펙 조합을 중복 제거한 뒤
+       (스펙 조합 x 후보) 불리언 행렬에서 가장 저렴한 충족 후보를 argmax로 선택
+    3. 현재 비용과의 차이로 절감액 계산
+
+    파이썬 루프는 파티션 수만큼만 돕니다.
+    """
+
+    TARGET_UTILIZATION = 0.7
+    # p95 사용률 기준 목표 (버스트 구간에도 이 이하로 유지)
+    PEAK_TARGET_UTILIZATION = 0.9
+    OVER_PROVISIONED_CPU = 30
+    UNDER_UTILIZED_CPU = 10
+    MIN_MEMORY_GB = 0.5
+    # 한 번에 만드는 불리언 행렬 최대 크기
+    MAX_MATRIX_CELLS = 4_000_000
+
+    def __init__(self, catalog: CatalogArrays, same_provider: bool = True):
+        """
+        Args:
+            catalog: 후보 상품 배열
+            same_provider: True면 같은 provider 안에서만 다운사이징 후보를 찾음
+        """
+        self.catalog = catalog
+        self.same_provider = same_provider
+
+    def required_specs(self, inventory: InventoryArrays):
+        """
+        사용률 기반 필요 vCPU/메모리
+
+        평균 기준(TARGET_UTILIZATION)과 p95 기준(PEAK_TARGET_UTILIZATION) 중 큰 값을 써서
+        평균은 낮지만 버스트가 큰 리소스를 과하게 줄이지 않습니다.
+        사용률이 없는 지표는 현재 스펙을 그대로 필요 스펙으로 봅니다.
+        """
+        with np.errstate(invalid="ignore"):
+            cpu_ratio = np.fmax(
+                inventory.cpu_usage / self.TARGET_UTILIZATION,
+                inventory.cpu_p95 / self.PEAK_TARGET_UTILIZATION,
+            )
+            memory_ratio = np.fmax(
+                inventory.memory_usage / self.TARGET_UTILIZATION,
+                inventory.memory_p95 / self.PEAK_TARGET_UTILIZATION,
+            )
+            required_vcpu = np.ceil(inventory.vcpu * cpu_ratio / 100)
+            required_memory = inventory.memory_gb * memory_ratio / 100
+        required_vcpu = np.where(np.isnan(required_vcpu), inventory.vcpu, required_vcpu)
+        required_memory = np.where(np.isnan(required_memory), inventory.memory_gb, required_memory)
+        # 현재 스펙보다 크게 잡지 않음 (업사이징은 다루지 않음)
+        required_vcpu = np.clip(required_vcpu, 1, np.maximum(inventory.vcpu, 1))
+        required_memory = np.clip(
+            np.round(required_memory, 2),
+            self.MIN_MEMORY_GB,
+            np.maximum(inventory.memory_gb, self.MIN_MEMORY_GB),
+        )
+        return required_vcpu, required_memory
+
+    def best_fit(
+        self, inventory: InventoryArrays, required_vcpu: np.ndarray, required_memory: np.ndarray
+    ) -> np.ndarray:
+        """리소스별 필요 스펙을 만족하는 가장 저렴한 후보의 catalog 인덱스 (없으면 -1)"""
+        best = np.full(len(inventory), -1, dtype=np.int64)
+        if not len(inventory) or not len(self.catalog):
+            return best
+
+        inventory_keys = self._partition_keys(inventory.regions, inventory.providers)
+        catalog_keys = self._partition_keys(self.catalog.regions, self.catalog.providers)
+
+        for key in np.unique(inventory_keys):
+            if key.startswith("|") or key == "":
+                continue  # 정규화 리전 없음
+            rows = np.flatnonzero(inventory_keys == key)
+            candidates = np.flatnonzero(catalog_keys == key)  # 이미 가격 오름차순
+            if not len(candidates):
+                continue
+
+            specs = np.stack([required_vcpu[rows], required_memory[rows]], axis=1)
+            unique_specs, inverse = np.unique(specs, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            candidate_vcpu = self.catalog.vcpu[candidates]
+            candidate_memory = self.catalog.memory_gb[candidates]
+
+            spec_best = np.full(len(unique_specs), -1, dtype=np.int64)
+            step = max(1, self.MAX_MATRIX_CELLS // len(candidates))
+            for start in range(0, len(unique_specs), step):
+                chunk = unique_specs[start : start + step]
+                fits = (candidate_vcpu >= chunk[:, :1]) & (candidate_memory >= chunk[:, 1:])
+                first = fits.argmax(axis=1)
+                spec_best[start : start + step] = np.where(fits.any(axis=1), candidates[first], -1)
+            best[rows] = spec_best[inverse]
+        return best
+
+    def evaluate(self, inventory: InventoryArrays) -> dict:
+        """
+        전체 인벤토리 적정 사이징 (컬럼 배열 반환)
+
+        Returns:
+            {"required_vcpu", "required_memory_gb", "best_index", "best_cost", "savings",
+             "is_over_provisioned", "is_under_utilized"}
+        """
+        required_vcpu, required_memory = self.required_specs(inventory)
+        best = self.best_fit(inventory, required_vcpu, required_memory)
+
+        has_candidate = best >= 0
+        safe_best = np.where(has_candidate, best, 0)
+        best_cost = np.where(
+            has_candidate,
+            self.catalog.monthly_cost[safe_best] if len(self.catalog) else 0,
+            np.nan,
+        )
+        savings = np.where(has_candidate, inventory.monthly_cost - best_cost, 0.0)
+        if len(self.catalog):
+            same_instance = has_candidate & (
+                (self.catalog.providers[safe_best] == inventory.providers)
+                & (self.catalog.instance_types[safe_best] == inventory.instance_types)
+            )
+        else:
+            same_instance = has_candidate
+        # 현재 인스턴스와 같거나 더 비싸면 추천하지 않음
+        recommend = has_candidate & ~same_instance & (savings > 0)
+
+        # 평균이 낮아도 버스트가 큰 리소스는 과다 스펙으로 보지 않도록 p95 기준
+        peak_cpu = inventory.peak_cpu
+        cpu_known = ~np.isnan(peak_cpu)
+        return {
+            "required_vcpu": required_vcpu,
+            "required_memory_gb": required_memory,
+            "best_index": np.where(recommend, best, -1),
+            "best_cost": np.where(recommend, best_cost, np.nan),
+            "savings": np.where(recommend, savings, 0.0),
+            "cpu_known": cpu_known,
+            "is_over_provisioned": cpu_known & (peak_cpu < self.OVER_PROVISIONED_CPU),
+            "is_under_utilized": cpu_known & (peak_cpu < self.UNDER_UTILIZED_CPU),
+        }
+
+    def _partition_keys(self, regions: np.ndarray, providers: np.ndarray) -> np.ndarray:
+        if not self.same_provider:
+            return regions.astype(str)
+        return np.char.add(np.char.add(regions.astype(str), "|"), providers.astype(str))
+
+
+class AuditRuleEngine:
+    """
+    AI 호출 전 결정적 사전 진단
+
+    사용률 임계값과 가격표만으로 판단이 끝나는 리소스를 분류합니다.
+    - NO_ACTION: 적정 사용률이거나 사용률 데이터가 없음
+    - DOWNSIZE: CPU p95(없으면 평균) 30% 미만이고 같은 provider에 충분히 저렴한 하위 스펙이 있음
+    - SWITCH_PRICING: CPU가 꾸준히 40~80%이고 Reserved 가격이 충분히 저렴함
+    그 외(과부하, 저사용인데 대안 없음 등)는 decision=None으로 남겨 AI에 넘깁니다.
+    """
+
+    # 규칙/임계값을 바꾸면 올림 - 진단 입력 지문에 포함되어 전체 리소스가 다시 진단됨
+    VERSION = 1
+    OVER_PROVISIONED_CPU = RightsizingEngine.OVER_PROVISIONED_CPU
+    STEADY_CPU_MIN = 40
+    STEADY_CPU_MAX = 80
+    # 이보다 작은 절감률은 추천하지 않음
+    MIN_SAVINGS_RATIO = 0.1
+
+    @staticmethod
+    def classify(
+        inventory: InventoryArrays,
+        catalog: CatalogArrays,
+        rightsizing: dict,
+        reserved_cost: np.ndarray,
+        reserved_ids: np.ndarray,
+    ) -> List[AuditDecisionDTO]:
+        """
+        Args:
+            inventory: 인벤토리 배열
+            catalog: 다운사이징 후보 배열 (RightsizingEngine과 동일)
+            rightsizing: RightsizingEngine.evaluate 결과
+            reserved_cost: 리소스별 같은 인스턴스의 Reserved 월 비용 (없으면 NaN)
+            reserved_ids: 리소스별 Reserved CloudService id (없으면 -1)
+        """
+        cpu = inventory.cpu_usage
+        cost = inventory.monthly_cost
+        known = ~np.isnan(cpu)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            downsize_ratio = np.where(cost > 0, rightsizing["savings"] / cost, 0.0)
+            reserved_savings = np.where(np.isnan(reserved_cost), 0.0, cost - reserved_cost)
+            reserved_ratio = np.where(cost > 0, reserved_savings / cost, 0.0)
+            low = known & (inventory.peak_cpu < AuditRuleEngine.OVER_PROVISIONED_CPU)
+            steady = (
+                known
+                & (cpu >= AuditRuleEngine.STEADY_CPU_MIN)
+                & (cpu <= AuditRuleEngine.STEADY_CPU_MAX)
+            )
+            fits = known & (cpu >= AuditRuleEngine.OVER_PROVISIONED_CPU)
+            fits &= cpu <= AuditRuleEngine.STEADY_CPU_MAX
+
+        downsize = low & (rightsizing["best_index"] >= 0)
+        downsize &= downsize_ratio >= AuditRuleEngine.MIN_SAVINGS_RATIO
+        switch = steady & (reserved_ratio >= AuditRuleEngine.MIN_SAVINGS_RATIO)
+
+        # 먼저 맞는 조건이 우선
+        decisions = np.select(
+            [~known, downsize, switch, fits],
+            [
+                RecommendationType.NO_ACTION,
+                RecommendationType.DOWNSIZE,
+                RecommendationType.SWITCH_PRICING,
+                RecommendationType.NO_ACTION,
+            ],
+            default="",
+        ).tolist()
+
+        results = []
+        rows = zip(
+            inventory.ids.tolist(),
+            inventory.resource_ids.tolist(),
+            inventory.instance_types.tolist(),
+            cost.round(2).tolist(),
+        )
+        for i, (decision, (inventory_id, resource_id, instance_type, monthly_cost)) in enumerate(
+            zip(decisions, rows)
+        ):
+            result = AuditDecisionDTO(
+                inventory_id=inventory_id,
+                resource_id=resource_id,
+                instance_type=instance_type,
+                current_monthly_cost=monthly_cost,
+                decision=decision or None,
+                reason="",
+            )
+            if decision == RecommendationType.DOWNSIZE:
+                index = int(rightsizing["best_index"][i])
+                result.recommended_service_id = int(catalog.ids[index])
+                result.recommended_instance_type = catalog.instance_types[index]
+                result.recommended_monthly_cost = round(float(rightsizing["best_cost"][i]), 2)
+                result.monthly_savings = round(float(rightsizing["savings"][i]), 2)
+                result.reason = (
+                    f"CPU {cpu[i]:.1f}% 사용 - 필요 스펙 "
+                    f"{int(rightsizing['required_vcpu'][i])} vCPU / "
+                    f"{rightsizing['required_memory_gb'][i]:.1f}GB 기준 "
+                    f"{result.recommended_instance_type}로 축소"
+                )
+            elif decision == RecommendationType.SWITCH_PRICING:
+                result.recommended_service_id = int(reserved_ids[i])
+                result.recommended_instance_type = result.instance_type
+                result.recommended_monthly_cost = round(float(reserved_cost[i]), 2)
+                result.monthly_savings = round(float(reserved_savings[i]), 2)
+                result.reason = f"CPU {cpu[i]:.1f}%로 꾸준히 사용 중 - Reserved 요금제 전환"
+            elif decision == RecommendationType.NO_ACTION:
+                result.reason = "사용률 데이터가 없어 현행 유지" if not known[i] else "적정 사용률"
+            elif rightsizing["best_index"][i] >= 0:
+                # AI 판단 대상이지만 AI를 쓸 수 없을 때 대신 쓸 규칙 기반 대안
+                index = int(rightsizing["best_index"][i])
+                result.recommended_service_id = int(catalog.ids[index])
+                result.recommended_instance_type = catalog.instance_types[index]
+                result.recommended_monthly_cost = round(float(rightsizing["best_cost"][i]), 2)
+                result.monthly_savings = round(float(rightsizing["savings"][i]), 2)
+                result.reason = (
+                    f"필요 스펙 {int(rightsizing['required_vcpu'][i])} vCPU / "
+                    f"{rightsizing['required_memory_gb'][i]:.1f}GB 기준 최저가 대안"
+                )
+            results.append(result)
+
+        decided = sum(1 for result in results if not result.needs_ai)
+        logger.info(f"규칙 기반 사전 진단: {decided}/{len(results)}건 확정")
+        return results
+
+
+class AuditService:
+    """인벤토리 비용 진단"""
+
+    @staticmethod
+    def rightsize_user(
+        user,
+        same_provider: bool = True,
+        pricing_model: str = PricingModel.ON_DEMAND,
+    ) -> RightsizingReportDTO:
+        """
+        사용자의 활성 인벤토리 전체를 한 번에 적정 사이징
+
+        Args:
+            user: 진단 대상 사용자
+            same_provider: True면 같은 provider 내 다운사이징, False면 타사 포함 최저가
+            pricing_model: 후보 상품 가격 모델
+        """
+        inventories = UserInventory.objects.filter(user=user, is_active=True)
+        return AuditService.rightsize(inventories, user.pk, same_provider, pricing_model)
+
+    @staticmethod
+    def rightsize(
+        inventories: QuerySet,
+        user_id: int,
+        same_provider: bool = True,
+        pricing_model: str = PricingModel.ON_DEMAND,
+    ) -> RightsizingReportDTO:
+        """인벤토리 QuerySet을 배열로 읽어 벡터화 엔진으로 진단"""
+        inventory, catalog = AuditService._load(inventories, pricing_model)
+        result = RightsizingEngine(catalog, same_provider=same_provider).evaluate(inventory)
+        items = AuditService._to_items(inventory, catalog, result)
+
+        total_current = float(inventory.monthly_cost.sum())
+        total_savings = float(result["savings"].sum())
+        logger.info(
+            f"적정 사이징 완료 resources={len(inventory)} candidates={len(catalog)} "
+            f"savings={total_savings:.2f}"
+        )
+        return RightsizingReportDTO(
+            user_id=user_id,
+            total_current_cost=round(total_current, 2),
+            total_optimized_cost=round(total_current - total_savings, 2),
+            total_savings=round(total_savings, 2),
+            items=items,
+        )
+
+    @staticmethod
+    def pre_audit(inventories: QuerySet) -> List[AuditDecisionDTO]:
+        """규칙 기반 사전 진단 (AI 호출 없음)"""
+        inventory, catalog = AuditService._load(inventories, PricingModel.ON_DEMAND)
+        rightsizing = RightsizingEngine(catalog, same_provider=True).evaluate(inventory)
+        reserved_cost, reserved_ids = AuditService._reserved_prices(inventory)
+        return AuditRuleEngine.classify(
+            inventory, catalog, rightsizing, reserved_cost, reserved_ids
+        )
+
+    @staticmethod
+    def diagnose_user(
+        user,
+        adapter: Optional[GeminiAdapter] = None,
+        on_ai_start: Optional[Callable[[int], None]] = None,
+        inventory_ids: Optional[Collection[int]] = None,
+    ) -> DiagnosisResultDTO:
+        """
+        사용자 인벤토리 비용 진단
+
+        1. 규칙 기반 사전 진단으로 NO_ACTION / DOWNSIZE / SWITCH_PRICING 확정
+        2. 판단이 애매한 리소스만 모아 Gemini 배치 진단
+        3. AI 진단에 실패한 리소스는 규칙 기반 대안으로 대체
+
+        Args:
+            user: 진단 대상 사용자
+            adapter: Gemini 어댑터 (기본값: settings.GEMINI_API_KEY로 생성, 키가 없으면 AI 생략)
+            on_ai_start: AI 진단 직전에 AI 대상 리소스 수로 호출 (진행률 표시용)
+            inventory_ids: 진단할 인벤토리 (기본값: 사용자의 활성 인벤토리 전체)
+        """
+        context = AuditService._prepare(user, inventory_ids)
+        ai_result = None
+        if context["resources"]:
+            adapter = adapter or AuditService._default_adapter(GeminiAdapter)
+            if adapter is not None:
+                if on_ai_start is not None:
+                    on_ai_start(len(context["resources"]))
+                ai_result = adapter.generate_batch_diagnosis(
+                    context["resources"], catalog_version=context["catalog_version"]
+                )
+        return AuditService._finish(user, context, ai_result)
+
+    @staticmethod
+    async def adiagnose_user(
+        user,
+        adapter: Optional[AsyncGeminiAdapter] = None,
+        inventory_ids: Optional[Collection[int]] = None,
+    ) -> DiagnosisResultDTO:
+        """
+        diagnose_user의 비동기 버전
+
+        DB 작업은 sync_to_async로 실행하고 Gemini 호출만 이벤트 루프에서 기다립니다.
+        """
+        context = await sync_to_async(AuditService._prepare)(user, inventory_ids)
+        ai_result = None
+        if context["resources"]:
+            adapter = adapter or AuditService._default_adapter(AsyncGeminiAdapter)
+            if adapter is not None:
+                ai_result = await adapter.agenerate_batch_diagnosis(
+                    context["resources"], catalog_version=context["catalog_version"]
+                )
+        return AuditService._finish(user, context, ai_result)
+
+    @staticmethod
+    def _default_adapter(adapter_class):
+        if not settings.GEMINI_API_KEY:
+            return None
+        return adapter_class(settings.GEMINI_API_KEY)
+
+    @staticmethod
+    def _prepare(user, inventory_ids: Optional[Collection[int]] = None) -> dict:
+        """규칙 기반 사전 진단 + AI에 보낼 리소스 준비 (DB 접근은 여기서만)"""
+        inventories = UserInventory.objects.filter(user=user, is_active=True)
+        if inventory_ids is not None:
+            inventories = inventories.filter(id__in=inventory_ids)
+        decisions = AuditService.pre_audit(inventories)
+        ambiguous_ids = [decision.inventory_id for decision in decisions if decision.needs_ai]
+        resources = AuditService._ai_payload(inventories, ambiguous_ids) if ambiguous_ids else []
+        return {
+            "decisions": decisions,
+            "resources": resources,
+            "catalog_version": AuditService._catalog_version() if resources else "",
+        }
+
+    @staticmethod
+    def _finish(user, context: dict, ai_result: Optional[AIBatchResultDTO]) -> DiagnosisResultDTO:
+        """규칙 결과와 AI 결과를 DiagnosisResultDTO로 병합"""
+        decisions: List[AuditDecisionDTO] = context["decisions"]
+        resources: List[dict] = context["resources"]
+
+        items = [
+            AuditService._decision_item(decision, decision.decision)
+            for decision in decisions
+            if decision.decision in (RecommendationType.DOWNSIZE, RecommendationType.SWITCH_PRICING)
+        ]
+        summary = f"{len(decisions)}개 리소스 중 {len(items)}개 최적화 대상"
+        ai_reviewed = 0
+        unsettled = [decision.inventory_id for decision in decisions if decision.needs_ai]
+
+        if ai_result is not None:
+            items.extend(AuditService._merge_ai_items(resources, ai_result))
+            ai_reviewed = len(resources) - len(ai_result.failed_resource_ids)
+            summary = "\n".join([summary, *ai_result.summaries])
+            failed = set(ai_result.failed_resource_ids)
+            unsettled = [
+                decision.inventory_id
+                for decision in decisions
+                if decision.needs_ai and decision.resource_id in failed
+            ]
+            if failed:
+                items.extend(
+                    AuditService._decision_item(decision, RecommendationType.RIGHTSIZING)
+                    for decision in decisions
+                    if decision.needs_ai
+                    and decision.resource_id in failed
+                    and decision.recommended_service_id is not None
+                )
+                summary += f" (AI 진단 실패 {len(failed)}개는 규칙 기반 결과로 대체)"
+        elif resources:
+            summary = f"{summary} (AI 진단 대기 {len(resources)}개)"
+
+        total_current = sum(decision.current_monthly_cost for decision in decisions)
+        total_savings = sum(item.savings for item in items)
+        return DiagnosisResultDTO(
+            user_id=user.pk,
+            total_current_cost=round(total_current, 2),
+            total_optimized_cost=round(total_current - total_savings, 2),
+            total_savings=round(total_savings, 2),
+            diagnosis_summary=summary,
+            items=items,
+            rule_decided=len(decisions) - len(resources),
+            ai_reviewed=ai_reviewed,
+            unsettled_inventory_ids=unsettled,
+        )
+
+    @staticmethod
+    def _decision_item(decision: AuditDecisionDTO, recommendation_type: str):
+        return RecommendationItemDTO(
+            original_instance=decision.instance_type,
+            original_cost=decision.current_monthly_cost,
+            recommended_instance=decision.recommended_instance_type,
+            recommended_cost=decision.recommended_monthly_cost,
+            savings=decision.monthly_savings,
+            reason=decision.reason,
+            recommendation_type=recommendation_type,
+            inventory_id=decision.inventory_id,
+            recommended_service_id=decision.recommended_service_id,
+        )
+
+    @staticmethod
+    def _merge_ai_items(
+        resources: List[dict], ai_result: AIBatchResultDTO
+    ) -> List[RecommendationItemDTO]:
+        """AI 리소스별 진단을 RecommendationItemDTO로 변환 (NO_ACTION 제외)"""
+        by_resource = {resource["resource_id"]: resource for resource in resources}
+        items = []
+        for ai_item in ai_result.items:
+            resource = by_resource.get(ai_item.resource_id)
+            if resource is None or ai_item.recommendation_type == RecommendationType.NO_ACTION:
+                continue
+            original_cost = resource["current_monthly_cost"]
+            recommended_cost = ai_item.recommended_monthly_cost
+            if recommended_cost is None:
+                recommended_cost = original_cost
+            items.append(
+                RecommendationItemDTO(
+                    original_instance=resource["instance_type"],
+                    original_cost=original_cost,
+                    recommended_instance=ai_item.recommended_instance or resource["instance_type"],
+                    recommended_cost=recommended_cost,
+                    savings=round(max(original_cost - recommended_cost, 0.0), 2),
+                    reason=ai_item.reason,
+                    recommendation_type=ai_item.recommendation_type,
+                    inventory_id=resource["id"],
+                )
+            )
+        return items
+
+    @staticmethod
+    def _load(inventories: QuerySet, pricing_model: str):
+        """인벤토리(+ 분위수 스케치 p95)와 같은 정규화 리전의 후보 상품을 배열로 로드"""
+        inventory = InventoryArrays.from_queryset(inventories)
+        inventory.apply_percentiles(UtilizationSketchService.percentiles(inventory.ids.tolist()))
+        regions = sorted({region for region in inventory.regions.tolist() if region})
+        catalog = CatalogArrays.concat(
+            [AuditService.catalog_slice(region, pricing_model) for region in regions]
+        )
+        return inventory, catalog
+
+    @staticmethod
+    def catalog_slice(region_normalized: str, pricing_model: str) -> CatalogArrays:
+        """정규화 리전 하나의 활성 상품 배열 (2단계 캐시, 가격표 갱신 시 무효화)"""
+        return catalog_cache.get_or_set(
+            f"{pricing_model}:{region_normalized}",
+            lambda: CatalogArrays.from_queryset(
+                CloudService.objects.filter(
+                    is_active=True,
+                    pricing_model=pricing_model,
+                    region_normalized=region_normalized,
+                )
+            ),
+        )
+
+    @staticmethod
+    def _reserved_prices(inventory: InventoryArrays):
+        """리소스별 같은 인스턴스 타입의 Reserved 월 비용/ID (없으면 NaN/-1)"""
+        reserved = {
+            (provider, instance_type, region): (service_id, float(price) * HOURS_PER_MONTH)
+            for service_id, provider, instance_type, region, price in CloudService.objects.filter(
+                is_active=True,
+                pricing_model=PricingModel.RESERVED,
+                instance_type__in=set(inventory.instance_types.tolist()),
+            ).values_list("id", "provider", "instance_type", "region_normalized", "price_per_hour")
+        }
+        matches = [
+            reserved.get(key, (-1, np.nan))
+            for key in zip(
+                inventory.providers.tolist(),
+                inventory.instance_types.tolist(),
+                inventory.regions.tolist(),
+            )
+        ]
+        ids = np.array([service_id for service_id, _ in matches], dtype=np.int64)
+        costs = np.array([cost for _, cost in matches], dtype=np.float64)
+        return costs, ids
+
+    @staticmethod
+    def _catalog_version() -> str:
+        """AI 응답 캐시 키에 쓰는 최신 가격표 버전"""
+        return PriceCatalogVersion.objects.values_list("offer_version", flat=True).first() or ""
+
+    @staticmethod
+    def _ai_payload(inventories: QuerySet, inventory_ids: List[int]) -> List[dict]:
+        """AI에 보낼 리소스 정보 (판단이 필요한 리소스만)"""
+        return [
+            {
+                key: (float(value) if isinstance(value, Decimal) else value)
+                for key, value in row.items()
+            }
+            for row in inventories.filter(id__in=inventory_ids).values(
+                "id",
+                "resource_id",
+                "provider",
+                "instance_type",
+                "region",
+                "region_normalized",
+                "vcpu",
+                "memory_gb",
+                "cpu_usage_avg",
+                "memory_usage_avg",
+                "current_monthly_cost",
+            )
+        ]
+
+    @staticmethod
+    def _to_items(
+        inventory: InventoryArrays, catalog: CatalogArrays, result: dict
+    ) -> List[RightsizingItemDTO]:
+        """결과 배열을 DTO 목록으로 변환 (컬럼을 tolist로 한 번에 파이썬 객체화)"""
+        best_index = result["best_index"]
+        recommended = best_index >= 0
+        safe_index = np.where(recommended, best_index, 0)
+        cpu_known = result["cpu_known"]
+
+        def column(values: np.ndarray, mask: np.ndarray) -> list:
+            return np.where(mask, values, None).tolist()
+
+        if len(catalog):
+            service_ids = column(catalog.ids[safe_index], recommended)
+            providers = column(catalog.providers[safe_index], recommended)
+            instance_types = column(catalog.instance_types[safe_index], recommended)
+        else:
+            service_ids = providers = instance_types = [None] * len(inventory)
+
+        columns = zip(
+            inventory.ids.tolist(),
+            inventory.resource_ids.tolist(),
+            inventory.providers.tolist(),
+            inventory.instance_types.tolist(),
+            inventory.monthly_cost.round(2).tolist(),
+            column(inventory.cpu_usage, cpu_known),
+            column(inventory.memory_usage, ~np.isnan(inventory.memory_usage)),
+            result["required_vcpu"].astype(int).tolist(),
+            result["required_memory_gb"].tolist(),
+            column(result["is_over_provisioned"], cpu_known),
+            column(result["is_under_utilized"], cpu_known),
+            service_ids,
+            providers,
+            instance_types,
+            column(result["best_cost"].round(2), recommended),
+            result["savings"].round(2).tolist(),
+        )
+        return [RightsizingItemDTO(*row) for row in columns]
@@ -0,0 +1,249 @@
+import logging
+from datetime import timedelta
+from decimal import Decimal
+from typing import List
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from django_q.tasks import async_task
+
+from apps.core.dto.recommendation_dto import AuditPlanDTO, DiagnosisResultDTO
+from apps.core.exceptions.recommendation_exceptions import RecommendationNotFound
+from apps.inventories.models import UserInventory
+from apps.inventories.services.cloudwatch_sync_service import CloudWatchSyncService
+from apps.recommendations.models import Recommendation, RecommendationItem
+from apps.recommendations.services.audit_diff_service import AuditDiffService
+from apps.recommendations.services.audit_service import AuditService
+from apps.recommendations.services.recommendation_bulk_service import RecommendationBulkService
+from apps.recommendations.services.savings_summary_service import SavingsSummaryService
+
+logger = logging.getLogger(__name__)
+
+Stage = Recommendation.Stage
+
+
+class AuditTaskService:
+    """
+    비동기 비용 진단 파이프라인 (django_q)
+
+    API는 PENDING 상태의 Recommendation만 만들고 작업을 큐에 넣은 뒤 바로 응답합니다.
+    워커가 사용률 갱신 → 적정 사이징/규칙 진단 → AI 진단 → 결과 저장 순으로 실행하며
+    단계마다 stage/progress를 갱신하므로 클라이언트는 상태 조회 API로 폴링합니다.
+    """
+
+    TASK = "apps.recommendations.tasks.run_audit"
+    # 단계 진입 시 진행률
+    PROGRESS = {
+        Stage.QUEUED: 0,
+        Stage.METRICS: 10,
+        Stage.RIGHTSIZING: 40,
+        Stage.AI_DIAGNOSIS: 60,
+        Stage.SAVING: 90,
+        Stage.DONE: 100,
+    }
+    STATUS_FIELDS = (
+        "id",
+        "status",
+        "stage",
+        "progress",
+        "total_current_cost",
+        "total_optimized_cost",
+        "total_savings",
+        "savings_percentage",
+        "diagnosis_summary",
+        "error_message",
+        "created_at",
+        "updated_at",
+    )
+
+    @staticmethod
+    def enqueue(user) -> Recommendation:
+        """
+        사용자 전체 진단 요청
+
+        이미 진행 중인 진단이 있으면 새로 만들지 않고 그 진단을 반환합니다.
+        (워커 제한 시간이 지나도록 갱신이 없는 진단은 먼저 FAILED로 정리)
+        작업은 트랜잭션 커밋 후에 큐에 넣어 워커가 커밋 전 행을 읽지 않게 합니다.
+        """
+        with transaction.atomic():
+            AuditTaskService._expire_stale(user)
+            recommendation = (
+                Recommendation.objects.select_for_update()
+                .filter(user=user, inventory__isnull=True, status=Recommendation.Status.PENDING)
+                .first()
+            )
+            if recommendation is not None:
+                return recommendation
+            try:
+                with transaction.atomic():
+                    recommendation = Recommendation.objects.create(user=user)
+            except IntegrityError:
+                # 동시에 들어온 다른 요청이 먼저 만듦 (unique_pending_audit)
+                return Recommendation.objects.get(
+                    user=user, inventory__isnull=True, status=Recommendation.Status.PENDING
+                )
+            transaction.on_commit(lambda: AuditTaskService._submit(recommendation.pk))
+        return recommendation
+
+    @staticmethod
+    def get_status(user, recommendation_id: int) -> Recommendation:
+        """폴링용 진단 상태 (필요한 컬럼만 조회)"""
+        recommendation = (
+            Recommendation.objects.only(*AuditTaskService.STATUS_FIELDS)
+            .filter(user=user, pk=recommendation_id)
+            .first()
+        )
+        if recommendation is None:
+            raise RecommendationNotFound()
+        return recommendation
+
+    @staticmethod
+    def run(recommendation_id: int):
+        """django_q 워커에서 실행되는 진단 본체"""
+        recommendation = (
+            Recommendation.objects.select_related("user")
+            .filter(pk=recommendation_id, status=Recommendation.Status.PENDING)
+            .first()
+        )
+        if recommendation is None:
+            logger.info(f"진행할 진단이 없습니다: recommendation={recommendation_id}")
+            return
+
+        user = recommendation.user
+        try:
+            AuditTaskService._advance(recommendation_id, Stage.METRICS)
+            sync = CloudWatchSyncService.sync_user(user)
+            if sync.errors:
+                logger.warning(f"사용률 갱신 일부 실패, 기존 값으로 진단: {sync.errors}")
+
+            AuditTaskService._advance(recommendation_id, Stage.RIGHTSIZING)
+            # 사용률 갱신 후 입력 지문 비교 - 바뀐 리소스만 진단
+            plan = AuditDiffService.plan(user)
+            result = AuditService.diagnose_user(
+                user,
+                on_ai_start=lambda _: AuditTaskService._advance(
+                    recommendation_id, Stage.AI_DIAGNOSIS
+                ),
+                inventory_ids=plan.changed_ids,
+            )
+
+            AuditTaskService._advance(recommendation_id, Stage.SAVING)
+            AuditTaskService._save(recommendation, result, plan)
+        except Exception as e:
+            logger.exception(f"비동기 진단 실패: recommendation={recommendation_id}")
+            Recommendation.objects.filter(pk=recommendation_id).update(
+                status=Recommendation.Status.FAILED,
+                error_message=getattr(e, "detail", None) or str(e) or type(e).__name__,
+                updated_at=timezone.now(),
+            )
+
+    @staticmethod
+    def _expire_stale(user) -> int:
+        """
+        워커 제한 시간(Q_CLUSTER timeout)보다 오래 갱신이 없는 PENDING 진단을 FAILED로 전환
+
+        워커가 제한 시간에 강제 종료되면 run()의 except가 실행되지 않아 PENDING으로 남습니다.
+        """
+        cutoff = timezone.now() - timedelta(seconds=settings.Q_CLUSTER["timeout"])
+        return Recommendation.objects.filter(
+            user=user,
+            inventory__isnull=True,
+            status=Recommendation.Status.PENDING,
+            updated_at__lt=cutoff,
+        ).update(
+            status=Recommendation.Status.FAILED,
+            error_message="진단 작업 제한 시간 초과",
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def _submit(recommendation_id: int):
+        task_id = async_task(
+            AuditTaskService.TASK,
+            recommendation_id,
+            task_name=f"audit-{recommendation_id}",
+        )
+        Recommendation.objects.filter(pk=recommendation_id).update(task_id=task_id or "")
+
+    @staticmethod
+    def _advance(recommendation_id: int, stage: str):
+        """진행 단계 갱신 (폴링 응답용 컬럼만 UPDATE)"""
+        Recommendation.objects.filter(pk=recommendation_id).update(
+            stage=stage, progress=AuditTaskService.PROGRESS[stage], updated_at=timezone.now()
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def _save(recommendation: Recommendation, result: DiagnosisResultDTO, plan: AuditPlanDTO):
+        """
+        진단 결과와 추천 항목 저장 후 COMPLETED로 전환, 사용자 절감 요약 갱신
+
+        입력이 바뀌지 않은 리소스는 이전 추천 항목을 복사해 합치고 합계에도 포함합니다.
+        """
+        inventories = UserInventory.objects.in_bulk(
+            [item.inventory_id for item in result.items if item.inventory_id is not None]
+        )
+        items: List[RecommendationItem] = []
+        for item in result.items:
+            inventory = inventories.get(item.inventory_id)
+            recommended_cost = (
+                item.recommended_cost if item.recommended_cost is not None else item.original_cost
+            )
+            items.append(
+                RecommendationItem(
+                    recommendation=recommendation,
+                    inventory=inventory,
+                    recommended_service_id=item.recommended_service_id,
+                    recommendation_type=item.recommendation_type,
+                    original_provider=inventory.provider if inventory else "",
+                    original_instance_type=item.original_instance,
+                    original_monthly_cost=Decimal(str(item.original_cost)),
+                    original_cpu_usage=inventory.cpu_usage_avg if inventory else None,
+                    expected_monthly_cost=Decimal(str(recommended_cost)),
+                    savings_amount=Decimal(str(item.savings)),
+                    savings_percentage=Decimal("0"),
+                    reason=item.reason,
+                )
+            )
+        items.extend(AuditDiffService.carry_forward(recommendation, plan))
+        # 저장될 절감액(원래 비용 - 예상 비용)으로 우선순위와 합계를 계산
+        for item in items:
+            item.compute_savings()
+        items.sort(key=lambda item: item.savings_amount, reverse=True)
+        for priority, item in enumerate(items, start=1):
+            item.priority = priority
+        RecommendationBulkService.create_items(items)
+
+        total_current = Decimal(str(result.total_current_cost)) + Decimal(str(plan.carried_cost))
+        total_savings = sum((item.savings_amount for item in items), Decimal("0"))
+        recommendation.total_current_cost = total_current.quantize(Decimal("0.01"))
+        recommendation.total_savings = total_savings.quantize(Decimal("0.01"))
+        recommendation.total_optimized_cost = (
+            recommendation.total_current_cost - recommendation.total_savings
+        )
+        recommendation.diagnosis_summary = result.diagnosis_summary
+        if plan.carried:
+            recommendation.diagnosis_summary += (
+                f"\n입력이 바뀌지 않은 {len(plan.carried)}개 리소스는 이전 진단 결과 유지"
+            )
+        recommendation.status = Recommendation.Status.COMPLETED
+        recommendation.stage = Stage.DONE
+        recommendation.progress = AuditTaskService.PROGRESS[Stage.DONE]
+        # task_id는 워커가 행을 읽은 뒤 채워질 수 있으므로 갱신 대상에서 제외
+        recommendation.save(
+            update_fields=[
+                "total_current_cost",
+                "total_optimized_cost",
+                "total_savings",
+                "savings_percentage",
+                "diagnosis_summary",
+                "status",
+                "stage",
+                "progress",
+                "updated_at",
+            ]
+        )
+        AuditDiffService.record(recommendation, plan, set(result.unsettled_inventory_ids))
+        SavingsSummaryService.apply_recommendation(recommendation, items)
@@ -0,0 +1,243 @@
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from apps.core.dto.cloud_service_dto import ServiceCandidateDTO
+from apps.costs.choices import PricingModel
+from apps.costs.models import CloudService, PriceCatalogVersion
+
+logger = logging.getLogger(__name__)
+
+
+class _VcpuGroup:
+    """같은 vCPU 수의 상품 묶음 (memory, price 오름차순)"""
+
+    __slots__ = ("memories", "prices", "suffix_min_prices", "services")
+
+    def __init__(self, services: List[ServiceCandidateDTO]):
+        services.sort(key=lambda s: (s.memory_gb, s.price_per_hour))
+        self.services = services
+        self.memories = [float(s.memory_gb) for s in services]
+        self.prices = [float(s.price_per_hour) for s in services]
+        # suffix_min_prices[i] = services[i:] 중 최저가 → 더 싼 후보가 없으면 나머지는 건너뜀
+        self.suffix_min_prices = self.prices[:]
+        for i in range(len(services) - 2, -1, -1):
+            self.suffix_min_prices[i] = min(self.prices[i], self.suffix_min_prices[i + 1])
+
+
+class _Partition:
+    """(region_normalized, pricing_model) 파티션 - vCPU 오름차순 그룹"""
+
+    __slots__ = ("vcpus", "groups")
+
+    def __init__(self, services: List[ServiceCandidateDTO]):
+        by_vcpu: Dict[int, List[ServiceCandidateDTO]] = defaultdict(list)
+        for service in services:
+            by_vcpu[service.vcpu].append(service)
+        self.vcpus = sorted(by_vcpu)
+        self.groups = [_VcpuGroup(by_vcpu[vcpu]) for vcpu in self.vcpus]
+
+    def cheapest(
+        self,
+        min_vcpu: int,
+        min_memory_gb: float,
+        limit: int,
+        providers: Optional[frozenset] = None,
+        exclude: Optional[Tuple[str, str]] = None,
+    ) -> List[ServiceCandidateDTO]:
+        # (-price, seq, service) 최대 힙으로 가장 싼 limit 개만 유지
+        heap: List[Tuple[float, int, ServiceCandidateDTO]] = []
+        seq = 0
+        for group in self.groups[bisect_left(self.vcpus, min_vcpu) :]:
+            start = bisect_left(group.memories, min_memory_gb)
+            if start == len(group.services):
+                continue
+            for i in range(start, len(group.services)):
+                if len(heap) == limit:
+                    worst = -heap[0][0]
+                    if group.suffix_min_prices[i] >= worst:
+                        break
+                    if group.prices[i] >= worst:
+                        continue
+                service = group.services[i]
+                if providers is not None and service.provider not in providers:
+                    continue
+                if exclude is not None and (service.provider, service.instance_type) == exclude:
+                    continue
+                seq += 1
+                if len(heap) < limit:
+                    heapq.heappush(heap, (-group.prices[i], seq, service))
+                else:
+                    heapq.heapreplace(heap, (-group.prices[i], seq, service))
+        return [service for _, _, service in sorted(heap, key=lambda item: (-item[0], item[1]))]
+
+
+class SpecIndex:
+    """
+    활성 CloudService 스펙 매칭 인덱스 (프로세스 로컬, 읽기 전용)
+
+    빌드가 끝난 인덱스는 수정하지 않으므로 여러 스레드가 잠금 없이 조회할 수 있습니다.
+    """
+
+    def __init__(
+        self, services: Iterable[ServiceCandidateDTO], catalog_version_id: Optional[int] = None
+    ):
+        by_partition: Dict[Tuple[str, str], List[ServiceCandidateDTO]] = defaultdict(list)
+        size = 0
+        for service in services:
+            by_partition[(service.region_normalized, service.pricing_model)].append(service)
+            size += 1
+        self.partitions = {key: _Partition(rows) for key, rows in by_partition.items()}
+        self.catalog_version_id = catalog_version_id
+        self.size = size
+
+    def cheapest(
+        self,
+        region_normalized: str,
+        min_vcpu: int,
+        min_memory_gb: Decimal | float,
+        pricing_model: str = PricingModel.ON_DEMAND,
+        limit: int = 5,
+        providers: Optional[Iterable[str]] = None,
+        exclude: Optional[Tuple[str, str]] = None,
+    ) -> List[ServiceCandidateDTO]:
+        """
+        리전 R에서 vCPU ≥ min_vcpu, 메모리 ≥ min_memory_gb 인 상품을 저렴한 순으로 반환
+
+        Args:
+            region_normalized: 정규화 리전 코드
+            min_vcpu: 최소 vCPU
+            min_memory_gb: 최소 메모리 (GB)
+            pricing_model: 가격 모델
+            limit: 최대 반환 개수
+            providers: 허용할 provider (기본값: 전체)
+            exclude: 제외할 (provider, instance_type) - 보통 현재 사용 중인 인스턴스
+        """
+        partition = self.partitions.get((region_normalized, pricing_model))
+        if partition is None or limit <= 0:
+            return []
+        return partition.cheapest(
+            min_vcpu,
+            float(min_memory_gb),
+            limit,
+            providers=frozenset(providers) if providers is not None else None,
+            exclude=exclude,
+        )
+
+
+class CompareService:
+    """
+    대안 CloudService 조회
+
+    인벤토리마다 ORM 쿼리를 보내는 대신 프로세스 로컬 SpecIndex를 조회합니다.
+    가격표 델타 반영(catalog_refreshed) 시 새 인덱스를 만든 뒤 참조만 교체하므로
+    조회 중인 스레드는 항상 완성된 인덱스 하나만 보게 됩니다.
+    다른 프로세스에서 반영된 가격표는 VERSION_CHECK_INTERVAL 마다 버전을 확인해 따라갑니다.
+    """
+
+    VERSION_CHECK_INTERVAL = 60
+
+    _index: Optional[SpecIndex] = None
+    _checked_at: float = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def find_alternatives(
+        region_normalized: str,
+        vcpu: int,
+        memory_gb: Decimal,
+        pricing_model: str = PricingModel.ON_DEMAND,
+        limit: int = 5,
+        providers: Optional[Iterable[str]] = None,
+        exclude: Optional[Tuple[str, str]] = None,
+    ) -> List[ServiceCandidateDTO]:
+        """요구 스펙 이상인 상품 중 가장 저렴한 limit 개 (전체 provider 대상)"""
+        return CompareService.get_index().cheapest(
+            region_normalized,
+            vcpu,
+            memory_gb,
+            pricing_model=pricing_model,
+            limit=limit,
+            providers=providers,
+            exclude=exclude,
+        )
+
+    @staticmethod
+    def find_for_inventory(
+        inventory, limit: int = 5, pricing_model: str = PricingModel.ON_DEMAND
+    ) -> List[ServiceCandidateDTO]:
+        """인벤토리와 같은 정규화 리전에서 현재 스펙 이상인 대안 (현재 인스턴스 제외)"""
+        if not inventory.region_normalized:
+            return []
+        return CompareService.find_alternatives(
+            inventory.region_normalized,
+            inventory.vcpu,
+            inventory.memory_gb,
+            pricing_model=pricing_model,
+            limit=limit,
+            exclude=(inventory.provider, inventory.instance_type),
+        )
+
+    @staticmethod
+    def get_index() -> SpecIndex:
+        """현재 인덱스 반환 (없거나 가격표 버전이 바뀌었으면 재빌드)"""
+        index = CompareService._index
+        now = time.monotonic()
+        if (
+            index is not None
+            and now - CompareService._checked_at < CompareService.VERSION_CHECK_INTERVAL
+        ):
+            return index
+
+        with CompareService._lock:
+            index = CompareService._index
+            if index is None or CompareService._latest_version_id() != index.catalog_version_id:
+                index = CompareService._build()
+                CompareService._index = index
+            CompareService._checked_at = time.monotonic()
+        return index
+
+    @staticmethod
+    def rebuild() -> SpecIndex:
+        """인덱스를 새로 만든 뒤 참조를 원자적으로 교체"""
+        with CompareService._lock:
+            index = CompareService._build()
+            CompareService._index = index
+            CompareService._checked_at = time.monotonic()
+        logger.info(f"스펙 매칭 인덱스 재빌드 완료: {index.size}건")
+        return index
+
+    @staticmethod
+    def clear():
+        """인덱스 폐기 (다음 조회 시 재빌드)"""
+        with CompareService._lock:
+            CompareService._index = None
+
+    @staticmethod
+    def _latest_version_id() -> Optional[int]:
+        return PriceCatalogVersion.objects.values_list("id", flat=True).first()
+
+    @staticmethod
+    def _build() -> SpecIndex:
+        version_id = CompareService._latest_version_id()
+        rows = (
+            CloudService.objects.filter(is_active=True, region_normalized__isnull=False)
+            .values_list(
+                "id",
+                "provider",
+                "instance_type",
+                "region",
+                "region_normalized",
+                "pricing_model",
+                "vcpu",
+                "memory_gb",
+                "price_per_hour",
+            )
+            .iterator(chunk_size=5000)
+        )
+        return SpecIndex((ServiceCandidateDTO(*row) for row in rows), catalog_version_id=version_id)
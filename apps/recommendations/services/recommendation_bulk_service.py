@@ -0,0 +1,26 @@
+from typing import List
+
+from django.db import transaction
+
+from apps.recommendations.models import RecommendationItem
+
+
+class RecommendationBulkService:
+    """
+    진단 결과 일괄 저장
+
+    save()를 행마다 호출하면 INSERT가 행 수만큼 나가므로, 절감액/절감률은 모델의
+    compute_savings()로 같은 방식으로 계산한 뒤 bulk_create로 배치 INSERT 합니다.
+    """
+
+    BATCH_SIZE = 2000
+
+    @staticmethod
+    @transaction.atomic
+    def create_items(
+        items: List[RecommendationItem], batch_size: int = BATCH_SIZE
+    ) -> List[RecommendationItem]:
+        """이미 저장된 Recommendation에 추천 항목 일괄 추가"""
+        for item in items:
+            item.compute_savings()
+        return RecommendationItem.objects.bulk_create(items, batch_size=batch_size)
@@ -0,0 +1,128 @@
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from apps.inventories.models import UserInventory
+from apps.recommendations.models import Recommendation, RecommendationItem, SavingsSummary
+
+logger = logging.getLogger(__name__)
+
+CENT = Decimal("0.01")
+
+
+class SavingsSummaryService:
+    """
+    사용자별 비용/절감 요약 유지
+
+    - 인벤토리 변경: 해당 사용자의 활성 인벤토리만 (user, is_active) 인덱스로 집계해 비용 부분 갱신
+    - 진단 완료: 방금 저장한 추천 항목(메모리)으로 절감 부분 교체 (추가 조회 없음)
+    두 경로는 서로 다른 컬럼만 갱신하고 행 잠금으로 절감률 계산이 엇갈리지 않게 합니다.
+    """
+
+    COST_FIELDS = ["resource_count", "total_current_cost", "cost_by_provider", "cost_by_region"]
+    SAVINGS_FIELDS = [
+        "latest_recommendation",
+        "total_potential_savings",
+        "savings_by_provider",
+        "savings_by_region",
+        "savings_by_type",
+    ]
+
+    @staticmethod
+    def get(user) -> SavingsSummary:
+        """대시보드용 요약 1행 조회 (아직 없으면 인벤토리 기준으로 생성)"""
+        summary = SavingsSummary.objects.filter(user=user).first()
+        if summary is None:
+            summary = SavingsSummaryService.refresh_inventory(user.pk)
+        return summary
+
+    @staticmethod
+    @transaction.atomic
+    def refresh_inventory(user_id: int) -> Optional[SavingsSummary]:
+        """활성 인벤토리 비용 합계/분포 갱신 (사용자가 삭제된 경우 None)"""
+        rows = (
+            UserInventory.objects.filter(user_id=user_id, is_active=True)
+            .values("provider", "region_normalized")
+            .annotate(count=Count("id"), cost=Sum("current_monthly_cost"))
+            .order_by()
+        )
+        count = 0
+        total = Decimal("0")
+        by_provider: Dict[str, Decimal] = defaultdict(Decimal)
+        by_region: Dict[str, Decimal] = defaultdict(Decimal)
+        for row in rows:
+            count += row["count"]
+            total += row["cost"]
+            by_provider[row["provider"]] += row["cost"]
+            by_region[row["region_normalized"]] += row["cost"]
+
+        summary = SavingsSummaryService._lock(user_id)
+        if summary is None:
+            return None
+        summary.resource_count = count
+        summary.total_current_cost = total.quantize(CENT)
+        summary.cost_by_provider = SavingsSummaryService._to_json(by_provider)
+        summary.cost_by_region = SavingsSummaryService._to_json(by_region)
+        SavingsSummaryService._save(summary, SavingsSummaryService.COST_FIELDS)
+        return summary
+
+    @staticmethod
+    @transaction.atomic
+    def apply_recommendation(
+        recommendation: Recommendation, items: Iterable[RecommendationItem]
+    ) -> Optional[SavingsSummary]:
+        """
+        완료된 사용자 전체 진단의 절감액으로 요약 갱신
+
+        진단은 매번 전체 인벤토리의 스냅샷이므로 이전 진단의 절감액에 더하지 않고 교체합니다.
+        items의 inventory는 이미 로드된 객체여야 합니다 (리전 분포 계산용).
+        """
+        total = Decimal("0")
+        by_provider: Dict[str, Decimal] = defaultdict(Decimal)
+        by_region: Dict[str, Decimal] = defaultdict(Decimal)
+        by_type: Dict[str, Decimal] = defaultdict(Decimal)
+        for item in items:
+            if item.savings_amount is None or item.savings_amount <= 0:
+                continue
+            total += item.savings_amount
+            by_type[item.recommendation_type] += item.savings_amount
+            if item.original_provider:
+                by_provider[item.original_provider] += item.savings_amount
+            if item.inventory is not None:
+                by_region[item.inventory.region_normalized] += item.savings_amount
+
+        summary = SavingsSummaryService._lock(recommendation.user_id)
+        if summary is None:
+            return None
+        summary.latest_recommendation = recommendation
+        summary.total_potential_savings = total.quantize(CENT)
+        summary.savings_by_provider = SavingsSummaryService._to_json(by_provider)
+        summary.savings_by_region = SavingsSummaryService._to_json(by_region)
+        summary.savings_by_type = SavingsSummaryService._to_json(by_type)
+        SavingsSummaryService._save(summary, SavingsSummaryService.SAVINGS_FIELDS)
+        return summary
+
+    @staticmethod
+    def _lock(user_id: int) -> Optional[SavingsSummary]:
+        """요약 행을 잠가서 반환 (없으면 생성)"""
+        summary = SavingsSummary.objects.select_for_update().filter(user_id=user_id).first()
+        if summary is not None:
+            return summary
+        if not get_user_model().objects.filter(pk=user_id).exists():
+            logger.info(f"삭제된 사용자의 요약은 갱신하지 않습니다: user={user_id}")
+            return None
+        SavingsSummary.objects.get_or_create(user_id=user_id)
+        return SavingsSummary.objects.select_for_update().get(user_id=user_id)
+
+    @staticmethod
+    def _save(summary: SavingsSummary, fields):
+        summary.save(update_fields=[*fields, "savings_percentage", "updated_at"])
+
+    @staticmethod
+    def _to_json(values: Dict[str, Decimal]) -> Dict[str, str]:
+        return {key: str(value.quantize(CENT)) for key, value in sorted(values.items())}
@@ -0,0 +1,37 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.costs.signals import catalog_refreshed
+from apps.inventories.models import UserInventory
+from apps.inventories.signals import inventories_changed
+from apps.recommendations.services.audit_service import catalog_cache
+from apps.recommendations.services.compare_service import CompareService
+from apps.recommendations.services.savings_summary_service import SavingsSummaryService
+
+
+@receiver(catalog_refreshed)
+def rebuild_spec_index(sender, changeset, **kwargs):
+    """가격표가 바뀌면 스펙 매칭 인덱스 재빌드"""
+    if changeset.has_changes:
+        CompareService.rebuild()
+
+
+@receiver(catalog_refreshed)
+def invalidate_catalog_cache(sender, changeset, **kwargs):
+    """가격표가 바뀌면 리전별 가격표 조각 캐시 무효화 (다른 워커에는 버전 스탬프로 전파)"""
+    if changeset.has_changes:
+        catalog_cache.invalidate()
+
+
+@receiver([post_save, post_delete], sender=UserInventory)
+def refresh_summary_on_inventory_save(sender, instance, **kwargs):
+    """인벤토리 단건 변경 시 커밋 후 사용자 비용 요약 갱신"""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: SavingsSummaryService.refresh_inventory(user_id))
+
+
+@receiver(inventories_changed)
+def refresh_summary_on_inventories_changed(sender, user_id, **kwargs):
+    """CSV 벌크 적재 후 사용자 비용 요약 갱신"""
+    SavingsSummaryService.refresh_inventory(user_id)
@@ -0,0 +1,6 @@
+from apps.recommendations.services.audit_task_service import AuditTaskService
+
+
+def run_audit(recommendation_id: int):
+    """django_q 작업 진입점 (AuditTaskService.TASK)"""
+    AuditTaskService.run(recommendation_id)
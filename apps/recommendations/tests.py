@@ -1,3 +1,649 @@
-from django.test import TestCase
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIClient
+
+from apps.core.adapters.gemini_adapter import AsyncGeminiAdapter, GeminiAdapter
+from apps.core.dto.cloud_service_dto import CatalogChangesetDTO
+from apps.core.dto.recommendation_dto import (
+    AuditPlanDTO,
+    DiagnosisResultDTO,
+    RecommendationItemDTO,
+)
+from apps.core.utils.circuit_breaker import CircuitBreaker
+from apps.core.utils.ttl_cache import TTLCache
+from apps.costs.choices import PricingModel, PricingSource
+from apps.costs.models import CloudService
+from apps.costs.services.price_crawler_service import PriceCrawlerService
+from apps.costs.signals import catalog_refreshed
+from apps.inventories.models import UserInventory
+from apps.inventories.services.utilization_sketch_service import UtilizationSketchService
+from apps.recommendations.models import (
+    AuditFingerprint,
+    Recommendation,
+    RecommendationItem,
+    SavingsSummary,
+)
+from apps.recommendations.services.audit_service import (
+    AuditRuleEngine,
+    AuditService,
+    catalog_cache,
+)
+from apps.recommendations.services.audit_task_service import AuditTaskService
+from apps.recommendations.services.compare_service import CompareService
+from apps.recommendations.services.recommendation_bulk_service import RecommendationBulkService
+
+User = get_user_model()
+
+OFFER_FIXTURE = (
+    Path(__file__).resolve().parents[1] / "costs" / "testdata" / "aws_ec2_offer_sample.json"
+)
+
+
+def _service(
+    provider,
+    instance_type,
+    region,
+    vcpu,
+    memory_gb,
+    price,
+    pricing_model=PricingModel.ON_DEMAND,
+    is_active=True,
+):
+    return CloudService.objects.create(
+        provider=provider,
+        instance_type=instance_type,
+        region=region,
+        region_normalized="KR" if region == "ap-northeast-2" else "US_EAST",
+        vcpu=vcpu,
+        memory_gb=Decimal(memory_gb),
+        price_per_hour=Decimal(price),
+        pricing_model=pricing_model,
+        pricing_source=PricingSource.AWS_API,
+        last_verified_at=date(2026, 10, 1),
+        is_active=is_active,
+    )
+
+
+class CompareServiceTest(TestCase):
+    """인메모리 스펙 매칭 인덱스 테스트"""
+
+    def setUp(self):
+        CompareService.clear()
+        self.addCleanup(CompareService.clear)
+        _service("AWS", "t3.medium", "us-east-1", 2, "4", "0.0416")
+        _service("AWS", "t3.large", "us-east-1", 2, "8", "0.0832")
+        _service("AWS", "m5.xlarge", "us-east-1", 4, "16", "0.1920")
+        _service("GCP", "e2-standard-4", "us-east1", 4, "16", "0.1340")
+        _service("AZURE", "D4s_v5", "eastus", 4, "16", "0.1920")
+        _service("AWS", "t3.medium", "ap-northeast-2", 2, "4", "0.0520")
+        _service("AWS", "m5.large", "us-east-1", 2, "8", "0.0300", PricingModel.SPOT)
+        _service("GCP", "n2-old", "us-east1", 8, "32", "0.0100", is_active=False)
+
+    def test_cheapest_across_providers(self):
+        result = CompareService.find_alternatives("US_EAST", 3, Decimal("12"), limit=2)
+
+        self.assertEqual(
+            [(s.provider, s.instance_type) for s in result],
+            [("GCP", "e2-standard-4"), ("AWS", "m5.xlarge")],
+        )
+        self.assertEqual(result[0].monthly_cost, Decimal("0.1340") * 730)
+
+    def test_filters_spec_partition_and_exclude(self):
+        result = CompareService.find_alternatives(
+            "US_EAST", 2, Decimal("4"), limit=10, exclude=("AWS", "t3.medium")
+        )
+
+        # KR 리전, SPOT, 비활성 상품은 제외
+        self.assertEqual(
+            [s.instance_type for s in result],
+            ["t3.large", "e2-standard-4", "m5.xlarge", "D4s_v5"],
+        )
+        spot = CompareService.find_alternatives(
+            "US_EAST", 2, Decimal("4"), pricing_model=PricingModel.SPOT
+        )
+        self.assertEqual([s.instance_type for s in spot], ["m5.large"])
+        self.assertEqual(CompareService.find_alternatives("US_WEST", 1, Decimal("1")), [])
+
+    def test_rebuilds_on_catalog_refresh(self):
+        self.assertEqual(CompareService.get_index().size, 7)
+        _service("GCP", "e2-medium", "us-east1", 2, "4", "0.0335")
+
+        # 아직 이전 인덱스를 사용
+        self.assertEqual(
+            CompareService.find_alternatives("US_EAST", 2, Decimal("4"), limit=1)[0].instance_type,
+            "t3.medium",
+        )
+
+        changeset = CatalogChangesetDTO(provider="GCP", offer_version="v2")
+        changeset.created.append(("e2-medium", "us-east1", PricingModel.ON_DEMAND))
+        catalog_refreshed.send(sender=None, changeset=changeset)
+
+        self.assertEqual(
+            CompareService.find_alternatives("US_EAST", 2, Decimal("4"), limit=1)[0].instance_type,
+            "e2-medium",
+        )
+
+
+class AuditFixtureMixin:
+    """진단 테스트 공통 사용자/가격표/인벤토리"""
+
+    def setUp(self):
+        # 테스트마다 가격표가 새로 만들어지므로 이전 테스트의 리전별 캐시를 버림
+        catalog_cache.invalidate()
+        self.user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+        _service("AWS", "t3.medium", "us-east-1", 2, "4", "0.0416")
+        _service("AWS", "t3.large", "us-east-1", 2, "8", "0.0832")
+        _service("AWS", "m5.xlarge", "us-east-1", 4, "16", "0.1920")
+        _service("GCP", "e2-standard-2", "us-east1", 2, "8", "0.0670")
+
+    def _inventory(self, resource_id, instance_type, vcpu, memory_gb, cost, cpu, memory):
+        return UserInventory.objects.create(
+            user=self.user,
+            provider="AWS",
+            resource_id=resource_id,
+            instance_type=instance_type,
+            region="us-east-1",
+            region_normalized="US_EAST",
+            vcpu=vcpu,
+            memory_gb=Decimal(memory_gb),
+            cpu_usage_avg=cpu,
+            memory_usage_avg=memory,
+            current_monthly_cost=Decimal(cost),
+        )
+
+
+class AuditServiceTest(AuditFixtureMixin, TestCase):
+    """벡터화 적정 사이징 테스트"""
+
+    def test_rightsize_user(self):
+        # 4 vCPU 중 20% 사용, 16GB 중 30% 사용 → 2 vCPU / 6.86GB 필요 → t3.large
+        self._inventory("i-idle", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30"))
+        # 사용률 정보 없음 → 현재 스펙 유지, 자기 자신이 최저가이므로 추천 없음
+        self._inventory("i-unknown", "m5.xlarge", 4, "16", "140.16", None, None)
+        # 이미 적정 사이즈
+        self._inventory("i-busy", "t3.medium", 2, "4", "30.37", Decimal("65"), Decimal("60"))
+
+        report = AuditService.rightsize_user(self.user)
+        items = {item.resource_id: item for item in report.items}
+
+        idle = items["i-idle"]
+        self.assertEqual((idle.required_vcpu, idle.required_memory_gb), (2, 6.86))
+        self.assertEqual(idle.recommended_instance_type, "t3.large")
+        self.assertEqual(idle.recommended_monthly_cost, 60.74)
+        self.assertEqual(idle.monthly_savings, 79.42)
+        self.assertTrue(idle.is_over_provisioned)
+        self.assertFalse(idle.is_under_utilized)
+
+        self.assertIsNone(items["i-unknown"].recommended_service_id)
+        self.assertIsNone(items["i-unknown"].is_over_provisioned)
+        self.assertIsNone(items["i-busy"].recommended_service_id)
+        self.assertEqual(report.total_savings, 79.42)
+        self.assertEqual(len(report.recommended_items), 1)
+
+    def test_cross_provider(self):
+        self._inventory("i-idle", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30"))
+
+        report = AuditService.rightsize_user(self.user, same_provider=False)
+
+        self.assertEqual(report.items[0].recommended_instance_type, "e2-standard-2")
+        self.assertEqual(report.items[0].recommended_provider, "GCP")
+
+    def test_bursty_resource_is_sized_by_p95(self):
+        # 평균 CPU 20%지만 분위수 스케치 p95가 80% → 4 vCPU 필요 → 다운사이징 없음
+        bursty = self._inventory(
+            "i-bursty", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30")
+        )
+        start = timezone.now() - timedelta(hours=10)
+        UtilizationSketchService.update(
+            [
+                (bursty.pk, "CPU", start + timedelta(minutes=5 * i), 80.0 if i >= 94 else 10.0)
+                for i in range(100)
+            ]
+        )
+
+        [item] = AuditService.rightsize_user(self.user).items
+
+        self.assertEqual(item.required_vcpu, 4)
+        self.assertIsNone(item.recommended_service_id)
+        self.assertFalse(item.is_over_provisioned)
+
+    def test_under_utilized_property(self):
+        inventory = self._inventory("i-idle", "t3.large", 2, "8", "60.74", Decimal("5"), None)
+
+        self.assertTrue(inventory.is_under_utilized)
+        inventory.cpu_usage_avg = Decimal("50")
+        self.assertFalse(inventory.is_under_utilized)
+
+
+class FakeGeminiModel:
+    """프롬프트를 기록하고 모든 행을 증설 권고로 답하는 가짜 Gemini 모델"""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_content_async(self, prompt):
+        return self.generate_content(prompt)
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        table = prompt.split("\n\n")[1].splitlines()[1:]
+        items = [
+            {
+                "id": int(row.split("|")[0]),
+                "recommendation_type": "RIGHTSIZING",
+                "recommended_instance": "t3.large",
+                "recommended_monthly_cost": 60.74,
+                "reason": "CPU 과부하",
+            }
+            for row in table
+        ]
+        return SimpleNamespace(
+            text=json.dumps({"diagnosis": "과부하 리소스 증설 검토", "items": items})
+        )
+
+
+class AuditRuleEngineTest(AuditFixtureMixin, TestCase):
+    """규칙 기반 사전 진단 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        _service("AWS", "m5.xlarge", "us-east-1", 4, "16", "0.1200", PricingModel.RESERVED)
+
+    def test_only_ambiguous_resources_reach_ai(self):
+        self._inventory("i-idle", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30"))
+        self._inventory("i-steady", "m5.xlarge", 4, "16", "140.16", Decimal("60"), Decimal("50"))
+        self._inventory("i-fit", "t3.medium", 2, "4", "30.37", Decimal("35"), Decimal("60"))
+        self._inventory("i-unknown", "t3.medium", 2, "4", "30.37", None, None)
+        hot = self._inventory("i-hot", "t3.medium", 2, "4", "30.37", Decimal("95"), Decimal("90"))
+        model = FakeGeminiModel()
+
+        result = AuditService.diagnose_user(
+            self.user, adapter=GeminiAdapter(model=model, cache=TTLCache(maxsize=100, ttl=60))
+        )
+
+        types = {item.recommendation_type for item in result.items}
+        self.assertEqual(types, {"DOWNSIZE", "SWITCH_PRICING", "RIGHTSIZING"})
+        self.assertEqual((result.rule_decided, result.ai_reviewed), (4, 1))
+        self.assertEqual(len(model.prompts), 1)
+        self.assertIn("0|AWS|t3.medium|US_EAST|2|4|95|90", model.prompts[0])
+        self.assertNotIn("i-steady", model.prompts[0])
+        ai_item = next(i for i in result.items if i.recommendation_type == "RIGHTSIZING")
+        self.assertEqual((ai_item.inventory_id, ai_item.savings), (hot.pk, 0.0))
+        switch = next(i for i in result.items if i.recommendation_type == "SWITCH_PRICING")
+        self.assertEqual(switch.recommended_cost, 87.6)
+        self.assertEqual(switch.savings, 52.56)
+        self.assertIn("과부하", result.diagnosis_summary)
+
+    def test_rule_fallback_when_circuit_is_open(self):
+        # 절감률이 10% 미만이라 AI 판단 대상이지만 규칙으로도 t3.large 대안이 있음
+        self._inventory("i-low", "m5.xlarge", 4, "16", "65.00", Decimal("20"), Decimal("20"))
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        model = FakeGeminiModel()
+
+        result = AuditService.diagnose_user(
+            self.user,
+            adapter=GeminiAdapter(
+                model=model, cache=TTLCache(maxsize=100, ttl=60), circuit_breaker=breaker
+            ),
+        )
+
+        self.assertEqual(model.prompts, [])
+        self.assertEqual(result.ai_reviewed, 0)
+        [item] = result.items
+        self.assertEqual(item.recommendation_type, "RIGHTSIZING")
+        self.assertEqual((item.recommended_instance, item.savings), ("t3.large", 4.26))
+        self.assertIn("규칙 기반", result.diagnosis_summary)
+
+    def test_async_diagnosis_matches_sync(self):
+        self._inventory("i-idle", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30"))
+        self._inventory("i-hot", "t3.medium", 2, "4", "30.37", Decimal("95"), Decimal("90"))
+        adapter = AsyncGeminiAdapter(
+            model=FakeGeminiModel(),
+            cache=TTLCache(maxsize=100, ttl=60),
+            circuit_breaker=CircuitBreaker(),
+        )
+
+        result = async_to_sync(AuditService.adiagnose_user)(self.user, adapter=adapter)
+
+        types = sorted(item.recommendation_type for item in result.items)
+        self.assertEqual(types, ["DOWNSIZE", "RIGHTSIZING"])
+        self.assertEqual((result.rule_decided, result.ai_reviewed), (1, 1))
+
+    def test_no_ai_call_when_everything_is_decided(self):
+        self._inventory("i-fit", "t3.medium", 2, "4", "30.37", Decimal("35"), Decimal("60"))
+        model = FakeGeminiModel()
+
+        result = AuditService.diagnose_user(
+            self.user, adapter=GeminiAdapter(model=model, cache=TTLCache(maxsize=100, ttl=60))
+        )
+
+        self.assertEqual(model.prompts, [])
+        self.assertEqual(result.items, [])
+        self.assertEqual(result.rule_decided, 1)
+
+
+class AuditTaskServiceTest(AuditFixtureMixin, TestCase):
+    """django_q 비동기 진단 파이프라인 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_request_enqueues_once_and_returns_pending(self):
+        with mock.patch(
+            "apps.recommendations.services.audit_task_service.async_task", return_value="task-1"
+        ) as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                first = self.client.post(reverse("audit-create"))
+            with self.captureOnCommitCallbacks(execute=True):
+                second = self.client.post(reverse("audit-create"))
+
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual((first.data["status"], first.data["stage"]), ("PENDING", "QUEUED"))
+        self.assertEqual(second.data["id"], first.data["id"])
+        submit.assert_called_once_with(
+            AuditTaskService.TASK, first.data["id"], task_name=f"audit-{first.data['id']}"
+        )
+        self.assertEqual(Recommendation.objects.get().task_id, "task-1")
+
+    def test_stale_pending_audit_is_failed_and_replaced(self):
+        stale = Recommendation.objects.create(user=self.user)
+        Recommendation.objects.filter(pk=stale.pk).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+
+        with mock.patch(
+            "apps.recommendations.services.audit_task_service.async_task", return_value="task-2"
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                recommendation = AuditTaskService.enqueue(self.user)
+
+        stale.refresh_from_db()
+        self.assertNotEqual(recommendation.pk, stale.pk)
+        self.assertEqual(stale.status, Recommendation.Status.FAILED)
+        self.assertEqual(stale.error_message, "진단 작업 제한 시간 초과")
+
+    def test_only_one_pending_audit_per_user(self):
+        Recommendation.objects.create(user=self.user)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Recommendation.objects.create(user=self.user)
+
+    @override_settings(GEMINI_API_KEY="")
+    def test_run_saves_items_and_reports_progress(self):
+        idle = self._inventory(
+            "i-idle", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30")
+        )
+        recommendation = Recommendation.objects.create(user=self.user)
+
+        AuditTaskService.run(recommendation.pk)
+
+        response = self.client.get(reverse("audit-status", args=[recommendation.pk]))
+        self.assertEqual(response.data["status"], "COMPLETED")
+        self.assertEqual((response.data["stage"], response.data["progress"]), ("DONE", 100))
+        self.assertEqual(response.data["total_savings"], "79.42")
+        [item] = recommendation.items.all()
+        self.assertEqual((item.inventory_id, item.recommendation_type), (idle.pk, "DOWNSIZE"))
+        self.assertEqual(item.original_provider, "AWS")
+
+    def test_run_failure_is_recorded(self):
+        recommendation = Recommendation.objects.create(user=self.user)
+
+        with mock.patch.object(AuditService, "diagnose_user", side_effect=RuntimeError("boom")):
+            AuditTaskService.run(recommendation.pk)
+
+        recommendation.refresh_from_db()
+        self.assertEqual(recommendation.status, Recommendation.Status.FAILED)
+        self.assertEqual(recommendation.stage, Recommendation.Stage.RIGHTSIZING)
+        self.assertEqual(recommendation.error_message, "boom")
+
+    def test_status_of_other_users_audit_is_hidden(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password1234"
+        )
+        recommendation = Recommendation.objects.create(user=other)
+
+        response = self.client.get(reverse("audit-status", args=[recommendation.pk]))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class RecommendationBulkServiceTest(TestCase):
+    """진단 결과 일괄 저장 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="tester", email="tester@example.com", password="password1234"
+        )
+
+    @staticmethod
+    def _item(original, expected, **kwargs):
+        return RecommendationItem(
+            recommendation_type=RecommendationItem.RecommendationType.DOWNSIZE,
+            original_provider="AWS",
+            original_instance_type="m5.xlarge",
+            original_monthly_cost=Decimal(original),
+            expected_monthly_cost=Decimal(expected),
+            savings_amount=Decimal("0"),
+            savings_percentage=Decimal("0"),
+            reason="test",
+            **kwargs,
+        )
+
+    def test_bulk_matches_save_semantics(self):
+        cases = [("140.16", "60.74"), ("60.74", "60.74"), ("30.00", "0")]
+        saved = Recommendation.objects.create(
+            user=self.user, status=Recommendation.Status.COMPLETED
+        )
+        for original, expected in cases:
+            self._item(original, expected, recommendation=saved).save()
+
+        bulk = Recommendation.objects.create(user=self.user)
+        with self.assertNumQueries(3):
+            # SAVEPOINT/RELEASE + INSERT 1회
+            RecommendationBulkService.create_items(
+                [
+                    self._item(original, expected, recommendation=bulk)
+                    for original, expected in cases
+                ]
+            )
+
+        def snapshot(recommendation):
+            return sorted(
+                recommendation.items.values_list(
+                    "original_monthly_cost", "savings_amount", "savings_percentage"
+                )
+            )
+
+        self.assertEqual(snapshot(bulk), snapshot(saved))
+        self.assertEqual(bulk.items.count(), 3)
+
+    def test_priority_and_total_follow_saved_savings(self):
+        recommendation = Recommendation.objects.create(user=self.user)
+        # AI 응답의 savings 값과 비용 차이가 다른 경우 - 저장되는 값은 비용 차이
+        result = DiagnosisResultDTO(
+            user_id=self.user.pk,
+            total_current_cost=300.0,
+            total_optimized_cost=220.0,
+            total_savings=80.0,
+            diagnosis_summary="test",
+            items=[
+                RecommendationItemDTO("m5.xlarge", 100.0, "t3.large", 80.0, 50.0, "a", "DOWNSIZE"),
+                RecommendationItemDTO("m5.large", 100.0, "t3.medium", 70.0, 30.0, "b", "DOWNSIZE"),
+                RecommendationItemDTO(
+                    "t3.small", 100.0, "t3.large", 120.0, 0.0, "c", "RIGHTSIZING"
+                ),
+            ],
+        )
+
+        AuditTaskService._save(recommendation, result, AuditPlanDTO())
+
+        self.assertEqual(
+            list(recommendation.items.order_by("priority").values_list("reason", "savings_amount")),
+            [("b", Decimal("30.00")), ("a", Decimal("20.00")), ("c", Decimal("-20.00"))],
+        )
+        recommendation.refresh_from_db()
+        self.assertEqual(recommendation.total_savings, Decimal("30.00"))
+
+
+class SavingsSummaryTest(AuditFixtureMixin, TestCase):
+    """사용자 비용/절감 요약 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @override_settings(GEMINI_API_KEY="")
+    def test_inventory_change_and_audit_update_summary(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._inventory("i-idle", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30"))
+            self._inventory("i-busy", "t3.medium", 2, "4", "30.37", Decimal("70"), Decimal("70"))
+
+        summary = SavingsSummary.objects.get(user=self.user)
+        self.assertEqual(
+            (summary.resource_count, summary.total_current_cost), (2, Decimal("170.53"))
+        )
+        self.assertEqual(summary.cost_by_region, {"US_EAST": "170.53"})
+        self.assertEqual(summary.total_potential_savings, Decimal("0"))
+
+        recommendation = Recommendation.objects.create(user=self.user)
+        AuditTaskService.run(recommendation.pk)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("savings-summary"))
+        self.assertEqual(response.data["total_potential_savings"], "79.42")
+        self.assertEqual(response.data["savings_by_type"], {"DOWNSIZE": "79.42"})
+        self.assertEqual(response.data["savings_by_provider"], {"AWS": "79.42"})
+        self.assertEqual(response.data["latest_recommendation"], recommendation.pk)
+        self.assertEqual(response.data["savings_percentage"], "46.57")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserInventory.objects.get(resource_id="i-busy").delete()
+        summary.refresh_from_db()
+        self.assertEqual((summary.resource_count, summary.cost_by_provider), (1, {"AWS": "140.16"}))
+
+    def test_summary_is_created_on_first_read(self):
+        UserInventory.objects.bulk_create(
+            [
+                UserInventory(
+                    user=self.user,
+                    provider="GCP",
+                    resource_id="vm-1",
+                    instance_type="e2-standard-2",
+                    region="us-east1",
+                    region_normalized="US_EAST",
+                    vcpu=2,
+                    memory_gb=Decimal("8"),
+                    current_monthly_cost=Decimal("48.91"),
+                )
+            ]
+        )
+
+        response = self.client.get(reverse("savings-summary"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["cost_by_provider"], {"GCP": "48.91"})
+        self.assertEqual(response.data["savings_percentage"], "0.00")
+
+
+@override_settings(GEMINI_API_KEY="")
+class AuditDiffTest(AuditFixtureMixin, TestCase):
+    """입력 지문 기반 증분 진단 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.idle = self._inventory(
+            "i-idle", "m5.xlarge", 4, "16", "140.16", Decimal("20"), Decimal("30")
+        )
+        self.fit = self._inventory(
+            "i-fit", "t3.medium", 2, "4", "30.37", Decimal("50"), Decimal("50")
+        )
+
+    def _run(self):
+        recommendation = Recommendation.objects.create(user=self.user)
+        with mock.patch.object(
+            AuditService, "diagnose_user", wraps=AuditService.diagnose_user
+        ) as diagnose:
+            AuditTaskService.run(recommendation.pk)
+        recommendation.refresh_from_db()
+        return recommendation, diagnose.call_args.kwargs["inventory_ids"]
+
+    def test_unchanged_resources_are_carried_forward(self):
+        first, diagnosed = self._run()
+        self.assertCountEqual(diagnosed, [self.idle.pk, self.fit.pk])
+        self.assertEqual(AuditFingerprint.objects.filter(recommendation=first).count(), 2)
+
+        second, diagnosed = self._run()
+
+        self.assertEqual(diagnosed, [])
+        self.assertEqual(second.status, Recommendation.Status.COMPLETED)
+        self.assertEqual(
+            (second.total_current_cost, second.total_savings),
+            (first.total_current_cost, first.total_savings),
+        )
+        [item] = second.items.all()
+        self.assertEqual((item.inventory_id, item.savings_amount), (self.idle.pk, Decimal("79.42")))
+        self.assertEqual(first.items.count(), 1)
+        self.assertEqual(AuditFingerprint.objects.filter(recommendation=second).count(), 2)
+
+    def test_changed_resource_is_rediagnosed(self):
+        self._run()
+        UserInventory.objects.filter(pk=self.fit.pk).update(cpu_usage_avg=Decimal("10"))
+
+        recommendation, diagnosed = self._run()
+
+        self.assertEqual(diagnosed, [self.fit.pk])
+        # 바뀌지 않은 i-idle의 다운사이징 추천은 이어받음
+        self.assertEqual(
+            list(recommendation.items.values_list("inventory_id", flat=True)), [self.idle.pk]
+        )
+        self.assertEqual(recommendation.total_current_cost, Decimal("170.53"))
+
+    def test_peak_change_with_flat_average_is_rediagnosed(self):
+        now = timezone.now()
+        points = [
+            (self.fit.pk, "CPU", now - timedelta(hours=2, minutes=5 * i), 50.0) for i in range(20)
+        ]
+        UtilizationSketchService.update(points)
+        self._run()
+
+        # 평균(cpu_usage_avg)은 그대로 두고 최근 피크만 올라감
+        UtilizationSketchService.update(
+            [(self.fit.pk, "CPU", now - timedelta(minutes=5 * i), 95.0) for i in range(5)]
+        )
+        _, diagnosed = self._run()
+
+        self.assertEqual(diagnosed, [self.fit.pk])
+
+    def test_full_crawl_rediagnoses_everything(self):
+        self._run()
+
+        PriceCrawlerService.crawl_aws(source=str(OFFER_FIXTURE), regions=["us-east-1"])
+        _, diagnosed = self._run()
+
+        self.assertCountEqual(diagnosed, [self.idle.pk, self.fit.pk])
+
+    def test_rule_version_change_rediagnoses_everything(self):
+        self._run()
+
+        with mock.patch.object(AuditRuleEngine, "VERSION", AuditRuleEngine.VERSION + 1):
+            _, diagnosed = self._run()
+
+        self.assertCountEqual(diagnosed, [self.idle.pk, self.fit.pk])
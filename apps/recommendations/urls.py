@@ -1,3 +1,9 @@
 from django.urls import path
 
-urlpatterns = []
+from apps.recommendations.views import AuditCreateView, AuditStatusView, SavingsSummaryView
+
+urlpatterns = [
+    path("audits/", AuditCreateView.as_view(), name="audit-create"),
+    path("audits/<int:recommendation_id>/", AuditStatusView.as_view(), name="audit-status"),
+    path("summary/", SavingsSummaryView.as_view(), name="savings-summary"),
+]
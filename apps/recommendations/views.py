@@ -1,3 +1,44 @@
-from django.shortcuts import render
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from apps.recommendations.serializers import AuditStatusSerializer, SavingsSummarySerializer
+from apps.recommendations.services.audit_task_service import AuditTaskService
+from apps.recommendations.services.savings_summary_service import SavingsSummaryService
+
+
+class AuditCreateView(APIView):
+    """비용 진단 요청 뷰 (작업만 큐에 넣고 바로 202 응답)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        recommendation = AuditTaskService.enqueue(request.user)
+
+        return Response(
+            AuditStatusSerializer(recommendation).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class AuditStatusView(APIView):
+    """비용 진단 진행 상태 조회 뷰 (폴링용)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, recommendation_id):
+        recommendation = AuditTaskService.get_status(request.user, recommendation_id)
+
+        return Response(AuditStatusSerializer(recommendation).data, status=status.HTTP_200_OK)
+
+
+class SavingsSummaryView(APIView):
+    """사용자 비용/절감 요약 조회 뷰 (대시보드, 요약 테이블 1행 조회)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        summary = SavingsSummaryService.get(request.user)
+
+        return Response(SavingsSummarySerializer(summary).data, status=status.HTTP_200_OK)
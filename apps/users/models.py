@@ -3,6 +3,10 @@ from django.db import models
 
 from apps.core.choices import NormalizedRegion, Provider
 from apps.core.models import BaseModel
+from apps.core.utils.cache_helper import TwoTierCache
+
+# 사용자별 연동 provider 캐시 (apps.users.signals에서 invalidate)
+connected_providers_cache = TwoTierCache("connected_providers")
 
 
 class User(AbstractUser):
@@ -79,9 +83,12 @@ class User(AbstractUser):
 
     @property
     def connected_providers(self) -> list[str]:
-        """연동된 클라우드 제공자 목록"""
-        return list(
-            self.cloud_credentials.filter(is_active=True).values_list("provider", flat=True)
+        """연동된 클라우드 제공자 목록 (2단계 캐시, CloudCredential 변경 시 무효화)"""
+        return connected_providers_cache.get_or_set(
+            str(self.pk),
+            lambda: list(
+                self.cloud_credentials.filter(is_active=True).values_list("provider", flat=True)
+            ),
         )
 
 
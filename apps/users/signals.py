@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.users.models import CloudCredential, connected_providers_cache
+
+
+@receiver([post_save, post_delete], sender=CloudCredential)
+def invalidate_connected_providers(sender, **kwargs):
+    """자격 증명이 바뀌면 연동 provider 캐시 무효화"""
+    connected_providers_cache.invalidate()
@@ -90,16 +90,31 @@ DATABASES = {
     }
 }
 
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
-        "LOCATION": BASE_DIR / "cache",  # 루트에 cache 폴더 생성
-        "TIMEOUT": 3600,  # 1시간
-        "OPTIONS": {
-            "MAX_ENTRIES": 1000,
-        },
+# Redis 캐시 (REDIS_URL 미설정 시 로컬/CI용 프로세스 메모리 캐시)
+REDIS_URL = env("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "apps.core.utils.redis_cache.PooledRedisCache",
+            "LOCATION": REDIS_URL,
+            "TIMEOUT": 3600,  # 1시간
+            "KEY_PREFIX": "costcut",
+            "OPTIONS": {
+                "max_connections": env.int("REDIS_MAX_CONNECTIONS", default=50),
+                "socket_connect_timeout": 2,
+                "socket_timeout": 2,
+                "health_check_interval": 30,
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "TIMEOUT": 3600,
+        }
     }
-}
 
 
 Q_CLUSTER = {
@@ -119,7 +134,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
-    "EXCEPTION_HANDLER": "apps.core.handlers.exception_handler.custom_exception_handler",
+    "EXCEPTION_HANDLER": "apps.core.handlers.exception_handlers.custom_exception_handler",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
 }